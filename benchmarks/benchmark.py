@@ -0,0 +1,179 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, json, sys, platform, argparse, asyncio, os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local
+from bittrex_api import BittrexV1, BittrexV2, BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# Bump when the scenarios or the measurement change, results are only comparable within the same schema version
+SCHEMA_VERSION = 1
+
+API_KEY    = 'benchmark-key'
+API_SECRET = 'benchmark-secret'
+MARKET_V3  = 'C000-BTC'
+MARKET_V1  = 'BTC-C000'
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ----------------------------------------------------------- #
+
+def scenarios(server: MockBittrexServer) -> Dict[str, Callable]:
+    kwargs = {
+        'api_key': API_KEY,
+        'api_secret': API_SECRET,
+        'max_request_try_count': 1,
+        'sleep_time': 0,
+        'debug_level': 0
+    }
+    v1 = BittrexV1(base_url=server.base_url(1), **kwargs)
+    v2 = BittrexV2(base_url=server.base_url(2), **kwargs)
+    v3 = BittrexV3(base_url=server.base_url(3), reverse_market_names=False, **kwargs)
+
+    return {
+        'v1.public.get_ticker': lambda: v1.get_ticker(MARKET_V1),
+        'v1.signed.get_balances': lambda: v1.get_balances(),
+        'v2.public.get_market_summary': lambda: v2.get_market_summary(MARKET_V1),
+        'v3.public.get_ticker': lambda: v3.get_ticker(MARKET_V3),
+        'v3.public.get_market_summaries': lambda: v3.get_market_summaries(),
+        'v3.public.get_orderbook_500': lambda: v3.get_orderbook(MARKET_V3, depth=500),
+        'v3.signed.get_balances': lambda: v3.get_balances(),
+        'v3.signed.get_open_orders': lambda: v3.get_open_orders()
+    }
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0
+
+    return sorted_values[min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))]
+
+def summarize(latencies: List[float], failures: int, elapsed: float) -> Dict:
+    latencies = sorted(latencies)
+
+    return {
+        'requests': len(latencies),
+        'failures': failures,
+        'throughput_rps': len(latencies) / elapsed if elapsed else 0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': (latencies[-1] if latencies else 0) * 1000
+    }
+
+def timed(call: Callable, latencies: List[float]) -> bool:
+    start = time.perf_counter()
+    result = call()
+    latencies.append(time.perf_counter() - start)
+
+    return result is not None
+
+def run_threaded(call: Callable, count: int, concurrency: int) -> Dict:
+    latencies = []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(lambda _: timed(call, latencies), range(count)))
+        elapsed = time.perf_counter() - start
+
+    return summarize(latencies, results.count(False), elapsed)
+
+def run_asyncio(call: Callable, count: int, concurrency: int) -> Dict:
+    # The clients are blocking, so an asyncio application drives them through an executor. This measures that path.
+    latencies = []
+
+    async def main():
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one():
+            async with semaphore:
+                return await loop.run_in_executor(pool, timed, call, latencies)
+
+        return await asyncio.gather(*[one() for _ in range(count)])
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        loop = asyncio.new_event_loop()
+
+        try:
+            start = time.perf_counter()
+            results = loop.run_until_complete(main())
+            elapsed = time.perf_counter() - start
+        finally:
+            loop.close()
+
+    return summarize(latencies, list(results).count(False), elapsed)
+
+def run(
+    count: int = 500,
+    concurrency: List[int] = [1, 8],
+    modes: List[str] = ['threaded', 'asyncio'],
+    latency: float = 0,
+    warmup: int = 20,
+    only: List[str] = []
+) -> Dict:
+    runners = {'threaded': run_threaded, 'asyncio': run_asyncio}
+    results = []
+
+    with MockBittrexServer(api_keys={API_KEY: API_SECRET}, latency=latency, seed=0) as server:
+        for name, call in sorted(scenarios(server).items()):
+            if only and not any(o in name for o in only):
+                continue
+
+            for _ in range(warmup):
+                call()
+
+            for mode in modes:
+                for c in concurrency:
+                    result = runners[mode](call, count, c)
+                    result.update({'scenario': name, 'mode': mode, 'concurrency': c})
+                    results.append(result)
+
+                    print('{:<34} {:<9} c={:<3} {:>9.1f} req/s  p50 {:>7.2f} ms  p99 {:>7.2f} ms  failures {}'.format(
+                        name, mode, c, result['throughput_rps'], result['p50_ms'], result['p99_ms'], result['failures']
+                    ))
+
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {'count': count, 'concurrency': concurrency, 'modes': modes, 'latency': latency, 'warmup': warmup},
+        'results': results
+    }
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------------ Main --------------------------------------------------------------- #
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Throughput and latency of the clients against the local mock server')
+    parser.add_argument('--count', type=int, default=500, help='requests per scenario, mode and concurrency level')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--modes', nargs='+', default=['threaded', 'asyncio'], choices=['threaded', 'asyncio'])
+    parser.add_argument('--latency', type=float, default=0, help='seconds of simulated server latency')
+    parser.add_argument('--only', nargs='*', default=[], help='run only the scenarios containing one of these strings')
+    parser.add_argument('--output', help='write the results as json to this file')
+    args = parser.parse_args()
+
+    report = run(count=args.count, concurrency=args.concurrency, modes=args.modes, latency=args.latency, only=args.only)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
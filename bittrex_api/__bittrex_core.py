@@ -7,6 +7,17 @@ from typing import Optional, Union, List
 # Local
 from .utils.bittrex_requests import BittrexRequests
 from .utils.urls import Urls
+from .utils.tracing import Tracer
+from .utils.transport import Transport
+from .utils.timeouts import TimeoutPolicy
+from .utils.rate_limiter import RateLimiter
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.scheduler import PriorityScheduler
+from .utils.symbols import SymbolRegistry
+from .utils.validation import OrderValidator
+from .utils.proxy_pool import ProxyPool
+from .utils import crypto
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -26,19 +37,42 @@ class BittrexCore:
         max_request_try_count: int = 3,
         sleep_time: float = 7.5,
         debug_level: int = 1,
-        proxy: Optional[Union[List, str]] = None
+        proxy: Optional[Union[List, str, ProxyPool]] = None,
+        tracer: Optional[Tracer] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        raise_errors: bool = False,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+        symbols: Optional[SymbolRegistry] = None,
+        validate_orders: bool = False
     ):
+        self.nonces = crypto.nonce_source(api_key)
         self.url_utils = Urls(
-            base_url=self._base_url
+            base_url=base_url or self._base_url,
+            nonce_source=self.nonces
         )
         self.requests = BittrexRequests(
             max_request_try_count=max_request_try_count,
             sleep_time=sleep_time,
             debug_level=debug_level,
-            proxy=proxy
+            proxy=proxy,
+            tracer=tracer,
+            transport=transport,
+            raise_errors=raise_errors,
+            timeout_policy=timeout_policy,
+            rate_limiter=rate_limiter,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            scheduler=scheduler
         )
         self.api_key = api_key
         self.api_secret = api_secret
+        self.symbols = symbols or SymbolRegistry()
+        self.validator = OrderValidator(self.symbols) if validate_orders else None
 
     # ------------------------------------------------------ Private properties ------------------------------------------------------ #
 
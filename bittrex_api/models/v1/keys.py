@@ -20,6 +20,6 @@ class Keys(Enum):
     PAYMENT_ID  = 'paymentid'
 
     API_KEY     = 'apikey'
-    SIGNATURE   = 'signature'
+    SIGNATURE   = 'apisign'
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
\ No newline at end of file
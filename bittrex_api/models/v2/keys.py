@@ -23,7 +23,7 @@ class Keys(Enum):
     TARGET          = 'Target'
 
     API_KEY         = 'apikey'
-    SIGNATURE       = 'signature'
+    SIGNATURE       = 'apisign'
 
 
 # --------------------------------------------------------------------------------------------------------------------------------------- #
\ No newline at end of file
@@ -0,0 +1,73 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict, List
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: AccountSnapshot -------------------------------------------------------- #
+
+class AccountSnapshot:
+    __slots__ = (
+        'server_time', 'account', 'volume', 'balances', 'open_orders', 'open_conditional_orders', 'open_deposits', 'open_withdrawals',
+        'errors', 'seconds'
+    )
+
+    def __init__(
+        self,
+        server_time: Optional[int] = None,
+        account: Optional[Dict] = None,
+        volume: Optional[Dict] = None,
+        balances: Optional[List[Dict]] = None,
+        open_orders: Optional[List[Dict]] = None,
+        open_conditional_orders: Optional[List[Dict]] = None,
+        open_deposits: Optional[List[Dict]] = None,
+        open_withdrawals: Optional[List[Dict]] = None,
+        errors: Optional[Dict] = None,
+        seconds: float = 0
+    ):
+        """The state of an account, fetched at (about) the same time
+
+        Keyword Arguments:
+            server_time {Optional[int]} -- server time (ms) of the snapshot, None if the ping failed (default: {None})
+
+            account {Optional[Dict]} -- Account (default: {None})
+
+            volume {Optional[Dict]} -- AccountVolume, of the last 30 days (default: {None})
+
+            balances {Optional[List[Dict]]} -- Balances (default: {None})
+
+            open_orders {Optional[List[Dict]]} -- open Orders (default: {None})
+
+            open_conditional_orders {Optional[List[Dict]]} -- open ConditionalOrders (default: {None})
+
+            open_deposits {Optional[List[Dict]]} -- open Deposits (default: {None})
+
+            open_withdrawals {Optional[List[Dict]]} -- open Withdrawals (default: {None})
+
+            errors {Optional[Dict]} -- error of each part that could not be fetched, by field name (default: {None})
+
+            seconds {float} -- time it took (default: {0})
+        """
+
+        self.server_time = server_time
+        self.account = account
+        self.volume = volume
+        self.balances = balances
+        self.open_orders = open_orders
+        self.open_conditional_orders = open_conditional_orders
+        self.open_deposits = open_deposits
+        self.open_withdrawals = open_withdrawals
+        self.errors = errors or {}
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return 'AccountSnapshot(server_time={}, failed={})'.format(self.server_time, sorted(self.errors))
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,285 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading
+from decimal import Decimal
+from typing import Optional, Dict, List, Callable, Union
+
+# Local
+from .errors import BittrexError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: _BalanceSnapshot ------------------------------------------------------ #
+
+class _BalanceSnapshot:
+    __slots__ = ('balances', 'expires_at')
+
+    def __init__(self, balances: Dict[str, Dict], expires_at: float):
+        # Never changed once published, updates publish a new snapshot
+        self.balances = balances
+        self.expires_at = expires_at
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: BalanceCache --------------------------------------------------------- #
+
+class BalanceCache:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        loader: Optional[Callable[..., Optional[List[Dict]]]] = None,
+        ttl: float = 5
+    ):
+        """Account balances kept for 'ttl' seconds, so risk checks before every order do not cost a signed request each.
+        Reads take the current immutable snapshot without locking, only an expired one is reloaded (by a single thread).
+        Orders posted through the client take their cost off 'available' right away, cancels and conditional orders expire the snapshot,
+        and a reload (on expiry, or every 'interval' seconds after 'start') replaces every optimistic adjustment with the real balances.
+        A BittrexV3 client fills in its own balance request as missing loader.
+
+        Keyword Arguments:
+            loader {Optional[Callable[..., Optional[List[Dict]]]]} -- returns the v3 Balances, gets the 'deadline' of the read as a keyword if it has one (default: {None})
+
+            ttl {float} -- seconds a loaded snapshot is served (default: {5})
+        """
+
+        self.loader = loader
+        self.ttl = ttl
+
+        self.__snapshot = _BalanceSnapshot({}, 0)
+        self.__init_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+
+        for key in ['_BalanceCache__lock', '_BalanceCache__load_lock', '_BalanceCache__stop', '_BalanceCache__thread']:
+            del state[key]
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def balances(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
+        """The Balances, reloaded if expired
+
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds a reload may take, waiting for one in progress included (default: {None})
+
+        Returns:
+            Optional[List[Dict]] -- Balances (shared, do not modify them), None if they could not be loaded
+        """
+
+        snapshot = self.__fresh(deadline)
+
+        return list(snapshot.balances.values()) if snapshot is not None else None
+
+    def balance(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
+        """The Balance of 'currency', reloaded if expired
+
+        Arguments:
+            currency {str} -- currency symbol
+
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds a reload may take, waiting for one in progress included (default: {None})
+
+        Returns:
+            Optional[Dict] -- Balance (shared, do not modify it), None if unknown or not loadable
+        """
+
+        snapshot = self.__fresh(deadline)
+
+        return snapshot.balances.get(currency.upper()) if snapshot is not None else None
+
+    def available(self, currency: str) -> Optional[float]:
+        """Available balance of 'currency' (0 for a currency without a Balance), reloaded if expired
+
+        Arguments:
+            currency {str} -- currency symbol
+
+        Returns:
+            Optional[float] -- available balance, None if the balances could not be loaded
+        """
+
+        snapshot = self.__fresh()
+
+        if snapshot is None:
+            return None
+
+        balance = snapshot.balances.get(currency.upper())
+
+        return float(balance['available']) if balance is not None else 0.0
+
+    def cached_available(self, currency: str) -> Optional[float]:
+        """Available balance of 'currency' from the snapshot held, never waiting for a reload. Made to be an 'OrderValidator.available_balance',
+        so the checks before an order never block on the balances
+
+        Arguments:
+            currency {str} -- currency symbol
+
+        Returns:
+            Optional[float] -- available balance, None if the snapshot expired or was never loaded
+        """
+
+        snapshot = self.__snapshot
+
+        if time.monotonic() >= snapshot.expires_at:
+            return None
+
+        balance = snapshot.balances.get(currency.upper())
+
+        return float(balance['available']) if balance is not None else 0.0
+
+    def reload(self) -> bool:
+        """Loads the balances now
+
+        Returns:
+            bool -- False if there is no loader or it failed
+        """
+
+        with self.__load_lock:
+            return self.__reload()
+
+    def invalidate(self) -> None:
+        """Expires the snapshot, the next read reloads"""
+
+        with self.__lock:
+            self.__version += 1
+            self.__snapshot = _BalanceSnapshot(self.__snapshot.balances, 0)
+
+    def adjust(self, currency: str, available: Union[float, str, Decimal]) -> None:
+        """Changes the available balance of 'currency' until the next reload (eg. takes off the cost of a posted order)
+
+        Arguments:
+            currency {str} -- currency symbol
+
+            available {Union[float, str, Decimal]} -- change of the available balance (negative to take off)
+        """
+
+        with self.__lock:
+            self.__version += 1
+            snapshot = self.__snapshot
+            currency = currency.upper()
+            balance = snapshot.balances.get(currency)
+
+            if balance is None:
+                # Nothing to adjust, only a reload can tell what the balance is now
+                self.__snapshot = _BalanceSnapshot(snapshot.balances, 0)
+
+                return
+
+            balances = dict(snapshot.balances)
+            balances[currency] = dict(balance, available=self.__add(balance['available'], available))
+            self.__snapshot = _BalanceSnapshot(balances, snapshot.expires_at)
+
+    def start(self, interval: float = 60) -> None:
+        """Reconciles with the real balances every 'interval' seconds on a daemon thread
+
+        Keyword Arguments:
+            interval {float} -- seconds between reloads (default: {60})
+        """
+
+        if self.__thread is not None:
+            return
+
+        # A stop event of its own, so a thread stopped a moment ago (maybe still reloading) ends instead of reloading next to this one
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, args=(interval, self.__stop), daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the background reloads, waiting for a reload in progress
+
+        Keyword Arguments:
+            timeout {Optional[float]} -- seconds to wait for the thread at most, None for no limit (default: {None})
+        """
+
+        thread = self.__thread
+        self.__stop.set()
+        self.__thread = None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__lock = threading.Lock()
+        self.__load_lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__version = 0
+
+    def __fresh(self, deadline: Optional[float] = None) -> Optional[_BalanceSnapshot]:
+        snapshot = self.__snapshot
+
+        if time.monotonic() < snapshot.expires_at:
+            return snapshot
+
+        start = time.monotonic()
+
+        # One thread reloads, the others wait for its snapshot (as long as their deadline lets them)
+        if not self.__load_lock.acquire(timeout=deadline if deadline is not None else -1):
+            return None
+
+        try:
+            if time.monotonic() < self.__snapshot.expires_at:
+                return self.__snapshot
+
+            remaining = max(deadline - (time.monotonic() - start), 0) if deadline is not None else None
+
+            return self.__snapshot if self.__reload(remaining) else None
+        finally:
+            self.__load_lock.release()
+
+    def __reload(self, deadline: Optional[float] = None) -> bool:
+        if self.loader is None:
+            return False
+
+        version = self.__version
+
+        try:
+            # Loaders without a deadline keep working as long as none is given
+            balances = self.loader(deadline=deadline) if deadline is not None else self.loader()
+        except BittrexError:
+            return False
+
+        if balances is None:
+            return False
+
+        with self.__lock:
+            # An order posted while loading may or may not be in the response, so that snapshot is served once but reloaded on the next read
+            expires_at = time.monotonic() + self.ttl if version == self.__version else 0
+            self.__snapshot = _BalanceSnapshot({balance['currencySymbol'].upper():balance for balance in balances}, expires_at)
+
+        return True
+
+    def __run(self, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            self.reload()
+
+    @staticmethod
+    def __add(value: Union[float, str], change: Union[float, str, Decimal]) -> Union[float, str]:
+        # Decimal strings stay exact strings
+        if isinstance(value, str):
+            return format(Decimal(value) + Decimal(str(change)), 'f')
+
+        return float(value) + float(change)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,147 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading
+from typing import Optional, Dict, List, Any, Callable
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: _Batch ------------------------------------------------------------ #
+
+class _Batch:
+    __slots__ = ('size', 'done', 'bulk', 'rows', 'error')
+
+    def __init__(self):
+        self.size = 0
+        self.done = threading.Event()
+        self.bulk = False
+        self.rows = None
+        self.error = None
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: Batcher ----------------------------------------------------------- #
+
+class Batcher:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        window: float = 0.02,
+        min_batch: int = 3
+    ):
+        """Opt-in planner folding single-item calls made at about the same time into one bulk call (eg. get_ticker into get_tickers).
+        The first call of a kind waits 'window' seconds for others. If at least 'min_batch' calls came together, one bulk call answers all of them,
+        otherwise every caller sends its own request. Items the bulk response has no row for are requested on their own.
+
+        Keyword Arguments:
+            window {float} -- seconds the first call waits for others, added to the latency of every batched call (default: {0.02})
+
+            min_batch {int} -- calls needed for a bulk request (default: {3})
+        """
+
+        self.window = window
+        self.min_batch = min_batch
+
+        self.__init_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {k:v for k, v in self.__dict__.items() if not k.startswith('_Batcher__')}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def call(
+        self,
+        kind: str,
+        single: Callable[[], Any],
+        bulk: Callable[[], Optional[List]],
+        select: Callable[[List], Any],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Answers a single-item call, from a bulk call if enough of its kind come together
+
+        Arguments:
+            kind {str} -- calls of the same kind share the bulk call (eg. 'v3/tickers')
+
+            single {Callable[[], Any]} -- sends the call on its own
+
+            bulk {Callable[[], Optional[List]]} -- sends the bulk call, None on failure
+
+            select {Callable[[List], Any]} -- the row of the item in the bulk response, None if it has none
+
+        Keyword Arguments:
+            timeout {Optional[float]} -- seconds a call joining a batch waits for the bulk call, it is sent on its own after (default: {None})
+
+        Raises:
+            BaseException -- what the bulk call raised, to every call of the batch
+
+        Returns:
+            Any -- the answer, None if the bulk call returned None
+        """
+
+        with self.__lock:
+            batch = self.__batches.get(kind)
+            leader = batch is None
+
+            if leader:
+                batch = _Batch()
+                self.__batches[kind] = batch
+
+            batch.size += 1
+
+        if leader:
+            time.sleep(self.window)
+
+            # Later calls start a new batch
+            with self.__lock:
+                del self.__batches[kind]
+
+            if batch.size >= self.min_batch:
+                batch.bulk = True
+
+                try:
+                    batch.rows = bulk()
+                except BaseException as e:
+                    batch.error = e
+
+            batch.done.set()
+        elif not batch.done.wait(timeout):
+            # The bulk call runs on the budget of the first call, a caller with less time left does not wait for it
+            return single()
+
+        if not batch.bulk:
+            return single()
+
+        if batch.error is not None:
+            raise batch.error
+
+        if batch.rows is None:
+            return None
+
+        row = select(batch.rows)
+
+        return row if row is not None else single()
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__lock = threading.Lock()
+        self.__batches = {}
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
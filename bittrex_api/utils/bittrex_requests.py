@@ -2,9 +2,21 @@
 
 # System
 from enum import Enum
-import time, hashlib, requests, hmac, os, json, copy
-from typing import Optional, Dict, List, Union, Any, Tuple
+from contextlib import contextmanager
+import time, hashlib, requests, hmac, os, json, copy, threading
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from typing import Optional, Dict, List, Union, Any, Tuple, Callable, Iterator
 from .strings import to_string
+from .tracing import Tracer, Trace
+from .transport import Transport, HTTPTransport
+from .errors import BittrexError, NetworkError, RequestTimeoutError, ServerError, ResponseFormatError, DeadlineExceededError, CircuitOpenError, error_for_response, api_error
+from .deadline import Deadline
+from .timeouts import TimeoutPolicy
+from .rate_limiter import RateLimiter
+from .hedging import HedgePolicy
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .proxy_pool import ProxyPool
+from .scheduler import PriorityScheduler, Priority
 
 # --------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -31,8 +43,8 @@ class RequestMethod(Enum):
 # -------------------------------------------------------- class: BittrexRequests ------------------------------------------------------- #
 
 class BittrexRequests:
-    __USAGE_INTERVAL         = 60
-    __MAX_USAGE_PER_INTERVAL = 20
+    # Statuses meaning the proxy itself failed (auth required, bad gateway, gateway timeout)
+    __PROXY_ERROR_STATUS_CODES = [407, 502, 504]
 
     # ------------------------------------------------------------- Init ------------------------------------------------------------ #
 
@@ -41,82 +53,292 @@ class BittrexRequests:
         max_request_try_count: int = 3,
         sleep_time: float = 7.5,
         debug_level: int = 1,
-        proxy: Optional[Union[List, str]] = None
+        proxy: Optional[Union[List, str, ProxyPool]] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[Transport] = None,
+        raise_errors: bool = False,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[PriorityScheduler] = None
     ):
         self.max_try_count = max_request_try_count
-        self.sleep_time = max_request_try_count
+        self.sleep_time = sleep_time
+        self.raise_errors = raise_errors
+        self.timeout_policy = timeout_policy or TimeoutPolicy()
+        self.rate_limiter = rate_limiter
+        self.hedge_policy = hedge_policy
+        self.circuit_breaker = circuit_breaker
+        self.scheduler = scheduler
         self.debug_level = debug_level
+        self.tracer = tracer or Tracer()
+        self.transport = transport or HTTPTransport()
 
-        if type(proxy) == str:
-            proxy = [proxy]
+        self.proxy_pool = proxy if isinstance(proxy, ProxyPool) or not proxy else ProxyPool(proxy)
+        self.error_listeners = []
+        self.__local = threading.local()
 
-        self.proxies = proxy
-        self.proxy_history = {}
+        if circuit_breaker is not None:
+            circuit_breaker.add_listener(self._on_circuit_state_change)
 
 
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_BittrexRequests__local']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__local = threading.local()
+
+
+    # ------------------------------------------------------- Public properties ----------------------------------------------------- #
+
+    @property
+    def last_error(self) -> Optional[BittrexError]:
+        """The error of the last failed request of the calling thread, None if its last request succeeded"""
+
+        return getattr(self.__local, 'last_error', None)
+
     # -------------------------------------------------------- Public methods ------------------------------------------------------- #
 
+    def add_error_listener(self, listener: Callable[[int, Optional[str]], None]) -> None:
+        """Registers a callback for error responses. Listeners run on the requesting thread, so they should return quickly.
+
+        Arguments:
+            listener {Callable[[int, Optional[str]], None]} -- called with the http status code and the error code of the body (if any)
+        """
+
+        self.error_listeners = self.error_listeners + [listener]
+
+    def fail(self, error: BittrexError, raise_errors: Optional[bool] = None) -> None:
+        """Fails a call without sending a request (eg. an order rejected by the pre-flight checks) the way a failed request does
+
+        Arguments:
+            error {BittrexError} -- the error
+
+        Keyword Arguments:
+            raise_errors {Optional[bool]} -- overrides 'raise_errors' for this call (default: {None})
+
+        Raises:
+            BittrexError -- 'error', if raising errors
+        """
+
+        self.__local.last_error = error
+
+        if self.raise_errors if raise_errors is None else raise_errors:
+            raise error
+
+    @contextmanager
+    def tries(self, max_try_count: int) -> Iterator[None]:
+        """Limits the tries of every request the calling thread sends inside the block (eg. 1 for best-effort lookups that must not sleep between retries)
+
+        Arguments:
+            max_try_count {int} -- tries per request
+        """
+
+        previous = getattr(self.__local, 'max_try_count', None)
+        self.__local.max_try_count = max_try_count
+
+        try:
+            yield
+        finally:
+            self.__local.max_try_count = previous
+
     def request(
         self,
         url: str,
         method: RequestMethod,
         params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        headers: Optional[Union[Dict, Callable[[], Dict]]] = None,
         data: Optional[Dict] = None,
         needed_values: Optional[Dict] = None,
         unwanted_values: Optional[Dict] = None,
-        path: Optional[List] = None
+        path: Optional[List] = None,
+        trace: Optional[Trace] = None,
+        max_try_count: Optional[int] = None,
+        raise_errors: Optional[bool] = None,
+        reconcile: Optional[Callable[[BittrexError], Optional[JSONData]]] = None,
+        deadline: Optional[Deadline] = None,
+        hedge: Optional[str] = None,
+        group: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        priority: Priority = Priority.MARKET_DATA
     ) -> Optional[JSONData]:
-        current_try_count = 0
-
-        while current_try_count < self.max_try_count:
-            current_try_count += 1
-
-            j = self.__sub_json(
-                self.__request(
-                    url,
-                    method,
-                    params=params,
-                    headers=headers,
-                    json_data=data
-                ),
-                needed_values=needed_values,
-                unwanted_values=unwanted_values,
-                path=path
-            )
+        """Sends the request, retrying transient failures (network errors, timeouts, 5xx, 429) only
 
-            if j is not None:
-                return j
+        Keyword Arguments:
+            max_try_count {Optional[int]} -- overrides 'max_try_count' for this call (default: {None})
 
-            time.sleep(self.sleep_time)
+            raise_errors {Optional[bool]} -- overrides 'raise_errors' for this call (default: {None})
 
-        return None
+            reconcile {Optional[Callable[[BittrexError], Optional[JSONData]]]} -- called after every failed attempt, a non-None result is returned as the response (eg. the order an ambiguous create request did place) (default: {None})
 
+            deadline {Optional[Deadline]} -- covers every attempt and wait, the call fails as soon as what is left can not cover another attempt (default: {None})
 
-    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+            hedge {Optional[str]} -- latency key of a public GET that may be hedged (see HedgePolicy), never pass it for signed requests (default: {None})
+
+            group {Optional[str]} -- endpoint group (eg. 'v3/orders') the circuit breaker tracks the request under (default: {None})
+
+            rate_limiter {Optional[RateLimiter]} -- overrides 'rate_limiter' for this call (eg. the budget of the api key signing it) (default: {None})
+
+            priority {Priority} -- class of the request for the scheduler (default: {Priority.MARKET_DATA})
+
+        Raises:
+            BittrexError -- the last error, if raising errors
+
+        Returns:
+            Optional[JSONData] -- the response (at 'path'), None on failure if not raising errors ('last_error' tells why)
+        """
+
+        owns_trace = trace is None
+        max_try_count = max_try_count or getattr(self.__local, 'max_try_count', None) or self.max_try_count
+        raise_errors = self.raise_errors if raise_errors is None else raise_errors
+
+        if owns_trace:
+            trace = self.tracer.trace(method.value)
+
+        if self.scheduler is not None:
+            trace.tag(priority=priority.name)
+
+        try:
+            current_try_count = 0
+            error = None
+
+            while current_try_count < max_try_count:
+                breaker = self.circuit_breaker if group is not None else None
+
+                # An open circuit fails before the call takes any rate budget or scheduler slot
+                if breaker is not None and not breaker.allow(group):
+                    error = CircuitOpenError('Circuit open: ' + group, group=group, retry_after=breaker.retry_after(group))
+
+                    break
+
+                if not self.__can_attempt(deadline) or not self.__acquire(deadline, trace, rate_limiter or self.rate_limiter, priority):
+                    if breaker is not None:
+                        breaker.release(group)
+
+                    error = DeadlineExceededError('Deadline exceeded', last_error=error)
+
+                    break
+
+                current_try_count += 1
+
+                try:
+                    with trace.span('attempt'):
+                        j = self.__request(
+                            url,
+                            method,
+                            params=params,
+                            headers=headers() if callable(headers) else headers,
+                            json_data=data,
+                            timeout=self.__timeout(method, url, deadline),
+                            hedge=hedge,
+                            trace=trace
+                        )
+
+                        with trace.span('sub_json'):
+                            j = self.__sub_json(
+                                j,
+                                needed_values=needed_values,
+                                unwanted_values=unwanted_values,
+                                path=path
+                            )
+
+                    if breaker is not None:
+                        breaker.record(group, True)
+
+                    trace.tag(try_count=current_try_count)
+                    self.__local.last_error = None
+
+                    return j
+                except BittrexError as e:
+                    error = e
+
+                    if breaker is not None:
+                        # Only an outage counts against the circuit, any answer of a healthy server (even an error) is a success
+                        breaker.record(group, not isinstance(e, (NetworkError, ServerError)))
+                except BaseException:
+                    # Not an outage (eg. a failing transport or listener), but the probe slot has to be released
+                    if breaker is not None:
+                        breaker.record(group, True)
+
+                    raise
+
+                if reconcile is not None:
+                    with trace.span('reconcile'):
+                        j = reconcile(error)
+
+                    if j is not None:
+                        trace.tag(try_count=current_try_count, reconciled=True)
+                        self.__local.last_error = None
+
+                        return j
+
+                if not error.retryable or current_try_count >= max_try_count:
+                    break
+
+                sleep_time = max(self.sleep_time, getattr(error, 'retry_after', None) or 0)
+
+                # Fail now instead of sleeping into a deadline that leaves no time for the next attempt
+                if not self.__can_attempt(deadline, after=sleep_time):
+                    error = DeadlineExceededError('Deadline exceeded', last_error=error)
+
+                    break
+
+                with trace.span('retry_sleep'):
+                    time.sleep(sleep_time)
+
+            trace.tag(try_count=current_try_count, error=type(error).__name__, error_code=error.code)
+            self.__local.last_error = error
+
+            if raise_errors:
+                raise error
 
-    def __get_proxy(self) -> Optional[str]:
-        if not self.proxies:
             return None
+        finally:
+            if owns_trace:
+                trace.finish()
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __get_proxy(self, exclude: Optional[str] = None) -> Optional[str]:
+        return self.proxy_pool.acquire(exclude=exclude) if self.proxy_pool is not None else None
+
+    def _on_circuit_state_change(self, group: str, previous: CircuitState, state: CircuitState) -> None:
+        if self.debug_level >= 1 and state != CircuitState.HALF_OPEN:
+            print('Circuit', group, state.value)
+
+        self.tracer.event('circuit_state_change', group=group, previous=previous.value, state=state.value)
 
-        self.__normalize_proxy_history()
+    def __acquire(self, deadline: Optional[Deadline], trace: Trace, rate_limiter: Optional[RateLimiter], priority: Priority) -> bool:
+        if self.scheduler is not None:
+            with trace.span('schedule'):
+                if not self.scheduler.acquire(priority, deadline, min_time_left=self.timeout_policy.min_attempt_time):
+                    return False
 
-        for proxy in self.proxies:
-            self.proxy_history[proxy] = self.proxy_history[proxy] if proxy in self.proxy_history else []
+        if rate_limiter is None:
+            return True
 
-            if len(self.proxy_history[proxy]) < self.__MAX_USAGE_PER_INTERVAL:
-                return proxy.lstrip('https://').lstrip('http://').lstrip('ftp://')
+        with trace.span('rate_limit'):
+            return rate_limiter.acquire(deadline, min_time_left=self.timeout_policy.min_attempt_time)
 
-        return None
+    def __can_attempt(self, deadline: Optional[Deadline], after: float = 0) -> bool:
+        return deadline is None or deadline.remaining() - after >= self.timeout_policy.min_attempt_time
 
-    def __normalize_proxy_history(self) -> None:
-        now = int(time.time())
+    def __timeout(self, method: RequestMethod, url: str, deadline: Optional[Deadline]) -> Tuple[float, float]:
+        connect, read = self.timeout_policy.timeout(method.value, url)
 
-        for proxy in list(self.proxy_history.keys()):
-            if len(self.proxy_history[proxy]) < self.__MAX_USAGE_PER_INTERVAL:
-                continue
+        if deadline is not None:
+            remaining = deadline.remaining()
+            connect, read = min(connect, remaining), min(read, remaining)
 
-            self.proxy_history[proxy] = [ts for ts in self.proxy_history[proxy] if now - ts < self.__USAGE_INTERVAL]
+        return connect, read
 
     def __request(
         self,
@@ -124,59 +346,208 @@ class BittrexRequests:
         method: RequestMethod,
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
-        json_data: Optional[Dict] = None
-    ) -> Optional[JSONData]:
+        json_data: Optional[Dict] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+        hedge: Optional[str] = None,
+        trace: Optional[Trace] = None
+    ) -> JSONData:
         if self.debug_level >= 3:
             print(url)
 
         if params:
             params = {to_string(k):to_string(v) for k, v in params.items() if v}
 
+        json_data = json_data if method != RequestMethod.GET else None
+
+        # Only unsigned GETs are marked as hedgeable, the method check is a last line of defence for mutating calls
+        if method != RequestMethod.GET or self.hedge_policy is None:
+            hedge = None
+
         try:
-            proxy = self.__get_proxy()
-            proxies = {
-                'http':  'http://{}'.format(proxy),
-                'https': 'https://{}'.format(proxy),
-                'ftp':   'ftp://{}'.format(proxy)
-            } if proxy else None
+            with trace.span('connection'):
+                proxy = self.__get_proxy()
+
+            with trace.span('network'):
+                start = time.perf_counter()
+                hedge_delay = self.hedge_policy.delay(hedge) if hedge is not None else None
+
+                if hedge_delay is None:
+                    resp = self.__send(method, url, params, headers, json_data, timeout, proxy)
+                else:
+                    resp = self.__send_hedged(hedge, hedge_delay, method, url, params, headers, json_data, timeout, proxy, trace)
+
+                # A hedged request records the latency of its primary itself
+                if hedge is not None and hedge_delay is None:
+                    self.hedge_policy.record(hedge, time.perf_counter() - start)
+        except requests.exceptions.Timeout as e:
+            if self.debug_level >= 1:
+                print(e)
 
-            if proxy:
-                self.proxy_history[proxy] = self.proxy_history[proxy] if proxy in self.proxy_history else []
-                self.proxy_history[proxy].append(int(time.time()))
+            raise RequestTimeoutError(str(e))
+        except requests.exceptions.RequestException as e:
+            if self.debug_level >= 1:
+                print(e)
 
-            if method == RequestMethod.GET:
-                resp = requests.get(url, params=params, headers=headers, proxies=proxies)
-            elif method == RequestMethod.POST:
-                resp = requests.post(url, json=json_data, params=params, headers=headers, proxies=proxies)
-            else:#elif method == RequestMethod.DELETE:
-                resp = requests.delete(url, json=json_data, params=params, headers=headers, proxies=proxies)
+            raise NetworkError(str(e))
 
-            if resp is None:
-                if self.debug_level >= 1:
-                    print('Response is None')
-            elif resp.status_code not in [200, 201]:
-                if self.debug_level >= 1:
-                    print(resp.status_code, resp.text)
+        if resp is None:
+            if self.debug_level >= 1:
+                print('Response is None')
 
-                return None
+            raise NetworkError('Response is None')
 
-            return resp.json()
-        except requests.exceptions.RequestException as e:
+        trace.tag(status_code=resp.status_code)
+
+        if resp.status_code not in [200, 201]:
+            if self.debug_level >= 1:
+                print(resp.status_code, resp.text)
+
+            body = self.__json_or_none(resp)
+            code = body.get('code') if isinstance(body, dict) else None
+
+            for listener in self.error_listeners:
+                listener(resp.status_code, code)
+
+            raise error_for_response(
+                resp.status_code,
+                code=code,
+                message=resp.text,
+                body=body,
+                retry_after=self.__retry_after(resp)
+            )
+
+        try:
+            with trace.span('json_decode'):
+                return resp.json()
+        except ValueError as e:
             if self.debug_level >= 1:
                 print(e)
 
+            # Most likely a body cut short, so worth another try
+            raise ResponseFormatError(str(e), status_code=resp.status_code, retryable=True, ambiguous=True)
+
+    def __send(
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        json_data: Optional[Dict],
+        timeout: Optional[Tuple[float, float]],
+        proxy: Optional[str]
+    ) -> Any:
+        start = time.perf_counter()
+
+        try:
+            resp = self.transport.send(
+                method.value,
+                url,
+                params=params,
+                headers=headers,
+                json_data=json_data,
+                proxies={
+                    'http':  'http://{}'.format(proxy),
+                    'https': 'https://{}'.format(proxy),
+                    'ftp':   'ftp://{}'.format(proxy)
+                } if proxy else None,
+                timeout=timeout
+            )
+        except requests.exceptions.RequestException:
+            if proxy:
+                self.proxy_pool.record(proxy, time.perf_counter() - start, False)
+
+            raise
+
+        if proxy:
+            self.proxy_pool.record(proxy, time.perf_counter() - start, resp is not None and resp.status_code not in self.__PROXY_ERROR_STATUS_CODES)
+
+        return resp
+
+    def __send_hedged(
+        self,
+        hedge: str,
+        delay: float,
+        method: RequestMethod,
+        url: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        json_data: Optional[Dict],
+        timeout: Optional[Tuple[float, float]],
+        proxy: Optional[str],
+        trace: Trace
+    ) -> Any:
+        executor = self.hedge_policy.executor()
+        start = time.perf_counter()
+        primary = executor.submit(self.__send, method, url, params, headers, json_data, timeout, proxy)
+
+        def record(f: Future) -> None:
+            # The latency of the primary, even when the duplicate wins: only recording winners would pull the percentile
+            # (so the delay) down, hedging more and more often
+            if not f.cancelled() and f.exception() is None:
+                self.hedge_policy.record(hedge, time.perf_counter() - start)
+
+        primary.add_done_callback(record)
+
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+
+        # The duplicate counts against the rate limit, without a free token there is no hedge
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return primary.result()
+
+        # and it only gets leftover budget
+        if self.scheduler is not None and not self.scheduler.try_acquire(Priority.BULK):
+            return primary.result()
+
+        hedged = executor.submit(self.__send, method, url, params, headers, json_data, timeout, self.__get_proxy(exclude=proxy))
+        trace.tag(hedged=True)
+        pending = {primary, hedged}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        self.__discard(loser)
+
+                    trace.tag(hedge_won=future is hedged)
+
+                    return future.result()
+
+        return primary.result()
+
+    @staticmethod
+    def __discard(future: Future) -> None:
+        # A request already on the wire can not be aborted, its connection is released once it answers
+        def close(f: Future) -> None:
+            if f.exception() is None and hasattr(f.result(), 'close'):
+                f.result().close()
+
+        if not future.cancel():
+            future.add_done_callback(close)
+
+    @staticmethod
+    def __json_or_none(resp: Any) -> Optional[JSONData]:
+        try:
+            return resp.json()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def __retry_after(resp: Any) -> Optional[float]:
+        try:
+            return float(resp.headers.get('Retry-After'))
+        except (TypeError, ValueError):
             return None
 
     def __sub_json(
         self,
-        j: Optional[JSONData],
+        j: JSONData,
         needed_values: Optional[Dict],
         unwanted_values: Optional[Dict],
         path: Optional[List]
-    ) -> Optional[JSONData]:
-        if j is None:
-            return None
-
+    ) -> JSONData:
         if needed_values is not None:
             for k, v in needed_values.items():
                 if k not in j:
@@ -186,16 +557,7 @@ class BittrexRequests:
                     if self.debug_level >= 2:
                         print(json.dumps(j, indent=4))
 
-                    return None
-
-                # if j[k] is None:
-                #     if self.debug_level >= 1:
-                #         print(k, 'is None')
-
-                #     if self.debug_level >= 2:
-                #         print(json.dumps(j, indent=4))
-
-                #     return None
+                    raise ResponseFormatError('\'{}\' not found in response'.format(k), body=j)
 
                 if v is not None and j[k] != v:
                     if self.debug_level >= 1:
@@ -204,7 +566,11 @@ class BittrexRequests:
                     if self.debug_level >= 2:
                         print(json.dumps(j, indent=4))
 
-                    return None
+                    # v1/v2 report failures as 'success': false with the error code in 'message'
+                    if k == 'success':
+                        raise api_error(j.get('message'), body=j)
+
+                    raise ResponseFormatError('\'{}\' is not {}'.format(k, v), body=j)
 
         if unwanted_values is not None:
             for value in unwanted_values:
@@ -215,12 +581,15 @@ class BittrexRequests:
                     if self.debug_level >= 2:
                         print(json.dumps(j, indent=4))
 
-                    return None
+                    if value == 'code':
+                        raise api_error(j['code'], body=j)
+
+                    raise ResponseFormatError('found unwanted value \'{}\' in response'.format(value), body=j)
 
         if path is None:
             return j
 
-        full_j = copy.deepcopy(j)
+        full_j = j
 
         try:
             for k in path:
@@ -232,7 +601,7 @@ class BittrexRequests:
             if self.debug_level >= 2:
                 print(json.dumps(full_j, indent=4))
 
-            return None
+            raise ResponseFormatError(str(e), body=full_j)
 
         return j
 
@@ -0,0 +1,370 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, json, gzip, threading, os
+from collections import deque
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Optional, Dict, List, Tuple, Any, Callable
+
+# Pip
+from requests.structures import CaseInsensitiveDict
+
+# Local
+from .transport import Transport, HTTPTransport
+from .errors import CassetteMissError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# Never written to a cassette
+REDACTED_QUERY_KEYS = ['apikey', 'nonce']
+
+# Left out of the keys, they are random for every order (so a replayed order matches its recording)
+REDACTED_BODY_KEYS  = ['clientOrderId', 'clientConditionalOrderId']
+# Http header names are case-insensitive, matched lower-cased
+KEPT_HEADERS        = ['Content-Type', 'Retry-After']
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: CassetteResponse ------------------------------------------------------- #
+
+class CassetteResponse:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        status_code: int,
+        text: str,
+        headers: Optional[Dict] = None
+    ):
+        self.status_code = status_code
+        self.text = text
+        # Read like the headers of a live response (eg. 'Retry-After' recorded as 'retry-after')
+        self.headers = CaseInsensitiveDict(headers or {})
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: JsonRedactor --------------------------------------------------------- #
+
+class JsonRedactor:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        keys: List[str],
+        replacement: str = 'REDACTED'
+    ):
+        """Redaction hook of a RecordingTransport replacing the values of 'keys' anywhere in json bodies. Bodies that are not json are recorded as they are.
+
+        Arguments:
+            keys {List[str]} -- keys whose values are replaced (eg. ['accountId', 'cryptoAddress'])
+
+        Keyword Arguments:
+            replacement {str} -- recorded instead of the values (default: {'REDACTED'})
+        """
+
+        self.keys = keys
+        self.replacement = replacement
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def __call__(self, text: str) -> str:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return text
+
+        return json.dumps(self.__redacted(data))
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __redacted(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {k:(self.replacement if k in self.keys else self.__redacted(v)) for k, v in data.items()}
+
+        if isinstance(data, list):
+            return [self.__redacted(v) for v in data]
+
+        return data
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: Cassette ----------------------------------------------------------- #
+
+class Cassette:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(self, path: str):
+        """Gzip compressed json lines file of recorded request/response pairs. Secrets (keys, signatures, nonces) are never stored.
+
+        Arguments:
+            path {str} -- path of the cassette file
+        """
+
+        self.path = path
+        self.records = []
+        self.__lock = threading.Lock()
+
+        if os.path.exists(path):
+            with gzip.open(path, 'rt') as f:
+                self.records = [json.loads(line) for line in f if line.strip()]
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_Cassette__lock']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Dict] = None, json_data: Optional[Any] = None) -> str:
+        """Redacted, order independent key of a request
+
+        Arguments:
+            method {str} -- http method
+
+            url {str} -- url including the query
+
+        Keyword Arguments:
+            params {Optional[Dict]} -- extra query parameters (default: {None})
+
+            json_data {Optional[Any]} -- json body (default: {None})
+
+        Returns:
+            str -- the key
+        """
+
+        split = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(split.query) if k.lower() not in REDACTED_QUERY_KEYS]
+        query += [(str(k), str(v)) for k, v in (params or {}).items() if str(k).lower() not in REDACTED_QUERY_KEYS]
+        url = urlunsplit(('', '', split.path, urlencode(sorted(query)), ''))
+
+        return ' '.join([method, url, json.dumps(Cassette.__redacted(json_data), sort_keys=True) if json_data is not None else ''])
+
+    def append(
+        self,
+        key: str,
+        status_code: int,
+        text: str,
+        headers: Dict,
+        elapsed: float
+    ) -> None:
+        kept = [name.lower() for name in KEPT_HEADERS]
+
+        with self.__lock:
+            self.records.append({
+                'key': key,
+                'status_code': status_code,
+                'headers': {k:v for k, v in headers.items() if k.lower() in kept},
+                'text': text,
+                'elapsed': elapsed
+            })
+
+    def save(self) -> None:
+        with self.__lock:
+            with gzip.open(self.path, 'wt') as f:
+                for record in self.records:
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    @classmethod
+    def __redacted(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {k:('*' if k in REDACTED_BODY_KEYS else cls.__redacted(v)) for k, v in data.items()}
+
+        if isinstance(data, list):
+            return [cls.__redacted(v) for v in data]
+
+        return data
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------- class: RecordingTransport ------------------------------------------------------- #
+
+class RecordingTransport(Transport):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        path: str,
+        transport: Optional[Transport] = None,
+        redact: Optional[Callable[[str], str]] = None
+    ):
+        """Sends requests through 'transport' and records every response to the cassette at 'path'. Call 'save' (or use it as a context manager) to write the file.
+        Response bodies are recorded as they came (account ids, addresses...) unless 'redact' rewrites them (eg. a JsonRedactor).
+
+        Arguments:
+            path {str} -- path of the cassette file
+
+        Keyword Arguments:
+            transport {Optional[Transport]} -- transport doing the actual requests (default: {HTTPTransport()})
+
+            redact {Optional[Callable[[str], str]]} -- returns the body to record from the body received, the caller still gets the original (default: {None})
+        """
+
+        self.cassette = Cassette(path)
+        self.transport = transport or HTTPTransport()
+        self.redact = redact
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        json_data: Optional[Any] = None,
+        proxies: Optional[Dict] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ) -> Any:
+        start = time.perf_counter()
+        resp = self.transport.send(method, url, params=params, headers=headers, json_data=json_data, proxies=proxies, timeout=timeout)
+
+        if resp is not None:
+            self.cassette.append(
+                Cassette.key(method, url, params=params, json_data=json_data),
+                resp.status_code,
+                self.redact(resp.text) if self.redact is not None else resp.text,
+                dict(resp.headers),
+                time.perf_counter() - start
+            )
+
+        return resp
+
+    def save(self) -> None:
+        self.cassette.save()
+
+    def __enter__(self) -> 'RecordingTransport':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.save()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: ReplayTransport -------------------------------------------------------- #
+
+class ReplayTransport(Transport):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        path: str,
+        realtime: bool = False,
+        loop: bool = True
+    ):
+        """Answers requests from a cassette without any network access
+
+        Arguments:
+            path {str} -- path of the cassette file
+
+        Keyword Arguments:
+            realtime {bool} -- wait the recorded time before answering, instead of answering at full speed (default: {False})
+
+            loop {bool} -- start over once the responses recorded for a request are used up, instead of failing (default: {True})
+        """
+
+        self.realtime = realtime
+        self.loop = loop
+        self.__lock = threading.Lock()
+        self.__recorded = {}
+        self.__queues = {}
+
+        for record in Cassette(path).records:
+            response = (CassetteResponse(record['status_code'], record['text'], record['headers']), record['elapsed'])
+            self.__recorded.setdefault(record['key'], []).append(response)
+
+        self.__queues = {key:deque(responses) for key, responses in self.__recorded.items()}
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_ReplayTransport__lock']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        json_data: Optional[Any] = None,
+        proxies: Optional[Dict] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ) -> CassetteResponse:
+        key = Cassette.key(method, url, params=params, json_data=json_data)
+
+        with self.__lock:
+            queue = self.__queues.get(key)
+
+            if queue is None:
+                raise CassetteMissError('No recorded response for: ' + key)
+
+            if not queue:
+                if not self.loop:
+                    raise CassetteMissError('Recorded responses used up for: ' + key)
+
+                queue.extend(self.__recorded[key])
+
+            response, elapsed = queue.popleft()
+
+        if self.realtime:
+            time.sleep(elapsed)
+
+        return response
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,390 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import math, asyncio, threading, weakref
+from array import array
+from typing import Optional, Dict, List, Callable
+
+# Pip
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local
+from .errors import BittrexError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+TICKER_FIELDS         = ['bidRate', 'askRate', 'lastTradeRate']
+MARKET_SUMMARY_FIELDS = ['high', 'low', 'volume', 'quoteVolume']
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: ChangeFeed ---------------------------------------------------------- #
+
+class ChangeFeed:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        loader: Callable[[], Optional[List[Dict]]],
+        fields: List[str],
+        key: str = 'symbol',
+        threshold_bps: float = 0,
+        thresholds: Optional[Dict[str, float]] = None,
+        debug_level: int = 1
+    ):
+        """Polls a bulk endpoint (eg. 'get_tickers') and hands listeners only the rows that moved. Every field is kept in one column
+        per field, aligned by market, with the values last handed out. A poll compares the new columns against them at once (vectorized with
+        numpy if it is installed) and a row counts as moved once one of its fields differs by at least the threshold of its market, in bps.
+        Small moves add up until they cross it.
+
+        Arguments:
+            loader {Callable[[], Optional[List[Dict]]]} -- returns the rows
+
+            fields {List[str]} -- numeric fields compared (eg. TICKER_FIELDS)
+
+        Keyword Arguments:
+            key {str} -- field naming the market of a row (default: {'symbol'})
+
+            threshold_bps {float} -- move needed, 0 for any change (default: {0})
+
+            thresholds {Optional[Dict[str, float]]} -- move needed per market, overriding 'threshold_bps' (default: {None})
+
+            debug_level {int} -- prints the errors of listeners and failed polls from 1 (default: {1})
+        """
+
+        self.loader = loader
+        self.fields = fields
+        self.key = key
+        self.threshold_bps = threshold_bps
+        self.thresholds = thresholds or {}
+        self.debug_level = debug_level
+
+        self.__listeners = []
+        self.__index = {}
+        self.__columns = {field:array('d') for field in fields}
+        self.__threshold_column = array('d')
+        self.__init_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+
+        for key in ['_ChangeFeed__lock', '_ChangeFeed__stop', '_ChangeFeed__thread']:
+            del state[key]
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def add_listener(self, listener: Callable[[List[Dict]], None]) -> None:
+        """Calls 'listener' with the rows that moved, after every poll with at least one
+
+        Arguments:
+            listener {Callable[[List[Dict]], None]} -- called with the moved rows
+        """
+
+        self.__listeners = self.__listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[List[Dict]], None]) -> None:
+        self.__listeners = [l for l in self.__listeners if l != listener]
+
+    def changes(self, max_queued: int = 100) -> 'ChangeFeedIterator':
+        """The moved rows as an async iterator, to be called from the event loop consuming it
+
+        Keyword Arguments:
+            max_queued {int} -- polls queued at most, the oldest are dropped beyond, 0 for no limit (default: {100})
+
+        Returns:
+            ChangeFeedIterator -- 'async with feed.changes() as changes: async for rows in changes: ...'
+        """
+
+        return ChangeFeedIterator(self, max_queued=max_queued)
+
+    def set_threshold(self, market: str, threshold_bps: float) -> None:
+        with self.__lock:
+            self.thresholds[market] = threshold_bps
+            i = self.__index.get(market)
+
+            if i is not None:
+                self.__threshold_column[i] = threshold_bps
+
+    def poll(self) -> Optional[List[Dict]]:
+        """Loads the rows and hands the moved ones to the listeners
+
+        Returns:
+            Optional[List[Dict]] -- the moved rows, None if the loader failed
+        """
+
+        try:
+            rows = self.loader()
+        except BittrexError:
+            return None
+
+        if rows is None:
+            return None
+
+        with self.__lock:
+            by_index = {}
+
+            for row in rows:
+                market = row.get(self.key)
+
+                if market is None:
+                    continue
+
+                i = self.__index.get(market)
+
+                if i is None:
+                    i = self.__add_market(market)
+
+                by_index[i] = row
+
+            new_columns = {field:self.__new_column(field, by_index) for field in self.fields}
+            moved = self.__moved(new_columns)
+
+            # The values handed out become the new reference of their markets, the others keep adding up
+            for field, column in self.__columns.items():
+                for i in moved:
+                    column[i] = new_columns[field][i]
+
+            changed = [by_index[i] for i in moved if i in by_index]
+
+        if changed:
+            for listener in self.__listeners:
+                try:
+                    listener(changed)
+                except Exception as e:
+                    self.__print_error('Change feed listener:', e)
+
+        return changed
+
+    def start(self, interval: float = 1) -> None:
+        """Polls every 'interval' seconds on a daemon thread
+
+        Keyword Arguments:
+            interval {float} -- seconds between polls (default: {1})
+        """
+
+        if self.__thread is not None:
+            return
+
+        # A stop event of its own, so a thread stopped a moment ago can not keep polling next to this one
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, args=(interval, self.__stop), daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stop.set()
+        self.__thread = None
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def __run(self, interval: float, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                # A malformed row must not end the feed
+                self.__print_error('Change feed:', e)
+
+            stop.wait(interval)
+
+    def __print_error(self, prefix: str, e: Exception) -> None:
+        if self.debug_level >= 1:
+            print(prefix, repr(e))
+
+    def __add_market(self, market: str) -> int:
+        i = len(self.__index)
+        self.__index[market] = i
+
+        # NaN compares as moved, a new market is always handed out
+        for column in self.__columns.values():
+            column.append(math.nan)
+
+        self.__threshold_column.append(self.thresholds.get(market, self.threshold_bps))
+
+        return i
+
+    def __new_column(self, field: str, by_index: Dict[int, Dict]) -> array:
+        # Markets missing from this poll keep their reference, so they do not count as moved
+        column = array('d', self.__columns[field])
+
+        for i, row in by_index.items():
+            column[i] = self.__number(row.get(field))
+
+        return column
+
+    def __moved(self, new_columns: Dict[str, array]) -> List[int]:
+        if numpy is not None:
+            thresholds = numpy.frombuffer(self.__threshold_column, dtype=numpy.float64)
+            moved = numpy.zeros(len(thresholds), dtype=bool)
+
+            with numpy.errstate(invalid='ignore'):
+                for field in self.fields:
+                    old = numpy.frombuffer(self.__columns[field], dtype=numpy.float64)
+                    new = numpy.frombuffer(new_columns[field], dtype=numpy.float64)
+                    appeared = numpy.isnan(old) & ~numpy.isnan(new)
+                    moved |= appeared | ((new != old) & (numpy.abs(new - old) * 10000 >= thresholds * numpy.abs(old)))
+
+            return numpy.flatnonzero(moved).tolist()
+
+        moved = set()
+
+        for field in self.fields:
+            old_column, new_column = self.__columns[field], new_columns[field]
+
+            for i, (old, new, threshold) in enumerate(zip(old_column, new_column, self.__threshold_column)):
+                if math.isnan(old):
+                    if not math.isnan(new):
+                        moved.add(i)
+                elif new != old and abs(new - old) * 10000 >= threshold * abs(old):
+                    moved.add(i)
+
+        return sorted(moved)
+
+    @staticmethod
+    def __number(value) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------ class: ChangeFeedIterator ------------------------------------------------------ #
+
+class ChangeFeedIterator:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        feed: ChangeFeed,
+        max_queued: int = 100
+    ):
+        """Async iterator of the moved rows of a feed, polled on its own thread. Create it from the event loop consuming it (CHECK: 'ChangeFeed.changes').
+        Used as an async context manager it unsubscribes on exit. The feed only holds it weakly, so an iterator dropped without 'aclose' unsubscribes as well.
+
+        Arguments:
+            feed {ChangeFeed} -- feed
+
+        Keyword Arguments:
+            max_queued {int} -- polls queued at most, the oldest are dropped beyond, 0 for no limit (default: {100})
+        """
+
+        self.feed = feed
+        self.max_queued = max_queued
+
+        self.__loop = asyncio.get_event_loop()
+        self.__queue = asyncio.Queue()
+        self.__closed = False
+        self.__listener = _WeakListener(self)
+        feed.add_listener(self.__listener)
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def __aiter__(self) -> 'ChangeFeedIterator':
+        return self
+
+    async def __anext__(self) -> List[Dict]:
+        rows = await self.__queue.get()
+
+        if rows is None:
+            raise StopAsyncIteration
+
+        return rows
+
+    async def __aenter__(self) -> 'ChangeFeedIterator':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unsubscribes, the iteration stops once the queued polls are consumed"""
+
+        if self.__closed:
+            return
+
+        self.__closed = True
+        self.feed.remove_listener(self.__listener)
+
+        try:
+            self.__loop.call_soon_threadsafe(self.__put, None)
+        except RuntimeError:
+            # Loop closed already, nobody is left to iterate
+            pass
+
+    def _push(self, rows: List[Dict]) -> None:
+        # Called on the thread of the feed
+        try:
+            self.__loop.call_soon_threadsafe(self.__put, rows)
+        except RuntimeError:
+            self.__closed = True
+            self.feed.remove_listener(self.__listener)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __put(self, rows: Optional[List[Dict]]) -> None:
+        # The end marker is never dropped for room
+        if rows is not None and self.max_queued and self.__queue.qsize() >= self.max_queued:
+            self.__queue.get_nowait()
+
+        self.__queue.put_nowait(rows)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: _WeakListener ------------------------------------------------------- #
+
+class _WeakListener:
+    def __init__(self, iterator: ChangeFeedIterator):
+        self.iterator = weakref.ref(iterator)
+        self.feed = iterator.feed
+
+    def __call__(self, rows: List[Dict]) -> None:
+        iterator = self.iterator()
+
+        # Dropped without being closed (eg. a consumer breaking out of 'async for')
+        if iterator is None:
+            self.feed.remove_listener(self)
+
+            return
+
+        iterator._push(rows)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
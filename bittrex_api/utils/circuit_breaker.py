@@ -0,0 +1,230 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading
+from enum import Enum
+from typing import Optional, Dict, List, Tuple, Callable
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: CircuitState --------------------------------------------------------- #
+
+class CircuitState(Enum):
+    CLOSED    = 'closed'
+    OPEN      = 'open'
+    HALF_OPEN = 'half_open'
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: _Circuit ----------------------------------------------------------- #
+
+class _Circuit:
+    __slots__ = ('state', 'failures', 'opened_at', 'probes')
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: CircuitBreaker -------------------------------------------------------- #
+
+class CircuitBreaker:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        probe_count: int = 1
+    ):
+        """One circuit per endpoint group (eg. 'v3/orders'). A circuit opens after 'failure_threshold' consecutive outage failures (network errors, timeouts, 5xx)
+        and fails every request fast while open. After 'reset_timeout' seconds it lets 'probe_count' probe requests through (half-open):
+        a successful probe closes it, a failed one opens it again.
+
+        Keyword Arguments:
+            failure_threshold {int} -- consecutive failures opening a circuit (default: {5})
+
+            reset_timeout {float} -- seconds a circuit stays open before probing (default: {30})
+
+            probe_count {int} -- concurrent probe requests allowed while half-open (default: {1})
+        """
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_count = probe_count
+        self.listeners = []
+
+        self.__lock = threading.Lock()
+        self.__circuits = {}
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_CircuitBreaker__lock']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def add_listener(self, listener: Callable[[str, CircuitState, CircuitState], None]) -> None:
+        """Registers a callback for state changes
+
+        Arguments:
+            listener {Callable[[str, CircuitState, CircuitState], None]} -- called with the group, the previous and the new state
+        """
+
+        self.listeners = self.listeners + [listener]
+
+    def allow(self, group: str) -> bool:
+        """Whether a request of 'group' may be sent. Every allowed request has to be followed by a 'record' (or a 'release' if it is not sent).
+
+        Arguments:
+            group {str} -- endpoint group
+
+        Returns:
+            bool -- False while the circuit is open (or all probes are out)
+        """
+
+        changes = []
+
+        with self.__lock:
+            circuit = self.__circuit(group)
+
+            if circuit.state == CircuitState.OPEN:
+                if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                    return False
+
+                changes.append(self.__set_state(circuit, CircuitState.HALF_OPEN))
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.probes >= self.probe_count:
+                    allowed = False
+                else:
+                    circuit.probes += 1
+                    allowed = True
+            else:
+                allowed = True
+
+        self.__notify(group, changes)
+
+        return allowed
+
+    def record(self, group: str, success: bool) -> None:
+        """Records the outcome of an allowed request
+
+        Arguments:
+            group {str} -- endpoint group
+
+            success {bool} -- False for outage failures only, any answer from a healthy server (even an error) is a success
+        """
+
+        changes = []
+
+        with self.__lock:
+            circuit = self.__circuit(group)
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+
+            if success:
+                circuit.failures = 0
+
+                if circuit.state != CircuitState.CLOSED:
+                    changes.append(self.__set_state(circuit, CircuitState.CLOSED))
+            else:
+                circuit.failures += 1
+
+                if circuit.state == CircuitState.HALF_OPEN or (circuit.state == CircuitState.CLOSED and circuit.failures >= self.failure_threshold):
+                    circuit.opened_at = time.monotonic()
+                    changes.append(self.__set_state(circuit, CircuitState.OPEN))
+
+        self.__notify(group, changes)
+
+    def release(self, group: str) -> None:
+        """Gives back the probe slot of an allowed request that was never sent, without an outcome
+
+        Arguments:
+            group {str} -- endpoint group
+        """
+
+        with self.__lock:
+            circuit = self.__circuit(group)
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+
+    def state(self, group: str) -> CircuitState:
+        with self.__lock:
+            return self.__circuit(group).state
+
+    def states(self) -> Dict[str, CircuitState]:
+        with self.__lock:
+            return {group:circuit.state for group, circuit in self.__circuits.items()}
+
+    def retry_after(self, group: str) -> float:
+        """Seconds until an open circuit of 'group' lets probes through
+
+        Arguments:
+            group {str} -- endpoint group
+
+        Returns:
+            float -- seconds, 0 if it is not open
+        """
+
+        with self.__lock:
+            circuit = self.__circuit(group)
+
+            if circuit.state != CircuitState.OPEN:
+                return 0.0
+
+            return max(self.reset_timeout - (time.monotonic() - circuit.opened_at), 0.0)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __circuit(self, group: str) -> _Circuit:
+        circuit = self.__circuits.get(group)
+
+        if circuit is None:
+            circuit = _Circuit()
+            self.__circuits[group] = circuit
+
+        return circuit
+
+    @staticmethod
+    def __set_state(circuit: _Circuit, state: CircuitState) -> Tuple[CircuitState, CircuitState]:
+        previous = circuit.state
+        circuit.state = state
+
+        if state != CircuitState.HALF_OPEN:
+            circuit.probes = 0
+
+        return previous, state
+
+    def __notify(self, group: str, changes: List[Tuple[CircuitState, CircuitState]]) -> None:
+        # Outside of the lock, so listeners may call back into the breaker
+        for previous, state in changes:
+            for listener in self.listeners:
+                listener(group, previous, state)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
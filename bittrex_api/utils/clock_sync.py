@@ -0,0 +1,186 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import threading
+from typing import Optional, Dict, Callable
+
+# Local
+from .crypto import NonceSource
+from .errors import BittrexError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# Error codes meaning the server did not accept our timestamp
+TIMESTAMP_ERROR_CODES = ['INVALID_TIMESTAMP']
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: ClockSync ----------------------------------------------------------- #
+
+class ClockSync:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        ping: Callable[[], Optional[Dict]],
+        nonce_source: NonceSource,
+        samples: int = 5
+    ):
+        """Estimates the offset of the server clock from repeated pings and applies it to every signed timestamp of 'nonce_source'
+
+        Arguments:
+            ping {Callable[[], Optional[Dict]]} -- returns a ServicePing ({'serverTime': int})
+
+            nonce_source {NonceSource} -- source whose 'offset_ms' is kept in sync
+
+        Keyword Arguments:
+            samples {int} -- pings per sync, the one with the lowest round-trip time wins (default: {5})
+        """
+
+        self.ping = ping
+        self.nonce_source = nonce_source
+        self.extra_nonce_sources = []
+        self.samples = samples
+        self.offset_ms = None
+        self.rtt_ms = None
+
+        self.__init_sync_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {k:v for k, v in self.__dict__.items() if not k.startswith('_ClockSync__')}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_sync_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def add_nonce_source(self, nonce_source: NonceSource) -> None:
+        """Keeps another source (eg. of another api key of the same client) at the measured offset too
+
+        Arguments:
+            nonce_source {NonceSource} -- source
+        """
+
+        if self.offset_ms is not None:
+            nonce_source.offset_ms = int(round(self.offset_ms))
+
+        self.extra_nonce_sources = self.extra_nonce_sources + [nonce_source]
+
+    def sync(self) -> Optional[float]:
+        """Pings the server 'samples' times and applies the offset measured with the lowest round-trip time
+
+        Returns:
+            Optional[float] -- the new offset in milliseconds (server - local), None if no ping succeeded
+        """
+
+        with self.__sync_lock:
+            best = None
+
+            for _ in range(self.samples):
+                start = self.nonce_source.clock_ms()
+
+                try:
+                    ping = self.ping()
+                except BittrexError:
+                    continue
+
+                end = self.nonce_source.clock_ms()
+
+                if not ping or 'serverTime' not in ping:
+                    continue
+
+                rtt = end - start
+                offset = ping['serverTime'] - (start + end) / 2
+
+                if best is None or rtt < best[0]:
+                    best = (rtt, offset)
+
+            if best is None:
+                return None
+
+            self.rtt_ms, self.offset_ms = best
+
+            for nonce_source in [self.nonce_source] + self.extra_nonce_sources:
+                nonce_source.offset_ms = int(round(self.offset_ms))
+
+            return self.offset_ms
+
+    def request_sync(self) -> None:
+        """Schedules a sync in the background and returns immediately"""
+
+        if self.__thread is not None:
+            self.__wake.set()
+
+            return
+
+        if self.__sync_lock.locked():
+            return
+
+        threading.Thread(target=self.sync, daemon=True).start()
+
+    def on_error(self, status_code: int, code: Optional[str]) -> None:
+        """Error listener (see BittrexRequests.add_error_listener) re-syncing after timestamp rejections"""
+
+        if code in TIMESTAMP_ERROR_CODES:
+            self.request_sync()
+
+    def start(self, interval: float = 300) -> None:
+        """Syncs now and then every 'interval' seconds on a daemon thread
+
+        Keyword Arguments:
+            interval {float} -- seconds between syncs (default: {300})
+        """
+
+        if self.__thread is not None:
+            return
+
+        # Events of its own, so a thread stopped a moment ago (maybe still mid-sync) ends instead of syncing next to this one
+        self.__stop = threading.Event()
+        self.__wake = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, args=(interval, self.__stop, self.__wake), daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the background syncs, waiting for a sync in progress
+
+        Keyword Arguments:
+            timeout {Optional[float]} -- seconds to wait for the thread at most, None for no limit (default: {None})
+        """
+
+        thread = self.__thread
+        self.__stop.set()
+        self.__wake.set()
+        self.__thread = None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_sync_state(self) -> None:
+        self.__sync_lock = threading.Lock()
+        self.__wake = threading.Event()
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def __run(self, interval: float, stop: threading.Event, wake: threading.Event) -> None:
+        while not stop.is_set():
+            self.sync()
+            wake.wait(interval)
+            wake.clear()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
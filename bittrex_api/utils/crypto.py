@@ -1,7 +1,91 @@
 # --------------------------------------------------------------- Imports --------------------------------------------------------------- #
 
 # System
-import hashlib
+import hashlib, threading, time
+from typing import Optional
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+_SOURCES_LOCK = threading.Lock()
+_SOURCES = {}
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: NonceSource ---------------------------------------------------------- #
+
+class NonceSource:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(self, api_key: str = ''):
+        """Strictly increasing, thread-safe millisecond nonces for one api key.
+        Built on the monotonic clock anchored to the wall clock once, so NTP adjustments can not make it collide or go backwards.
+
+        Keyword Arguments:
+            api_key {str} -- api key the nonces are used with (default: {''})
+        """
+
+        self.api_key = api_key
+        self.offset_ms = 0
+
+        self.__lock = threading.Lock()
+        self.__last = 0
+        self.anchor()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __reduce__(self):
+        # Unpickled sources are looked up again, so every nonce for a key keeps coming from one source per process
+        return (nonce_source, (self.api_key,))
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def anchor(self) -> None:
+        """Re-reads the wall clock. Nonces never go backwards, even if the wall clock did."""
+
+        self.__wall = time.time()
+        self.__monotonic = time.monotonic()
+
+    def clock_ms(self) -> float:
+        """Local time in milliseconds, without 'offset_ms'
+
+        Returns:
+            float -- milliseconds since epoch
+        """
+
+        return (self.__wall + time.monotonic() - self.__monotonic) * 1000
+
+    def now_ms(self) -> int:
+        """Current time in milliseconds, without the uniqueness guarantee of 'next'
+
+        Returns:
+            int -- milliseconds since epoch (plus 'offset_ms')
+        """
+
+        return int(self.clock_ms()) + self.offset_ms
+
+    def next(self) -> int:
+        """Next nonce, greater than any nonce returned before
+
+        Returns:
+            int -- nonce
+        """
+
+        now = self.now_ms()
+
+        with self.__lock:
+            self.__last = now if now > self.__last else self.__last + 1
+
+            return self.__last
+
 
 # --------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -17,7 +101,31 @@ def signature(message: str, salt: str) -> str:
 def sha512(message: str) -> str:
     return hashlib.sha512(message.encode()).hexdigest()
 
-def nonce() -> int:
-    import time
+def nonce_source(api_key: Optional[str] = None) -> NonceSource:
+    """The shared nonce source of an api key
+
+    Keyword Arguments:
+        api_key {Optional[str]} -- api key (default: {None})
+
+    Returns:
+        NonceSource -- nonce source
+    """
+
+    api_key = api_key or ''
+    source = _SOURCES.get(api_key)
+
+    if source is None:
+        with _SOURCES_LOCK:
+            source = _SOURCES.get(api_key)
 
-    return int(time.time() * 1000)
\ No newline at end of file
+            if source is None:
+                source = NonceSource(api_key)
+                _SOURCES[api_key] = source
+
+    return source
+
+def nonce(api_key: Optional[str] = None) -> int:
+    return nonce_source(api_key).next()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
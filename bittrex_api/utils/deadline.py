@@ -0,0 +1,57 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time
+from typing import Optional, Union
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: Deadline ----------------------------------------------------------- #
+
+class Deadline:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(self, seconds: float):
+        """Point in time (on the monotonic clock) by which a call, with all of its retries and waits, has to finish
+
+        Arguments:
+            seconds {float} -- budget from now
+        """
+
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def __repr__(self) -> str:
+        return 'Deadline({:.3f}s left)'.format(self.remaining())
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    @classmethod
+    def of(cls, deadline: Optional[Union[float, 'Deadline']]) -> Optional['Deadline']:
+        """The deadline of a 'deadline' argument
+
+        Arguments:
+            deadline {Optional[Union[float, Deadline]]} -- seconds from now, or an already running deadline
+
+        Returns:
+            Optional[Deadline] -- the deadline, None if there is none
+        """
+
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
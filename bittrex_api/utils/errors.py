@@ -0,0 +1,214 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+from typing import Optional, Any
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# A create request failing with this code was executed before (with the same client id)
+DUPLICATE_ERROR_CODES = ['DUPLICATE_CLIENT_ORDER_ID']
+
+# Error codes that may succeed when sent again (INVALID_TIMESTAMP does once the clock is re-synced)
+TRANSIENT_ERROR_CODES = [
+    'INVALID_TIMESTAMP',
+    'THROTTLED',
+    'TOO_MANY_REQUESTS',
+    'SERVICE_UNAVAILABLE',
+    'INTERNAL_SERVER_ERROR'
+]
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: BittrexError --------------------------------------------------------- #
+
+class BittrexError(Exception):
+    retryable = False
+    ambiguous = False
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        message: str = '',
+        status_code: Optional[int] = None,
+        code: Optional[str] = None,
+        body: Optional[Any] = None,
+        retryable: Optional[bool] = None,
+        ambiguous: Optional[bool] = None
+    ):
+        """Failed request
+
+        Keyword Arguments:
+            message {str} -- human readable description (default: {''})
+
+            status_code {Optional[int]} -- http status code, None if no response arrived (default: {None})
+
+            code {Optional[str]} -- error code of the response body (eg. 'INSUFFICIENT_FUNDS') (default: {None})
+
+            body {Optional[Any]} -- decoded response body (default: {None})
+
+            retryable {Optional[bool]} -- overrides the default of the class (default: {None})
+
+            ambiguous {Optional[bool]} -- overrides the default of the class (default: {None})
+        """
+
+        super().__init__(message or code or status_code)
+
+        self.message = message
+        self.status_code = status_code
+        self.code = code
+        self.body = body
+
+        if retryable is not None:
+            self.retryable = retryable
+
+        if ambiguous is not None:
+            self.ambiguous = ambiguous
+
+    def __repr__(self) -> str:
+        return '{}(status_code={}, code={}, message={!r})'.format(type(self).__name__, self.status_code, self.code, self.message)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------------- Errors --------------------------------------------------------------- #
+
+class TransientError(BittrexError):
+    """The same request may succeed later"""
+
+    retryable = True
+
+class NetworkError(TransientError):
+    """No response arrived (connection refused, reset, proxy failure...). The request may or may not have reached the server."""
+
+    ambiguous = True
+
+class RequestTimeoutError(NetworkError):
+    """The server did not answer in time. The request may or may not have been executed."""
+
+class ServerError(TransientError):
+    """5xx response. The request may or may not have been executed."""
+
+    ambiguous = True
+
+class RateLimitError(TransientError):
+    """429 response"""
+
+    def __init__(self, *args, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.retry_after = retry_after
+
+class ClientError(BittrexError):
+    """4xx response. Sending the same request again gives the same answer."""
+
+class AuthenticationError(ClientError):
+    """401/403 response"""
+
+class NotFoundError(ClientError):
+    """404 response"""
+
+class ApiError(BittrexError):
+    """Error reported in the body of a response (a v3 'code' or a v1/v2 'success': false)"""
+
+class ResponseFormatError(BittrexError):
+    """The response is not shaped as expected"""
+
+class CircuitOpenError(BittrexError):
+    """The circuit breaker of the endpoint group is open, the request was not sent"""
+
+    def __init__(self, *args, group: Optional[str] = None, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.group = group
+        self.retry_after = retry_after
+
+class DeadlineExceededError(BittrexError):
+    """The deadline of the call ran out (or can not cover another attempt)"""
+
+    def __init__(self, *args, last_error: Optional[BittrexError] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.last_error = last_error
+
+class OrderValidationError(BittrexError):
+    """The order breaks the rules of its market (or the available balance) and was rejected without being sent"""
+
+class CassetteMissError(BittrexError):
+    """The replayed cassette has no (more) recorded responses for the request"""
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ----------------------------------------------------------- #
+
+def error_for_response(
+    status_code: int,
+    code: Optional[str] = None,
+    message: str = '',
+    body: Optional[Any] = None,
+    retry_after: Optional[float] = None
+) -> BittrexError:
+    """The typed error of a non-2xx response
+
+    Arguments:
+        status_code {int} -- http status code
+
+    Keyword Arguments:
+        code {Optional[str]} -- error code of the response body (default: {None})
+
+        message {str} -- human readable description (default: {''})
+
+        body {Optional[Any]} -- decoded response body (default: {None})
+
+        retry_after {Optional[float]} -- seconds from the 'Retry-After' header (default: {None})
+
+    Returns:
+        BittrexError -- the error
+    """
+
+    retryable = True if code in TRANSIENT_ERROR_CODES else None
+
+    if status_code == 429:
+        return RateLimitError(message, status_code=status_code, code=code, body=body, retry_after=retry_after)
+
+    if status_code >= 500:
+        return ServerError(message, status_code=status_code, code=code, body=body)
+
+    if status_code in [401, 403]:
+        return AuthenticationError(message, status_code=status_code, code=code, body=body, retryable=retryable)
+
+    if status_code == 404:
+        return NotFoundError(message, status_code=status_code, code=code, body=body, retryable=retryable)
+
+    return ClientError(message, status_code=status_code, code=code, body=body, retryable=retryable)
+
+def api_error(code: Optional[str], body: Optional[Any] = None, status_code: Optional[int] = None) -> ApiError:
+    """The typed error of a 2xx response reporting an error in its body
+
+    Arguments:
+        code {Optional[str]} -- the reported error code (v1/v2 'message')
+
+    Keyword Arguments:
+        body {Optional[Any]} -- decoded response body (default: {None})
+
+        status_code {Optional[int]} -- http status code (default: {None})
+
+    Returns:
+        ApiError -- the error
+    """
+
+    return ApiError(code or '', status_code=status_code, code=code, body=body, retryable=code in TRANSIENT_ERROR_CODES)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
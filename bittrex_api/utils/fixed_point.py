@@ -0,0 +1,187 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Optional, Dict, List, Union
+
+# Local
+from .symbols import SymbolRegistry
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# Decimals of quantities, volumes, commissions and proceeds (Bittrex amounts have at most 8)
+AMOUNT_DECIMALS = 8
+
+# Decimals of the prices of markets with an unknown precision
+DEFAULT_PRICE_DECIMALS = 8
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ----------------------------------------------------------- #
+
+def to_ticks(value: Union[str, float, Decimal, int], decimals: int) -> int:
+    """The value in integer units of 10^-decimals, rounded to the nearest one. Ints are taken as ticks already.
+
+    Arguments:
+        value {Union[str, float, Decimal, int]} -- decimal string (as Bittrex sends them), float or Decimal
+
+        decimals {int} -- decimals of a tick
+
+    Returns:
+        int -- ticks
+    """
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+
+    # Floats through their shortest repr, so 0.1 is 0.1 and not the binary 0.1000000000000000055...
+    d = value if isinstance(value, Decimal) else Decimal(value if isinstance(value, str) else repr(float(value)))
+
+    return int(d.scaleb(decimals).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+def to_decimal_string(ticks: int, decimals: int) -> str:
+    """The exact decimal string of 'ticks', without trailing zeros (eg. 12345000 ticks of 8 decimals -> '0.12345')
+
+    Arguments:
+        ticks {int} -- ticks
+
+        decimals {int} -- decimals of a tick
+
+    Returns:
+        str -- decimal string
+    """
+
+    sign, ticks = ('-', -ticks) if ticks < 0 else ('', ticks)
+    whole, fraction = divmod(ticks, 10 ** decimals)
+    fraction = str(fraction).rjust(decimals, '0').rstrip('0') if decimals > 0 else ''
+
+    return sign + str(whole) + ('.' + fraction if fraction else '')
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: FixedPoint ---------------------------------------------------------- #
+
+class FixedPoint:
+    # Price and amount fields of the converted objects
+    __PRICE_FIELDS = {
+        'orderbook_entry': ['rate'],
+        'trade':           ['rate'],
+        'candle':          ['open', 'high', 'low', 'close'],
+        'order':           ['limit']
+    }
+    __AMOUNT_FIELDS = {
+        'orderbook_entry': ['quantity'],
+        'trade':           ['quantity'],
+        'candle':          ['volume', 'quoteVolume'],
+        # The ceiling of a market buy is a quote amount, not a price
+        'order':           ['quantity', 'ceiling', 'fillQuantity', 'commission', 'proceeds']
+    }
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        symbols: SymbolRegistry
+    ):
+        """Integer tick representation of prices and amounts. A price tick is 10^-precision of its market, an amount tick 10^-8.
+        Order books, trades, candles and orders come back with int ticks instead of numbers, so comparing and summing them is exact integer math,
+        and order bodies go out as exact decimal strings. Markets of unknown precision (registry not loadable) use 8 decimals.
+
+        Arguments:
+            symbols {SymbolRegistry} -- market metadata
+        """
+
+        self.symbols = symbols
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def price_decimals(self, market: Optional[str]) -> int:
+        """Decimals of a price tick of 'market'
+
+        Arguments:
+            market {Optional[str]} -- market name (v3 or v1/v2)
+
+        Returns:
+            int -- decimals
+        """
+
+        self.symbols.ensure_loaded()
+        m = self.symbols.market(market) if market else None
+
+        return int(m.precision) if m is not None and m.precision is not None else DEFAULT_PRICE_DECIMALS
+
+    def price_ticks(self, market: str, price: Union[str, float, Decimal, int]) -> int:
+        return to_ticks(price, self.price_decimals(market))
+
+    def price_string(self, market: str, ticks: int) -> str:
+        return to_decimal_string(ticks, self.price_decimals(market))
+
+    @staticmethod
+    def amount_ticks(amount: Union[str, float, Decimal, int]) -> int:
+        return to_ticks(amount, AMOUNT_DECIMALS)
+
+    @staticmethod
+    def amount_string(ticks: int) -> str:
+        return to_decimal_string(ticks, AMOUNT_DECIMALS)
+
+    def orderbook(self, market: str, orderbook: Dict) -> Dict:
+        """OrderBook with its rates and quantities in ticks"""
+
+        decimals = self.price_decimals(market)
+
+        return {side:self.__convert_all('orderbook_entry', entries, decimals) if isinstance(entries, list) else entries for side, entries in orderbook.items()}
+
+    def trades(self, market: str, trades: List[Dict]) -> List[Dict]:
+        """Trades with their rates and quantities in ticks"""
+
+        return self.__convert_all('trade', trades, self.price_decimals(market))
+
+    def candles(self, market: str, candles: List[Dict]) -> List[Dict]:
+        """Candles with their prices and volumes in ticks"""
+
+        return self.__convert_all('candle', candles, self.price_decimals(market))
+
+    def order(self, order: Dict) -> Dict:
+        """Order with its limit, ceiling, quantities, commission and proceeds in ticks"""
+
+        return self.__convert('order', order, self.price_decimals(order.get('marketSymbol')))
+
+    def orders(self, orders: List[Dict]) -> List[Dict]:
+        return [self.order(order) for order in orders]
+
+    def order_batch(self, responses: List[Dict]) -> List[Dict]:
+        """BatchResponses with the orders in their 'result' in ticks"""
+
+        return [dict(response, result=self.order(response['result'])) if response.get('result') else response for response in responses]
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __convert_all(self, kind: str, rows: List[Dict], price_decimals: int) -> List[Dict]:
+        return [self.__convert(kind, row, price_decimals) for row in rows]
+
+    @classmethod
+    def __convert(cls, kind: str, row: Dict, price_decimals: int) -> Dict:
+        row = dict(row)
+
+        for keys, decimals in [(cls.__PRICE_FIELDS[kind], price_decimals), (cls.__AMOUNT_FIELDS[kind], AMOUNT_DECIMALS)]:
+            for key in keys:
+                value = row.get(key)
+
+                if value is not None:
+                    row[key] = to_ticks(value, decimals)
+
+        return row
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
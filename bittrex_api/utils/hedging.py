@@ -0,0 +1,125 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import os, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: HedgePolicy --------------------------------------------------------- #
+
+class HedgePolicy:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 16
+    ):
+        """Opt-in hedging of the public GETs marked as hedgeable (ticker, orderbook, market summary).
+        If the request has not been answered within the 'percentile' latency of its endpoint, a duplicate goes out on another connection (and proxy, if there are more)
+        and the first response wins. Signed and mutating requests are never hedged.
+
+        Keyword Arguments:
+            percentile {float} -- latency percentile after which the duplicate is sent (default: {95})
+
+            min_delay {float} -- lower bound of the delay in seconds (default: {0.05})
+
+            max_delay {float} -- upper bound of the delay in seconds (default: {2.0})
+
+            min_samples {int} -- latencies needed for an endpoint before it is hedged (default: {20})
+
+            window {int} -- number of most recent latencies kept per endpoint (default: {200})
+
+            max_workers {int} -- threads sending the hedged requests (default: {16})
+        """
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_workers = max_workers
+
+        self.__init_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {k:v for k, v in self.__dict__.items() if not k.startswith('_HedgePolicy__')}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def record(self, key: str, seconds: float) -> None:
+        """Records the latency of a response
+
+        Arguments:
+            key {str} -- endpoint
+
+            seconds {float} -- latency
+        """
+
+        latencies = self.__latencies.get(key)
+
+        if latencies is None:
+            with self.__lock:
+                latencies = self.__latencies.setdefault(key, deque(maxlen=self.window))
+
+        latencies.append(seconds)
+
+    def delay(self, key: str) -> Optional[float]:
+        """Seconds to wait for a response before sending the duplicate
+
+        Arguments:
+            key {str} -- endpoint
+
+        Returns:
+            Optional[float] -- the delay, None if the endpoint has too few latencies recorded to be hedged
+        """
+
+        latencies = self.__latencies.get(key)
+
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+
+        latencies = sorted(latencies)
+        delay = latencies[min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)]
+
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def executor(self) -> ThreadPoolExecutor:
+        # Worker threads do not survive a fork
+        if self.__executor is None or self.__pid != os.getpid():
+            with self.__lock:
+                if self.__executor is None or self.__pid != os.getpid():
+                    self.__executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                    self.__pid = os.getpid()
+
+        return self.__executor
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__lock = threading.Lock()
+        self.__latencies = {}
+        self.__executor = None
+        self.__pid = None
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
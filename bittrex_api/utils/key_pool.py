@@ -0,0 +1,136 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict, List, Union, Tuple
+
+# Local
+from .rate_limiter import RateLimiter
+from . import crypto
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: ApiKey ------------------------------------------------------------ #
+
+class ApiKey:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """An api key with its own signer, nonce source and rate budget
+
+        Arguments:
+            api_key {str} -- api key
+
+            api_secret {str} -- api secret
+
+        Keyword Arguments:
+            rate_limiter {Optional[RateLimiter]} -- budget of the key, None for no limit (default: {None})
+        """
+
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.rate_limiter = rate_limiter
+        self.nonces = crypto.nonce_source(api_key)
+
+    def __repr__(self) -> str:
+        return 'ApiKey({}...)'.format(self.api_key[:6])
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def sign(self, message: str) -> str:
+        return crypto.signature(message, self.api_secret)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: KeyPool ----------------------------------------------------------- #
+
+class KeyPool:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        keys: List[Union[ApiKey, Tuple[str, str]]],
+        calls: int = 60,
+        period: float = 60
+    ):
+        """Api keys sharing the signed read traffic of a client. Bittrex limits every key on its own, so each one adds to the read throughput.
+        Signed GETs sent inside 'BittrexV3.sharded' go out with the key that has the most budget left. Orders, balances and everything else
+        (order entry, cancels, withdrawals) stay with the key of the client. Read-only keys are fine.
+
+        Arguments:
+            keys {List[Union[ApiKey, Tuple[str, str]]]} -- keys, or (api key, api secret) pairs
+
+        Keyword Arguments:
+            calls {int} -- calls per 'period' of the keys given as pairs (default: {60})
+
+            period {float} -- seconds (default: {60})
+        """
+
+        if not keys:
+            raise ValueError('A key pool needs at least one key')
+
+        self.keys = [key if isinstance(key, ApiKey) else ApiKey(key[0], key[1], rate_limiter=RateLimiter(calls, period)) for key in keys]
+
+        self.__keys = {key.api_key:key for key in self.keys}
+        self.__next = 0
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def get(self, api_key: str) -> Optional[ApiKey]:
+        """The pooled key of 'api_key'
+
+        Arguments:
+            api_key {str} -- api key
+
+        Returns:
+            Optional[ApiKey] -- the key, None if it is not in the pool
+        """
+
+        return self.__keys.get(api_key)
+
+    def acquire(self) -> ApiKey:
+        """The key with the most budget left (keys without a limiter count as unlimited), taking turns between equals
+
+        Returns:
+            ApiKey -- key
+        """
+
+        # A racy counter only shifts where the scan starts
+        start = self.__next
+        self.__next = (start + 1) % len(self.keys)
+
+        best, best_budget = None, None
+
+        for i in range(len(self.keys)):
+            key = self.keys[(start + i) % len(self.keys)]
+            budget = key.rate_limiter.available() if key.rate_limiter is not None else float('inf')
+
+            if best is None or budget > best_budget:
+                best, best_budget = key, budget
+
+        return best
+
+    def budgets(self) -> Dict[str, float]:
+        """Tokens left per api key
+
+        Returns:
+            Dict[str, float] -- tokens (inf without a limiter)
+        """
+
+        return {key.api_key:key.rate_limiter.available() if key.rate_limiter is not None else float('inf') for key in self.keys}
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,796 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, json, hmac, hashlib, random, threading, uuid, argparse
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit, parse_qs
+from typing import Optional, Dict, List, Tuple, Union, Any
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+V1_PREFIX = '/api/v1.1/'
+V2_PREFIX = '/api/v2.0/'
+V3_PREFIX = '/v3/'
+
+QUOTE_CURRENCIES = ['BTC', 'ETH', 'USDT', 'USD']
+TIMESTAMP        = '2020-01-01T00:00:00Z'
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: MockError --------------------------------------------------------- #
+
+class MockError(Exception):
+    def __init__(self, status_code: int, code: str):
+        super().__init__(code)
+
+        self.status_code = status_code
+        self.code = code
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: MockState --------------------------------------------------------- #
+
+class MockState:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        market_count: int = 50,
+        seed: int = 0
+    ):
+        """Deterministic in-memory exchange state served by MockBittrexServer
+
+        Keyword Arguments:
+            market_count {int} -- number of generated markets (default: {50})
+
+            seed {int} -- seed of the generated data (default: {0})
+        """
+
+        rnd = random.Random(seed)
+
+        self.lock = threading.Lock()
+        self.currencies = [self.__currency(symbol) for symbol in QUOTE_CURRENCIES]
+        self.markets = []
+        self.orders = {}
+        self.conditional_orders = {}
+        self.deposits = {}
+        self.withdrawals = {}
+
+        for i in range(market_count):
+            base = 'C{:03d}'.format(i)
+            quote = QUOTE_CURRENCIES[i % len(QUOTE_CURRENCIES)]
+            rate = round(rnd.uniform(0.0001, 100), 8)
+
+            self.currencies.append(self.__currency(base))
+            self.markets.append({
+                'symbol': base + '-' + quote,
+                'baseCurrencySymbol': base,
+                'quoteCurrencySymbol': quote,
+                'minTradeSize': round(rnd.uniform(0.01, 10), 8),
+                'precision': 8,
+                'status': 'ONLINE',
+                'createdAt': TIMESTAMP,
+                'prohibitedIn': [],
+                'associatedTermsOfService': [],
+                'tags': [],
+                '_rate': rate,
+                '_volume': round(rnd.uniform(10, 100000), 8)
+            })
+
+        self.markets_by_symbol = {m['symbol']:m for m in self.markets}
+        self.balances = {
+            c['symbol']:{'currencySymbol': c['symbol'], 'total': 1000.0, 'available': 1000.0, 'updatedAt': TIMESTAMP}
+            for c in self.currencies
+        }
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def market(self, symbol: str) -> Dict:
+        market = self.markets_by_symbol.get(symbol)
+
+        if market is None:
+            raise MockError(404, 'MARKET_DOES_NOT_EXIST')
+
+        return market
+
+    @staticmethod
+    def public(d: Dict) -> Dict:
+        return {k:v for k, v in d.items() if not k.startswith('_')}
+
+    def summary(self, market: Dict) -> Dict:
+        rate = market['_rate']
+
+        return {
+            'symbol': market['symbol'],
+            'high': rate * 1.05,
+            'low': rate * 0.95,
+            'volume': market['_volume'],
+            'quoteVolume': market['_volume'] * rate,
+            'percentChange': 1.5,
+            'updatedAt': TIMESTAMP
+        }
+
+    def ticker(self, market: Dict) -> Dict:
+        rate = market['_rate']
+
+        return {
+            'symbol': market['symbol'],
+            'lastTradeRate': rate,
+            'bidRate': rate * 0.999,
+            'askRate': rate * 1.001
+        }
+
+    def orderbook(self, market: Dict, depth: int) -> Dict:
+        rate = market['_rate']
+        step = rate / 10000
+
+        return {
+            'bid': [{'quantity': 1.0 + i, 'rate': round(rate - step * (i + 1), 8)} for i in range(depth)],
+            'ask': [{'quantity': 1.0 + i, 'rate': round(rate + step * (i + 1), 8)} for i in range(depth)]
+        }
+
+    def trades(self, market: Dict) -> List[Dict]:
+        return [
+            {'id': str(uuid.UUID(int=i + 1)), 'executedAt': TIMESTAMP, 'quantity': 1.0, 'rate': market['_rate'], 'takerSide': 'BUY' if i % 2 else 'SELL'}
+            for i in range(100)
+        ]
+
+    def candles(self, market: Dict, count: int = 288) -> List[Dict]:
+        rate = market['_rate']
+
+        return [
+            {'startsAt': TIMESTAMP, 'open': rate, 'high': rate * 1.01, 'low': rate * 0.99, 'close': rate, 'volume': 10.0, 'quoteVolume': 10.0 * rate}
+            for _ in range(count)
+        ]
+
+    def create_order(self, body: Dict) -> Dict:
+        market = self.market(body.get('marketSymbol'))
+        order_type = body.get('type')
+        quantity = body.get('quantity')
+
+        if order_type not in ['LIMIT', 'MARKET', 'CEILING_LIMIT', 'CEILING_MARKET']:
+            raise MockError(400, 'INVALID_ORDER_TYPE')
+
+        if quantity is not None and float(quantity) < market['minTradeSize']:
+            raise MockError(400, 'MIN_TRADE_REQUIREMENT_NOT_MET')
+
+        with self.lock:
+            client_order_id = body.get('clientOrderId')
+
+            if client_order_id is not None and any(o.get('clientOrderId') == client_order_id for o in self.orders.values()):
+                raise MockError(409, 'DUPLICATE_CLIENT_ORDER_ID')
+
+            is_market = order_type.endswith('MARKET')
+            order = {
+                'id': str(uuid.uuid4()),
+                'marketSymbol': market['symbol'],
+                'direction': body.get('direction'),
+                'type': order_type,
+                'quantity': quantity,
+                'limit': body.get('limit'),
+                'ceiling': body.get('ceiling'),
+                'timeInForce': body.get('timeInForce'),
+                'clientOrderId': client_order_id,
+                'fillQuantity': quantity if is_market else 0.0,
+                'commission': 0.0,
+                'proceeds': 0.0,
+                'status': 'CLOSED' if is_market else 'OPEN',
+                'createdAt': TIMESTAMP,
+                'updatedAt': TIMESTAMP
+            }
+
+            if is_market:
+                order['closedAt'] = TIMESTAMP
+
+            self.orders[order['id']] = order
+
+            return order
+
+    def cancel_order(self, order_id: str) -> Dict:
+        with self.lock:
+            order = self.orders.get(order_id)
+
+            if order is None:
+                raise MockError(404, 'NOT_FOUND')
+
+            if order['status'] == 'CLOSED':
+                raise MockError(409, 'ORDER_NOT_OPEN')
+
+            order['status'] = 'CLOSED'
+            order['closedAt'] = TIMESTAMP
+
+            return order
+
+    def create_conditional_order(self, body: Dict) -> Dict:
+        market = self.market(body.get('marketSymbol'))
+
+        with self.lock:
+            client_order_id = body.get('clientConditionalOrderId')
+
+            if client_order_id is not None and any(o.get('clientConditionalOrderId') == client_order_id for o in self.conditional_orders.values()):
+                raise MockError(409, 'DUPLICATE_CLIENT_ORDER_ID')
+
+            order = {
+                'id': str(uuid.uuid4()),
+                'marketSymbol': market['symbol'],
+                'operand': body.get('operand'),
+                'triggerPrice': body.get('triggerPrice'),
+                'trailingStopPercent': body.get('trailingStopPercent'),
+                'orderToCreate': body.get('orderToCreate'),
+                'orderToCancel': body.get('orderToCancel'),
+                'clientConditionalOrderId': body.get('clientConditionalOrderId'),
+                'status': 'OPEN',
+                'createdAt': TIMESTAMP,
+                'updatedAt': TIMESTAMP
+            }
+            self.conditional_orders[order['id']] = order
+
+            return order
+
+    def cancel_conditional_order(self, order_id: str) -> Dict:
+        with self.lock:
+            order = self.conditional_orders.get(order_id)
+
+            if order is None:
+                raise MockError(404, 'NOT_FOUND')
+
+            order['status'] = 'CANCELLED'
+            order['closedAt'] = TIMESTAMP
+
+            return order
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    @staticmethod
+    def __currency(symbol: str) -> Dict:
+        return {
+            'symbol': symbol,
+            'name': symbol,
+            'coinType': 'BITCOIN',
+            'status': 'ONLINE',
+            'minConfirmations': 2,
+            'notice': '',
+            'txFee': 0.0005,
+            'logoUrl': '',
+            'prohibitedIn': []
+        }
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: MockBittrexServer ----------------------------------------------------- #
+
+class MockBittrexServer:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        api_keys: Optional[Dict[str, str]] = None,
+        latency: Union[float, Tuple[float, float]] = 0,
+        error_rate: float = 0,
+        rate_limit_rate: float = 0,
+        max_timestamp_skew: Optional[float] = None,
+        market_count: int = 50,
+        seed: int = 0
+    ):
+        """Local HTTP server implementing the v1, v2 and v3 endpoints used by the clients, for load testing without the real exchange
+
+        Keyword Arguments:
+            host {str} -- interface to listen on (default: {'127.0.0.1'})
+
+            port {int} -- port to listen on, 0 picks a free one (default: {0})
+
+            api_keys {Optional[Dict[str, str]]} -- {api_key: api_secret} accepted for signed calls. If None, signed calls are not verified (default: {None})
+
+            latency {Union[float, Tuple[float, float]]} -- seconds added to every response, or a (min, max) range to draw from (default: {0})
+
+            error_rate {float} -- fraction of the requests answered with 503 (default: {0})
+
+            rate_limit_rate {float} -- fraction of the requests answered with 429 (default: {0})
+
+            max_timestamp_skew {Optional[float]} -- seconds an Api-Timestamp may differ from the server clock. If None, it is not checked (default: {None})
+
+            market_count {int} -- number of generated markets (default: {50})
+
+            seed {int} -- seed of the generated data and the injected faults (default: {0})
+        """
+
+        self.api_keys = api_keys
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_timestamp_skew = max_timestamp_skew
+        self.state = MockState(market_count=market_count, seed=seed)
+        self.request_count = 0
+
+        self.__random = random.Random(seed)
+        self.__random_lock = threading.Lock()
+        self.__httpd = _ThreadingHTTPServer((host, port), _Handler)
+        self.__httpd.mock = self
+        self.__thread = None
+
+
+    # ------------------------------------------------------- Public properties ----------------------------------------------------- #
+
+    @property
+    def address(self) -> str:
+        host, port = self.__httpd.server_address[:2]
+
+        return 'http://{}:{}'.format(host, port)
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def base_url(self, version: int = 3) -> str:
+        """Base url to pass to a client as 'base_url'
+
+        Keyword Arguments:
+            version {int} -- api version (default: {3})
+
+        Returns:
+            str -- base url
+        """
+
+        return self.address + {1: V1_PREFIX, 2: V2_PREFIX, 3: V3_PREFIX}[version]
+
+    def start(self) -> 'MockBittrexServer':
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__httpd.serve_forever, daemon=True)
+            self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+        self.__thread = None
+
+    def __enter__(self) -> 'MockBittrexServer':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def _fault(self) -> Tuple[float, Optional[MockError]]:
+        with self.__random_lock:
+            self.request_count += 1
+            latency = self.latency if not isinstance(self.latency, tuple) else self.__random.uniform(*self.latency)
+            roll = self.__random.random()
+
+        if roll < self.rate_limit_rate:
+            return latency, MockError(429, 'TOO_MANY_REQUESTS')
+
+        if roll < self.rate_limit_rate + self.error_rate:
+            return latency, MockError(503, 'SERVICE_UNAVAILABLE')
+
+        return latency, None
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------- class: _Handler --------------------------------------------------------- #
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    # ------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def do_GET(self):
+        self.__handle('GET')
+
+    def do_POST(self):
+        self.__handle('POST')
+
+    def do_DELETE(self):
+        self.__handle('DELETE')
+
+    def log_message(self, format, *args):
+        pass
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __handle(self, method: str) -> None:
+        mock = self.server.mock
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        split = urlsplit(self.path)
+        query = {k:v[0] for k, v in parse_qs(split.query).items()}
+        latency, fault = mock._fault()
+
+        if latency:
+            time.sleep(latency)
+
+        if split.path.startswith(V3_PREFIX):
+            status, payload = self.__v3(mock, method, split.path[len(V3_PREFIX):], query, body, fault)
+        elif split.path.startswith(V1_PREFIX):
+            status, payload = self.__legacy(mock, 1, split.path[len(V1_PREFIX):], query, fault)
+        elif split.path.startswith(V2_PREFIX):
+            status, payload = self.__legacy(mock, 2, split.path[len(V2_PREFIX):], query, fault)
+        else:
+            status, payload = 404, {'code': 'NOT_FOUND'}
+
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+
+        if status == 429:
+            self.send_header('Retry-After', '1')
+
+        self.end_headers()
+
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up waiting (timeout or deadline)
+            pass
+
+    def __url(self) -> str:
+        return 'http://' + self.headers.get('Host', '') + self.path
+
+    def __v3(self, mock: MockBittrexServer, method: str, path: str, query: Dict, body: bytes, fault: Optional[MockError]) -> Tuple[int, Any]:
+        try:
+            if fault is not None:
+                raise fault
+
+            comps = [c for c in path.strip('/').split('/') if c]
+
+            if not comps:
+                raise MockError(404, 'NOT_FOUND')
+
+            signed = comps[0] not in ['ping', 'currencies', 'markets']
+
+            if signed:
+                self.__verify_v3(mock, method, body)
+
+            return 200 if method != 'POST' else 201, _route_v3(mock.state, method, comps, query, json.loads(body.decode()) if body else None)
+        except MockError as e:
+            return e.status_code, {'code': e.code}
+
+    def __verify_v3(self, mock: MockBittrexServer, method: str, body: bytes) -> None:
+        if mock.api_keys is None:
+            return
+
+        api_key = self.headers.get('Api-Key')
+        timestamp = self.headers.get('Api-Timestamp') or ''
+
+        if api_key not in mock.api_keys:
+            raise MockError(401, 'APIKEY_INVALID')
+
+        if mock.max_timestamp_skew is not None and (not timestamp.isdigit() or abs(int(timestamp) / 1000 - time.time()) > mock.max_timestamp_skew):
+            raise MockError(400, 'INVALID_TIMESTAMP')
+
+        content_hash = hashlib.sha512(body).hexdigest()
+
+        if content_hash != self.headers.get('Api-Content-Hash'):
+            raise MockError(400, 'INVALID_CONTENT_HASH')
+
+        signature = hmac.new(mock.api_keys[api_key].encode(), ''.join([timestamp, self.__url(), method, content_hash]).encode(), hashlib.sha512).hexdigest()
+
+        if not hmac.compare_digest(signature, self.headers.get('Api-Signature') or ''):
+            raise MockError(401, 'INVALID_SIGNATURE')
+
+    def __legacy(self, mock: MockBittrexServer, version: int, path: str, query: Dict, fault: Optional[MockError]) -> Tuple[int, Any]:
+        if fault is not None:
+            return fault.status_code, {'success': False, 'message': fault.code, 'result': None}
+
+        try:
+            comps = [c for c in path.strip('/').split('/') if c]
+
+            if comps and comps[0] not in ['public', 'pub'] and mock.api_keys is not None:
+                api_key = query.get('apikey')
+
+                if api_key not in mock.api_keys:
+                    raise MockError(200, 'APIKEY_INVALID')
+
+                signature = hmac.new(mock.api_keys[api_key].encode(), self.__url().encode(), hashlib.sha512).hexdigest()
+
+                if not hmac.compare_digest(signature, self.headers.get('apisign') or ''):
+                    raise MockError(200, 'INVALID_SIGNATURE')
+
+            route = _route_v1 if version == 1 else _route_v2
+
+            return 200, {'success': True, 'message': '', 'result': route(mock.state, '/'.join(comps).lower(), query)}
+        except MockError as e:
+            return 200, {'success': False, 'message': e.code, 'result': None}
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------------- Routes -------------------------------------------------------------- #
+
+def _route_v3(state: MockState, method: str, comps: List[str], query: Dict, body: Optional[Dict]) -> Any:
+    head, rest = comps[0], comps[1:]
+
+    if head == 'ping':
+        return {'serverTime': int(time.time() * 1000)}
+
+    if head == 'currencies':
+        if not rest:
+            return state.currencies
+
+        for currency in state.currencies:
+            if currency['symbol'] == rest[0]:
+                return currency
+
+        raise MockError(404, 'CURRENCY_DOES_NOT_EXIST')
+
+    if head == 'markets':
+        if not rest:
+            return [state.public(m) for m in state.markets]
+
+        if rest == ['summaries']:
+            return [state.summary(m) for m in state.markets]
+
+        if rest == ['tickers']:
+            return [state.ticker(m) for m in state.markets]
+
+        market = state.market(rest[0])
+        sub = rest[1] if len(rest) > 1 else None
+
+        if sub is None:
+            return state.public(market)
+        if sub == 'summary':
+            return state.summary(market)
+        if sub == 'ticker':
+            return state.ticker(market)
+        if sub == 'orderbook':
+            return state.orderbook(market, int(query.get('depth') or 25))
+        if sub == 'trades':
+            return state.trades(market)
+        if sub == 'candles':
+            return state.candles(market)
+
+    if head == 'account':
+        if rest == ['volume']:
+            return {'updated': TIMESTAMP, 'volume30days': 0.0}
+
+        return {'subaccountId': None, 'accountId': str(uuid.UUID(int=1))}
+
+    if head == 'addresses':
+        if method == 'POST':
+            return {'status': 'REQUESTED', 'currencySymbol': body.get('currencySymbol'), 'cryptoAddress': None, 'cryptoAddressTag': None}
+
+        addresses = [{'status': 'PROVISIONED', 'currencySymbol': c, 'cryptoAddress': 'addr-' + c, 'cryptoAddressTag': None} for c in ['BTC', 'ETH']]
+
+        return addresses if not rest else next((a for a in addresses if a['currencySymbol'] == rest[0]), None) or _raise(404, 'NOT_FOUND')
+
+    if head == 'balances':
+        if not rest:
+            return list(state.balances.values())
+
+        return state.balances.get(rest[0]) or _raise(404, 'CURRENCY_DOES_NOT_EXIST')
+
+    if head in ['deposits', 'withdrawals']:
+        items = state.deposits if head == 'deposits' else state.withdrawals
+
+        # Creating a withdrawal (POST to the collection) is not mocked
+        if not rest:
+            raise MockError(404, 'NOT_FOUND')
+        if rest[0] in ['open', 'closed']:
+            return []
+        if rest[0] == 'ByTxId':
+            return [i for i in items.values() if len(rest) > 1 and i.get('txId') == rest[1]]
+
+        return items.get(rest[0]) or _raise(404, 'NOT_FOUND')
+
+    if head == 'orders':
+        if method == 'POST':
+            return state.create_order(body)
+
+        if rest == ['open']:
+            orders = [o for o in state.orders.values() if o['status'] == 'OPEN']
+
+            if method == 'DELETE':
+                return [{'id': o['id'], 'statusCode': 'SUCCESS', 'result': state.cancel_order(o['id'])} for o in orders if query.get('marketSymbol') in [None, o['marketSymbol']]]
+
+            return [o for o in orders if query.get('marketSymbol') in [None, o['marketSymbol']]]
+
+        if rest == ['closed']:
+            return [o for o in state.orders.values() if o['status'] == 'CLOSED' and query.get('marketSymbol') in [None, o['marketSymbol']]]
+
+        if not rest:
+            raise MockError(404, 'NOT_FOUND')
+
+        if method == 'DELETE':
+            return state.cancel_order(rest[0])
+
+        return state.orders.get(rest[0]) or _raise(404, 'NOT_FOUND')
+
+    if head == 'conditional-orders':
+        if method == 'POST':
+            return state.create_conditional_order(body)
+
+        if rest in [['open'], ['closed']]:
+            status_open = rest == ['open']
+
+            return [o for o in state.conditional_orders.values() if (o['status'] == 'OPEN') == status_open and query.get('marketSymbol') in [None, o['marketSymbol']]]
+
+        if not rest:
+            raise MockError(404, 'NOT_FOUND')
+
+        if method == 'DELETE':
+            return state.cancel_conditional_order(rest[0])
+
+        return state.conditional_orders.get(rest[0]) or _raise(404, 'NOT_FOUND')
+
+    raise MockError(404, 'NOT_FOUND')
+
+def _route_v1(state: MockState, path: str, query: Dict) -> Any:
+    if path == 'public/getmarkets':
+        return [{'MarketCurrency': m['baseCurrencySymbol'], 'BaseCurrency': m['quoteCurrencySymbol'], 'MinTradeSize': m['minTradeSize'], 'MarketName': _legacy_name(m), 'IsActive': True} for m in state.markets]
+    if path == 'public/getcurrencies':
+        return [{'Currency': c['symbol'], 'CurrencyLong': c['name'], 'TxFee': c['txFee'], 'IsActive': True} for c in state.currencies]
+    if path == 'public/getmarketsummaries':
+        return [_legacy_summary(state, m) for m in state.markets]
+    if path == 'public/getmarketsummary':
+        return [_legacy_summary(state, _legacy_market(state, query))]
+    if path == 'public/getticker':
+        ticker = state.ticker(_legacy_market(state, query))
+
+        return {'Bid': ticker['bidRate'], 'Ask': ticker['askRate'], 'Last': ticker['lastTradeRate']}
+    if path == 'public/getorderbook':
+        book = state.orderbook(_legacy_market(state, query), 25)
+
+        return {'buy': [{'Quantity': e['quantity'], 'Rate': e['rate']} for e in book['bid']], 'sell': [{'Quantity': e['quantity'], 'Rate': e['rate']} for e in book['ask']]}
+    if path == 'public/getmarkethistory':
+        return [{'Id': i, 'TimeStamp': TIMESTAMP, 'Quantity': t['quantity'], 'Price': t['rate']} for i, t in enumerate(state.trades(_legacy_market(state, query)))]
+    if path in ['market/buylimit', 'market/selllimit']:
+        market = _legacy_market(state, query)
+        order = state.create_order({'marketSymbol': market['symbol'], 'direction': 'BUY' if 'buy' in path else 'SELL', 'type': 'LIMIT', 'quantity': float(query.get('quantity', 0)), 'limit': float(query.get('rate', 0)), 'timeInForce': 'GOOD_TIL_CANCELLED'})
+
+        return {'uuid': order['id']}
+    if path == 'market/cancel':
+        state.cancel_order(query.get('uuid'))
+
+        return None
+    if path in ['market/getopenorders', 'account/getorderhistory']:
+        status = 'OPEN' if path == 'market/getopenorders' else 'CLOSED'
+
+        return [{'OrderUuid': o['id'], 'Exchange': o['marketSymbol'], 'Quantity': o['quantity'], 'Limit': o['limit']} for o in state.orders.values() if o['status'] == status]
+    if path == 'account/getbalances':
+        return [{'Currency': b['currencySymbol'], 'Balance': b['total'], 'Available': b['available']} for b in state.balances.values()]
+    if path == 'account/getbalance':
+        balance = state.balances.get(query.get('currency')) or _raise(200, 'INVALID_CURRENCY')
+
+        return {'Currency': balance['currencySymbol'], 'Balance': balance['total'], 'Available': balance['available']}
+    if path == 'account/getdepositaddress':
+        return {'Currency': query.get('currency'), 'Address': 'addr-' + str(query.get('currency'))}
+    if path == 'account/withdraw':
+        return {'uuid': str(uuid.uuid4())}
+    if path == 'account/getorder':
+        order = state.orders.get(query.get('uuid')) or _raise(200, 'INVALID_ORDER')
+
+        return {'OrderUuid': order['id'], 'Exchange': order['marketSymbol'], 'Quantity': order['quantity'], 'IsOpen': order['status'] == 'OPEN'}
+    if path in ['account/getwithdrawalhistory', 'account/getdeposithistory']:
+        return []
+
+    raise MockError(200, 'INVALID_METHOD')
+
+def _route_v2(state: MockState, path: str, query: Dict) -> Any:
+    if path == 'pub/currencies/getbtcprice':
+        return {'bpi': {'USD': {'rate_float': 10000.0}}}
+    if path in ['pub/currencies/getcurrencies', 'pub/currencies/getwallethealth']:
+        return [{'Currency': c['symbol'], 'CurrencyLong': c['name'], 'TxFee': c['txFee'], 'IsActive': True} for c in state.currencies]
+    if path == 'pub/currencies/getcurrencyinfo':
+        for c in state.currencies:
+            if c['symbol'] == query.get('currencyName'):
+                return {'Currency': c['symbol'], 'CurrencyLong': c['name'], 'TxFee': c['txFee'], 'IsActive': True}
+
+        raise MockError(200, 'INVALID_CURRENCY')
+    if path == 'pub/markets/getmarketsummaries':
+        return [{'Market': {'MarketName': _legacy_name(m), 'MinTradeSize': m['minTradeSize']}, 'Summary': _legacy_summary(state, m)} for m in state.markets]
+    if path == 'pub/market/getmarketsummary':
+        return _legacy_summary(state, _legacy_market(state, query, 'marketName'))
+    if path in ['pub/market/getticks', 'pub/market/getlatesttick']:
+        return [{'O': c['open'], 'H': c['high'], 'L': c['low'], 'C': c['close'], 'V': c['volume'], 'T': c['startsAt'], 'BV': c['quoteVolume']} for c in state.candles(_legacy_market(state, query, 'marketName'))]
+    if path in ['auth/market/tradebuy', 'auth/market/tradesell']:
+        market = _legacy_market(state, query, 'marketName')
+        order = state.create_order({'marketSymbol': market['symbol'], 'direction': 'BUY' if 'buy' in path else 'SELL', 'type': query.get('OrderType', 'LIMIT'), 'quantity': float(query.get('Quantity', 0)), 'limit': float(query.get('Rate', 0)), 'timeInForce': 'GOOD_TIL_CANCELLED'})
+
+        return {'OrderId': order['id'], 'MarketName': _legacy_name(market), 'Quantity': order['quantity'], 'Rate': order['limit']}
+    if path == 'auth/market/tradecancel':
+        state.cancel_order(query.get('uuid'))
+
+        return None
+
+    raise MockError(200, 'INVALID_METHOD')
+
+def _legacy_name(market: Dict) -> str:
+    return market['quoteCurrencySymbol'] + '-' + market['baseCurrencySymbol']
+
+def _legacy_market(state: MockState, query: Dict, key: str = 'market') -> Dict:
+    quote, _, base = str(query.get(key)).partition('-')
+    market = state.markets_by_symbol.get(base + '-' + quote)
+
+    if market is None:
+        raise MockError(200, 'INVALID_MARKET')
+
+    return market
+
+def _legacy_summary(state: MockState, market: Dict) -> Dict:
+    summary = state.summary(market)
+    ticker = state.ticker(market)
+
+    return {
+        'MarketName': _legacy_name(market),
+        'High': summary['high'],
+        'Low': summary['low'],
+        'Volume': summary['volume'],
+        'Last': ticker['lastTradeRate'],
+        'BaseVolume': summary['quoteVolume'],
+        'TimeStamp': TIMESTAMP,
+        'Bid': ticker['bidRate'],
+        'Ask': ticker['askRate']
+    }
+
+def _raise(status_code: int, code: str):
+    raise MockError(status_code, code)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------------ Main --------------------------------------------------------------- #
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mock Bittrex v1/v2/v3 server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0)
+    parser.add_argument('--api-key', action='append', default=[], help='KEY:SECRET accepted for signed calls')
+    args = parser.parse_args()
+
+    server = MockBittrexServer(
+        host=args.host,
+        port=args.port,
+        api_keys=dict(k.split(':', 1) for k in args.api_key) if args.api_key else None,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate
+    )
+    print('Serving on', server.address)
+    server.start()
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,182 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading
+from concurrent.futures import Future
+from typing import Dict
+
+# Local
+from .order_tracker import OrderTracker, OrderEvent
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: OrderPoller ---------------------------------------------------------- #
+
+class OrderPoller:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        tracker: OrderTracker,
+        min_interval: float = 0.5,
+        max_interval: float = 8,
+        backoff: float = 2,
+        debug_level: int = 1
+    ):
+        """Futures of orders resolving once they are closed (filled, cancelled or expired), all served by one thread reconciling the tracker.
+        A round costs the same 2 requests however many orders are pending. After a round without any change the thread waits
+        'backoff' times longer (up to 'max_interval'), a change or a new future brings it back to 'min_interval'. Without pending futures it sleeps.
+
+        Arguments:
+            tracker {OrderTracker} -- tracker of the orders
+
+        Keyword Arguments:
+            min_interval {float} -- seconds between rounds while orders change (default: {0.5})
+
+            max_interval {float} -- seconds between rounds at most (default: {8})
+
+            backoff {float} -- factor of the interval after a round without changes (default: {2})
+
+            debug_level {int} -- prints the errors of failed rounds from 1 (default: {1})
+        """
+
+        self.tracker = tracker
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.debug_level = debug_level
+
+        self.__init_state()
+        tracker.add_listener(self._on_event)
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {k:v for k, v in self.__dict__.items() if not k.startswith('_OrderPoller__')}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def watch(self, order: Dict) -> Future:
+        """A future of the final state of 'order'
+
+        Arguments:
+            order {Dict} -- Order (eg. the response of 'post_order')
+
+        Returns:
+            Future -- resolves with the closed Order
+        """
+
+        future = Future()
+
+        with self.__condition:
+            self.__futures.setdefault(order['id'], []).append(future)
+            self.__interval = self.min_interval
+            self.__start()
+            self.__condition.notify_all()
+
+        tracked = self.tracker.order(order['id'])
+
+        # Outside the lock, a closed order resolves the future right away
+        if tracked is None:
+            self.tracker.track(order)
+        elif tracked.get('status') == 'CLOSED':
+            self.__resolve(tracked)
+
+        return future
+
+    def unwatch(self, future: Future) -> bool:
+        """Cancels a future of 'watch' and stops polling for it right away
+
+        Arguments:
+            future {Future} -- future returned by 'watch'
+
+        Returns:
+            bool -- False if it was resolved already
+        """
+
+        cancelled = future.cancel()
+
+        with self.__condition:
+            self.__futures = {order_id:[f for f in futures if f is not future] for order_id, futures in self.__futures.items()}
+            self.__futures = {order_id:futures for order_id, futures in self.__futures.items() if futures}
+            self.__condition.notify_all()
+
+        return cancelled
+
+    def pending(self) -> int:
+        with self.__condition:
+            return sum(len(futures) for futures in self.__futures.values())
+
+    def _on_event(self, event: OrderEvent, order: Dict) -> None:
+        with self.__condition:
+            self.__changed = True
+
+        if event != OrderEvent.PARTIAL_FILL:
+            self.__resolve(order)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__condition = threading.Condition()
+        self.__futures = {}
+        self.__changed = False
+        self.__interval = self.min_interval
+        self.__thread = None
+
+    def __resolve(self, order: Dict) -> None:
+        with self.__condition:
+            futures = self.__futures.pop(order['id'], [])
+
+        for future in futures:
+            # False if cancelled by the caller
+            if future.set_running_or_notify_cancel():
+                future.set_result(order)
+
+    def __start(self) -> None:
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = threading.Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                # Futures cancelled by their callers need no more rounds
+                self.__futures = {order_id:futures for order_id, futures in self.__futures.items() if not all(f.cancelled() for f in futures)}
+
+                while not self.__futures:
+                    self.__condition.wait()
+
+                start = time.monotonic()
+
+                # A new future brings the interval back to the minimum, cutting a long wait short
+                while self.__futures and time.monotonic() - start < self.__interval:
+                    self.__condition.wait(self.__interval - (time.monotonic() - start))
+
+                # Every future was unwatched while waiting
+                if not self.__futures:
+                    continue
+
+                self.__changed = False
+
+            try:
+                self.tracker.reconcile()
+            except Exception as e:
+                # One thread serves every pending future, a failed round must not end it
+                if self.debug_level >= 1:
+                    print('Order poller:', repr(e))
+
+            with self.__condition:
+                self.__interval = self.min_interval if self.__changed else min(self.__interval * self.backoff, self.max_interval)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,328 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import threading
+from collections import OrderedDict
+from enum import Enum
+from decimal import Decimal
+from typing import Optional, Dict, List, Callable, Union
+
+# Local
+from .errors import BittrexError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: OrderEvent ---------------------------------------------------------- #
+
+class OrderEvent(Enum):
+    PARTIAL_FILL = 'PARTIAL_FILL' # filled some more, still open
+    FILL         = 'FILL'         # closed, filled completely
+    CANCEL       = 'CANCEL'       # closed before filling completely (cancelled or expired), 'fillQuantity' tells what got filled
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: OrderTracker --------------------------------------------------------- #
+
+class OrderTracker:
+    # Closed order pages read per reconciliation at most, the rest is looked up one by one
+    __MAX_CLOSED_PAGES = 5
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        open_orders_loader: Optional[Callable[[], Optional[List[Dict]]]] = None,
+        closed_orders_loader: Optional[Callable[[Optional[str], int], Optional[List[Dict]]]] = None,
+        order_loader: Optional[Callable[[str], Optional[Dict]]] = None,
+        page_size: int = 200,
+        max_closed: int = 1000,
+        debug_level: int = 1
+    ):
+        """Local state of the orders posted through a client, reconciled with 2 requests instead of one per order:
+        the open orders show which tracked orders filled some more or left the open set, and the closed orders since the last
+        reconciliation (read from a cursor) give the final state of those that left. Only orders missing from both are looked up one by one.
+        Listeners get a PARTIAL_FILL, FILL or CANCEL event with the updated Order. Only the latest 'max_closed' closed orders are kept.
+        A BittrexV3 client fills in its own requests as missing loaders and tracks every order it posts.
+
+        Keyword Arguments:
+            open_orders_loader {Optional[Callable[[], Optional[List[Dict]]]]} -- returns the open Orders (default: {None})
+
+            closed_orders_loader {Optional[Callable[[Optional[str], int], Optional[List[Dict]]]]} -- returns a page of closed Orders, newest first, closed after the order of the id (previous page token) if given (default: {None})
+
+            order_loader {Optional[Callable[[str], Optional[Dict]]]} -- returns an Order by id (default: {None})
+
+            page_size {int} -- closed Orders per page (default: {200})
+
+            max_closed {int} -- closed Orders kept, the oldest are forgotten beyond (default: {1000})
+
+            debug_level {int} -- prints the errors of listeners and failed reconciliations from 1 (default: {1})
+        """
+
+        self.open_orders_loader = open_orders_loader
+        self.closed_orders_loader = closed_orders_loader
+        self.order_loader = order_loader
+        self.page_size = page_size
+        self.max_closed = max_closed
+        self.debug_level = debug_level
+
+        self.__orders = {}
+        self.__closed = OrderedDict()
+        self.__cursor = None
+        self.__listeners = []
+        self.__init_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+
+        for key in ['_OrderTracker__lock', '_OrderTracker__reconcile_lock', '_OrderTracker__stop', '_OrderTracker__thread']:
+            del state[key]
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def add_listener(self, listener: Callable[[OrderEvent, Dict], None]) -> None:
+        """Calls 'listener' with every event, on the thread that reconciles
+
+        Arguments:
+            listener {Callable[[OrderEvent, Dict], None]} -- called with the event and the updated Order
+        """
+
+        self.__listeners = self.__listeners + [listener]
+
+    def track(self, order: Dict) -> None:
+        """Starts tracking an order (eg. the response of 'post_order'), an order closed already emits its final event
+
+        Arguments:
+            order {Dict} -- Order
+        """
+
+        self.update(order)
+
+    def update(self, order: Dict) -> Optional[OrderEvent]:
+        """Applies a newer state of an order
+
+        Arguments:
+            order {Dict} -- Order
+
+        Returns:
+            Optional[OrderEvent] -- the event it emitted
+        """
+
+        with self.__lock:
+            previous = self.__orders.get(order['id'])
+
+            # Final states are final, a late open state can not bring an order back
+            if previous is not None and previous.get('status') == 'CLOSED':
+                return None
+
+            self.__orders[order['id']] = order
+            event = self.__event(previous, order)
+
+            if order.get('status') == 'CLOSED':
+                self.__remember_closed(order['id'])
+
+        if event is not None:
+            self.__emit(event, order)
+
+        return event
+
+    def order(self, order_id: str) -> Optional[Dict]:
+        return self.__orders.get(order_id)
+
+    def open_orders(self) -> List[Dict]:
+        return [order for order in list(self.__orders.values()) if order.get('status') != 'CLOSED']
+
+    def forget(self, order_id: str) -> None:
+        with self.__lock:
+            self.__orders.pop(order_id, None)
+            self.__closed.pop(order_id, None)
+
+    def forget_closed(self) -> None:
+        with self.__lock:
+            self.__orders = {order_id:order for order_id, order in self.__orders.items() if order.get('status') != 'CLOSED'}
+            self.__closed.clear()
+
+    def reconcile(self) -> bool:
+        """Brings the tracked open orders up to date, one reconciliation at a time (the background thread, a poller and callers share the cursor)
+
+        Returns:
+            bool -- False if the open orders could not be loaded
+        """
+
+        with self.__reconcile_lock:
+            return self.__reconcile()
+
+    def start(self, interval: float = 5) -> None:
+        """Reconciles every 'interval' seconds on a daemon thread
+
+        Keyword Arguments:
+            interval {float} -- seconds between reconciliations (default: {5})
+        """
+
+        if self.__thread is not None:
+            return
+
+        # A stop event of its own, so a thread stopped a moment ago (maybe still reconciling) ends instead of reconciling next to this one
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, args=(interval, self.__stop), daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the background reconciliations, waiting for one in progress
+
+        Keyword Arguments:
+            timeout {Optional[float]} -- seconds to wait for the thread at most, None for no limit (default: {None})
+        """
+
+        thread = self.__thread
+        self.__stop.set()
+        self.__thread = None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__lock = threading.Lock()
+        # Reentrant, a listener may reconcile again
+        self.__reconcile_lock = threading.RLock()
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def __run(self, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                self.__print_error('Order tracker:', e)
+
+    def __reconcile(self) -> bool:
+        if self.open_orders_loader is None:
+            return False
+
+        try:
+            open_orders = self.open_orders_loader()
+        except BittrexError:
+            return False
+
+        if open_orders is None:
+            return False
+
+        still_open = {order['id']:order for order in open_orders}
+        left = []
+
+        for order in self.open_orders():
+            current = still_open.get(order['id'])
+
+            if current is not None:
+                self.update(current)
+            else:
+                left.append(order['id'])
+
+        closed = self.__closed_since_cursor() if left or self.__cursor is None else {}
+
+        for order_id in left:
+            order = closed.get(order_id)
+
+            if order is None and self.order_loader is not None:
+                try:
+                    order = self.order_loader(order_id)
+                except BittrexError:
+                    order = None
+
+            if order is not None:
+                self.update(order)
+
+        return True
+
+    def __closed_since_cursor(self) -> Dict[str, Dict]:
+        closed = {}
+
+        if self.closed_orders_loader is None:
+            return closed
+
+        cursor = self.__cursor
+
+        for _ in range(self.__MAX_CLOSED_PAGES):
+            try:
+                page = self.closed_orders_loader(cursor, self.page_size)
+            except BittrexError:
+                page = None
+
+            if not page:
+                break
+
+            new = [order for order in page if order['id'] not in closed]
+
+            for order in new:
+                closed[order['id']] = order
+
+            # Newest first, the next page starts after the newest one seen
+            cursor = page[0]['id']
+
+            # Without a cursor only the latest page is read, it becomes the starting point
+            if self.__cursor is None or not new or len(page) < self.page_size:
+                break
+
+        self.__cursor = cursor
+
+        return closed
+
+    @classmethod
+    def __event(cls, previous: Optional[Dict], order: Dict) -> Optional[OrderEvent]:
+        filled = cls.__number(order.get('fillQuantity'))
+
+        if order.get('status') == 'CLOSED':
+            quantity = order.get('quantity')
+            complete = filled >= cls.__number(quantity) if quantity is not None else filled > 0
+
+            return OrderEvent.FILL if complete and filled > 0 else OrderEvent.CANCEL
+
+        if filled > (cls.__number(previous.get('fillQuantity')) if previous is not None else 0):
+            return OrderEvent.PARTIAL_FILL
+
+        return None
+
+    @staticmethod
+    def __number(value: Optional[Union[float, str, int]]) -> Decimal:
+        # Floats, decimal strings and ticks alike
+        return Decimal(str(value)) if value is not None else Decimal(0)
+
+    def __remember_closed(self, order_id: str) -> None:
+        # Closed orders stay a while, so late open states of them are ignored, then they go
+        self.__closed[order_id] = True
+        self.__closed.move_to_end(order_id)
+
+        while len(self.__closed) > self.max_closed:
+            self.__orders.pop(self.__closed.popitem(last=False)[0], None)
+
+    def __emit(self, event: OrderEvent, order: Dict) -> None:
+        # A failing listener must not fail the request that emitted (eg. an order already posted)
+        for listener in self.__listeners:
+            try:
+                listener(event, order)
+            except Exception as e:
+                self.__print_error('Order listener:', e)
+
+    def __print_error(self, prefix: str, e: Exception) -> None:
+        if self.debug_level >= 1:
+            print(prefix, repr(e))
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,284 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, random, heapq, threading
+from collections import deque
+from urllib.parse import urlsplit
+from typing import Optional, Dict, List, Union
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: _Proxy ------------------------------------------------------------ #
+
+class _Proxy:
+    __slots__ = ('host', 'latency', 'error_rate', 'samples', 'uses', 'ejected_until', 'ejections', 'index')
+
+    def __init__(self, host: str):
+        self.host = host
+        self.latency = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.uses = deque()
+        self.ejected_until = 0.0
+        self.ejections = 0
+        self.index = -1
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: ProxyPool ---------------------------------------------------------- #
+
+class ProxyPool:
+    # Random pairs tried before giving up, keeps the selection O(1) however many proxies are ejected or used up
+    __MAX_PICKS = 4
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        proxies: Union[List[str], str],
+        max_usage_per_interval: int = 20,
+        usage_interval: float = 60,
+        alpha: float = 0.2,
+        eject_error_rate: float = 0.5,
+        min_samples: int = 5,
+        eject_time: float = 30,
+        max_eject_time: float = 600
+    ):
+        """Thread-safe pool of proxies scored by their latency and error rate (exponentially weighted moving averages).
+        A proxy is picked by comparing two random ones (by score and the share of their usage budget left), so selection is O(1).
+        A proxy whose error rate reaches 'eject_error_rate' is ejected for 'eject_time' seconds (doubling with every ejection in a row, up to 'max_eject_time'),
+        then it is back on probation.
+
+        Arguments:
+            proxies {Union[List[str], str]} -- 'host:port', 'user:pass@host:port' or the same with a scheme
+
+        Keyword Arguments:
+            max_usage_per_interval {int} -- requests a proxy may send per 'usage_interval' (default: {20})
+
+            usage_interval {float} -- seconds (default: {60})
+
+            alpha {float} -- weight of the newest sample in the moving averages (default: {0.2})
+
+            eject_error_rate {float} -- error rate ejecting a proxy (default: {0.5})
+
+            min_samples {int} -- outcomes recorded before a proxy can be ejected (default: {5})
+
+            eject_time {float} -- seconds of the first ejection (default: {30})
+
+            max_eject_time {float} -- upper bound of an ejection in seconds (default: {600})
+        """
+
+        if isinstance(proxies, str):
+            proxies = [proxies]
+
+        self.max_usage_per_interval = max_usage_per_interval
+        self.usage_interval = usage_interval
+        self.alpha = alpha
+        self.eject_error_rate = eject_error_rate
+        self.min_samples = min_samples
+        self.eject_time = eject_time
+        self.max_eject_time = max_eject_time
+
+        self.__lock = threading.Lock()
+        self.__proxies = {}
+        self.__active = []
+        self.__ejected = []
+        self.__latency = None
+        self.__sequence = 0
+
+        for proxy in proxies:
+            host = self.host(proxy)
+
+            if host not in self.__proxies:
+                self.__proxies[host] = _Proxy(host)
+                self.__activate(self.__proxies[host])
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_ProxyPool__lock']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+        # Monotonic timestamps mean nothing in another process
+        for proxy in self.__proxies.values():
+            proxy.uses.clear()
+            proxy.ejected_until = 0.0
+
+        self.__recover(float('inf'))
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    @staticmethod
+    def host(proxy: str) -> str:
+        """The proxy without its scheme (and trailing path)
+
+        Arguments:
+            proxy {str} -- proxy
+
+        Returns:
+            str -- 'host:port' (with the credentials, if any)
+        """
+
+        return urlsplit(proxy if '://' in proxy else '//' + proxy).netloc
+
+    def acquire(self, exclude: Optional[str] = None) -> Optional[str]:
+        """Picks a proxy and counts the use against its budget
+
+        Keyword Arguments:
+            exclude {Optional[str]} -- host to avoid if there is any other (default: {None})
+
+        Returns:
+            Optional[str] -- host of the proxy, None if none is healthy with budget left
+        """
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__recover(now)
+
+            if not self.__active:
+                return None
+
+            proxy = None
+
+            for _ in range(self.__MAX_PICKS):
+                proxy = self.__better(self.__pick(now, exclude), self.__pick(now, exclude))
+
+                if proxy is not None:
+                    break
+
+            # No other proxy available, a second connection through the same one still helps
+            if proxy is None and exclude in self.__proxies:
+                proxy = self.__pick(now, None, self.__proxies[exclude])
+
+            if proxy is None:
+                return None
+
+            proxy.uses.append(now)
+
+            return proxy.host
+
+    def record(self, host: str, latency: float, success: bool) -> None:
+        """Records the outcome of a request sent through a proxy
+
+        Arguments:
+            host {str} -- host returned by 'acquire'
+
+            latency {float} -- seconds
+
+            success {bool} -- False if the proxy failed (connection error, timeout, bad gateway)
+        """
+
+        with self.__lock:
+            proxy = self.__proxies.get(host)
+
+            if proxy is None:
+                return
+
+            proxy.samples += 1
+            proxy.error_rate += self.alpha * ((0.0 if success else 1.0) - proxy.error_rate)
+
+            # A failure's latency is its timeout, it would only skew the average
+            if success:
+                proxy.latency = latency if proxy.latency is None else proxy.latency + self.alpha * (latency - proxy.latency)
+                self.__latency = latency if self.__latency is None else self.__latency + self.alpha * (latency - self.__latency)
+
+                if proxy.error_rate < self.eject_error_rate / 4:
+                    proxy.ejections = 0
+
+            if proxy.index >= 0 and proxy.samples >= self.min_samples and proxy.error_rate >= self.eject_error_rate:
+                self.__eject(proxy, time.monotonic())
+
+    def stats(self) -> Dict[str, Dict]:
+        """Health of every proxy
+
+        Returns:
+            Dict[str, Dict] -- per host: 'latency', 'error_rate', 'samples', 'uses' (within the interval) and 'ejected'
+        """
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__recover(now)
+
+            return {
+                host:{
+                    'latency':    proxy.latency,
+                    'error_rate': proxy.error_rate,
+                    'samples':    proxy.samples,
+                    'uses':       self.__uses(proxy, now),
+                    'ejected':    proxy.index < 0
+                }
+                for host, proxy in self.__proxies.items()
+            }
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __pick(self, now: float, exclude: Optional[str], proxy: Optional[_Proxy] = None) -> Optional[_Proxy]:
+        proxy = proxy or self.__active[random.randrange(len(self.__active))]
+
+        if proxy.host == exclude or self.__uses(proxy, now) >= self.max_usage_per_interval:
+            return None
+
+        return proxy
+
+    def __better(self, a: Optional[_Proxy], b: Optional[_Proxy]) -> Optional[_Proxy]:
+        if a is None or b is None:
+            return a or b
+
+        return a if self.__weight(a) >= self.__weight(b) else b
+
+    def __weight(self, proxy: _Proxy) -> float:
+        # Proxies without a latency yet are assumed to be average
+        latency = proxy.latency if proxy.latency is not None else (self.__latency or 1.0)
+        budget = 1 - len(proxy.uses) / self.max_usage_per_interval
+
+        return (1 - proxy.error_rate) * budget / max(latency, 0.001)
+
+    def __uses(self, proxy: _Proxy, now: float) -> int:
+        while proxy.uses and now - proxy.uses[0] >= self.usage_interval:
+            proxy.uses.popleft()
+
+        return len(proxy.uses)
+
+    def __activate(self, proxy: _Proxy) -> None:
+        proxy.index = len(self.__active)
+        self.__active.append(proxy)
+
+    def __eject(self, proxy: _Proxy, now: float) -> None:
+        # Swap with the last one, so removal is O(1)
+        last = self.__active.pop()
+
+        if last is not proxy:
+            self.__active[proxy.index] = last
+            last.index = proxy.index
+
+        proxy.index = -1
+        proxy.ejected_until = now + min(self.eject_time * 2 ** proxy.ejections, self.max_eject_time)
+        proxy.ejections += 1
+        self.__sequence += 1
+
+        heapq.heappush(self.__ejected, (proxy.ejected_until, self.__sequence, proxy))
+
+    def __recover(self, now: float) -> None:
+        while self.__ejected and self.__ejected[0][0] <= now:
+            proxy = heapq.heappop(self.__ejected)[2]
+
+            # On probation, a couple of failures eject it again
+            proxy.error_rate = min(proxy.error_rate, self.eject_error_rate / 2)
+            self.__activate(proxy)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
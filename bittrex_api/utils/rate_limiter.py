@@ -0,0 +1,125 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading
+from typing import Optional, Dict
+
+# Local
+from .deadline import Deadline
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: RateLimiter --------------------------------------------------------- #
+
+class RateLimiter:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        calls: int = 60,
+        period: float = 60,
+        burst: Optional[int] = None
+    ):
+        """Thread-safe token bucket. Share one instance between the clients using the same api key (or ip).
+
+        Keyword Arguments:
+            calls {int} -- calls allowed per 'period' (default: {60})
+
+            period {float} -- seconds (default: {60})
+
+            burst {Optional[int]} -- calls allowed at once after being idle (default: {calls})
+        """
+
+        self.rate = calls / period
+        self.burst = burst or calls
+
+        self.__lock = threading.Lock()
+        self.__tokens = float(self.burst)
+        self.__updated = time.monotonic()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_RateLimiter__lock']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+        self.__updated = time.monotonic()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def acquire(self, deadline: Optional[Deadline] = None, min_time_left: float = 0) -> bool:
+        """Takes a token, waiting for one if needed
+
+        Keyword Arguments:
+            deadline {Optional[Deadline]} -- gives up (without waiting or taking a token) if the wait would leave less than 'min_time_left' (default: {None})
+
+            min_time_left {float} -- seconds that have to be left of 'deadline' after the wait (default: {0})
+
+        Returns:
+            bool -- False if it gave up because of the deadline
+        """
+
+        with self.__lock:
+            self.__refill()
+            wait = 0 if self.__tokens >= 1 else (1 - self.__tokens) / self.rate
+
+            if deadline is not None and deadline.remaining() - wait < min_time_left:
+                return False
+
+            # Going below zero reserves a future token, so waiters are served in order
+            self.__tokens -= 1
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return True
+
+    def try_acquire(self) -> bool:
+        """Takes a token if one is available right now
+
+        Returns:
+            bool -- whether a token was taken
+        """
+
+        with self.__lock:
+            self.__refill()
+
+            if self.__tokens < 1:
+                return False
+
+            self.__tokens -= 1
+
+            return True
+
+    def available(self) -> float:
+        """Tokens available right now, negative while waiters have reserved future ones
+
+        Returns:
+            float -- tokens
+        """
+
+        with self.__lock:
+            self.__refill()
+
+            return self.__tokens
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        self.__tokens = min(self.__tokens + (now - self.__updated) * self.rate, self.burst)
+        self.__updated = now
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
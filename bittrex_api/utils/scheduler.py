@@ -0,0 +1,201 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading
+from enum import IntEnum
+from typing import Optional, Dict
+
+# Local
+from .deadline import Deadline
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: Priority ----------------------------------------------------------- #
+
+class Priority(IntEnum):
+    ORDER       = 0 # creating and cancelling orders, withdrawals
+    ACCOUNT     = 1 # balances, open orders, order lookups
+    MARKET_DATA = 2 # tickers, orderbooks, summaries
+    BULK        = 3 # history backfills, hedged duplicates
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# Share of the burst a class has to leave to the classes above it
+DEFAULT_RESERVES = {
+    Priority.ORDER:       0.0,
+    Priority.ACCOUNT:     0.1,
+    Priority.MARKET_DATA: 0.2,
+    Priority.BULK:        0.5
+}
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: PriorityScheduler ------------------------------------------------------ #
+
+class PriorityScheduler:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        calls: int = 60,
+        period: float = 60,
+        burst: Optional[int] = None,
+        reserves: Optional[Dict[Priority, float]] = None
+    ):
+        """Token bucket handing out the rate budget by priority. While a call of a class waits, no lower class gets a token,
+        and a class only takes a token if at least its reserve (a share of the burst) stays for the classes above it.
+        So order traffic always finds budget, and bulk work only runs on what is left. Use it instead of a RateLimiter.
+
+        Keyword Arguments:
+            calls {int} -- calls allowed per 'period' (default: {60})
+
+            period {float} -- seconds (default: {60})
+
+            burst {Optional[int]} -- calls allowed at once after being idle (default: {calls})
+
+            reserves {Optional[Dict[Priority, float]]} -- share of the burst each class has to leave to the ones above it (default: {DEFAULT_RESERVES})
+        """
+
+        self.rate = calls / period
+        self.burst = burst or calls
+        self.reserves = DEFAULT_RESERVES if reserves is None else reserves
+
+        self.__init_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {k:v for k, v in self.__dict__.items() if not k.startswith('_PriorityScheduler__')}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def acquire(self, priority: Priority = Priority.MARKET_DATA, deadline: Optional[Deadline] = None, min_time_left: float = 0) -> bool:
+        """Takes a token for a call of 'priority', waiting for its turn if needed
+
+        Keyword Arguments:
+            priority {Priority} -- class of the call (default: {Priority.MARKET_DATA})
+
+            deadline {Optional[Deadline]} -- gives up once waiting any longer would leave less than 'min_time_left' (default: {None})
+
+            min_time_left {float} -- seconds that have to be left of 'deadline' after the wait (default: {0})
+
+        Returns:
+            bool -- False if it gave up because of the deadline
+        """
+
+        start = time.monotonic()
+
+        with self.__condition:
+            self.__queued[priority] += 1
+
+            try:
+                while True:
+                    self.__refill()
+                    wait = max((self.__floor(priority) + 1 - self.__tokens) / self.rate, 0)
+
+                    if wait == 0 and not self.__higher_queued(priority):
+                        self.__tokens -= 1
+                        self.__record(priority, time.monotonic() - start)
+
+                        return True
+
+                    if deadline is not None and deadline.remaining() - wait < min_time_left:
+                        return False
+
+                    # Woken early whenever a waiter leaves the queue, a higher class may have been served
+                    timeout = wait or None
+
+                    if deadline is not None:
+                        timeout = min(timeout or float('inf'), deadline.remaining() - min_time_left)
+
+                    self.__condition.wait(timeout=timeout)
+            finally:
+                self.__queued[priority] -= 1
+                self.__condition.notify_all()
+
+    def try_acquire(self, priority: Priority = Priority.BULK) -> bool:
+        """Takes a token if 'priority' may have one right now
+
+        Keyword Arguments:
+            priority {Priority} -- class of the call (default: {Priority.BULK})
+
+        Returns:
+            bool -- whether a token was taken
+        """
+
+        with self.__condition:
+            self.__refill()
+
+            if self.__tokens - 1 < self.__floor(priority) or self.__higher_queued(priority):
+                return False
+
+            self.__tokens -= 1
+            self.__record(priority, 0)
+
+            return True
+
+    def stats(self) -> Dict[str, Dict]:
+        """Queue depth and wait times per class
+
+        Returns:
+            Dict[str, Dict] -- per priority name: 'queued' (waiting now), 'served', 'wait_avg' and 'wait_max' (seconds)
+        """
+
+        with self.__condition:
+            return {
+                priority.name:{
+                    'queued':   self.__queued[priority],
+                    'served':   self.__served[priority],
+                    'wait_avg': self.__wait_total[priority] / self.__served[priority] if self.__served[priority] else 0.0,
+                    'wait_max': self.__wait_max[priority]
+                }
+                for priority in Priority
+            }
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self) -> None:
+        self.__condition = threading.Condition()
+        self.__tokens = float(self.burst)
+        self.__updated = time.monotonic()
+        self.__queued = {priority:0 for priority in Priority}
+        self.__served = {priority:0 for priority in Priority}
+        self.__wait_total = {priority:0.0 for priority in Priority}
+        self.__wait_max = {priority:0.0 for priority in Priority}
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        self.__tokens = min(self.__tokens + (now - self.__updated) * self.rate, self.burst)
+        self.__updated = now
+
+    def __floor(self, priority: Priority) -> float:
+        # Never out of reach, even with a burst too small for the reserve
+        return min(self.reserves.get(priority, 0) * self.burst, self.burst - 1)
+
+    def __higher_queued(self, priority: Priority) -> bool:
+        return any(self.__queued[p] for p in Priority if p < priority)
+
+    def __record(self, priority: Priority, wait: float) -> None:
+        self.__served[priority] += 1
+        self.__wait_total[priority] += wait
+        self.__wait_max[priority] = max(self.__wait_max[priority], wait)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,311 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import sys, time, threading
+from typing import Optional, Dict, List, Callable
+
+# Local
+from .errors import BittrexError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: Market ------------------------------------------------------------ #
+
+class Market:
+    __slots__ = ('symbol', 'legacy_name', 'base', 'quote', 'min_trade_size', 'precision', 'status', 'data')
+
+    def __init__(self, data: Dict):
+        """A market of the v3 api ('symbol' is 'BASE-QUOTE', eg. 'XRP-BTC'), with its v1/v2 name ('QUOTE-BASE', eg. 'BTC-XRP') precomputed
+
+        Arguments:
+            data {Dict} -- Market, as returned by 'get_markets'
+        """
+
+        self.base = sys.intern(data['baseCurrencySymbol'])
+        self.quote = sys.intern(data['quoteCurrencySymbol'])
+        self.symbol = sys.intern(data.get('symbol') or self.base + '-' + self.quote)
+        self.legacy_name = sys.intern(self.quote + '-' + self.base)
+        self.update(data)
+
+    def __repr__(self) -> str:
+        return 'Market({})'.format(self.symbol)
+
+
+    # ------------------------------------------------------- Public properties ----------------------------------------------------- #
+
+    @property
+    def v1_name(self) -> str:
+        return self.legacy_name
+
+    @property
+    def v2_name(self) -> str:
+        return self.legacy_name
+
+    @property
+    def v3_name(self) -> str:
+        return self.symbol
+
+    @property
+    def online(self) -> bool:
+        return self.status == 'ONLINE'
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def update(self, data: Dict) -> None:
+        self.min_trade_size = data.get('minTradeSize')
+        self.precision = data.get('precision')
+        self.status = data.get('status')
+        self.data = data
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SymbolRegistry -------------------------------------------------------- #
+
+class SymbolRegistry:
+    # Names converted without the market being known, bounded so arbitrary input can not grow it forever
+    __MAX_CONVERTED = 10000
+
+    # Seconds between attempts of 'ensure_loaded' while the registry stays empty
+    __LOAD_RETRY_INTERVAL = 60
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        markets_loader: Optional[Callable[[], Optional[List[Dict]]]] = None,
+        currencies_loader: Optional[Callable[[], Optional[List[Dict]]]] = None
+    ):
+        """Market and currency metadata loaded once and kept in memory: one Market object per market, looked up in O(1) by its v3 ('XRP-BTC')
+        or its v1/v2 ('BTC-XRP') name, indexed by base and quote currency. Refreshes replace the maps at once, so lookups never lock.
+        A BittrexV3 client fills in its own 'get_markets' and 'get_curencies' as missing loaders.
+
+        Keyword Arguments:
+            markets_loader {Optional[Callable[[], Optional[List[Dict]]]]} -- returns the v3 Markets (default: {None})
+
+            currencies_loader {Optional[Callable[[], Optional[List[Dict]]]]} -- returns the v3 Currencies (default: {None})
+        """
+
+        self.markets_loader = markets_loader
+        self.currencies_loader = currencies_loader
+
+        self.__markets = {}
+        self.__legacy_names = {}
+        self.__by_base = {}
+        self.__by_quote = {}
+        self.__currencies = {}
+        self.__converted = {}
+        self.__load_attempted_at = None
+        self.__init_refresh_state()
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+
+        for key in ['_SymbolRegistry__lock', '_SymbolRegistry__stop', '_SymbolRegistry__thread']:
+            del state[key]
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_refresh_state()
+
+
+    # ------------------------------------------------------- Public properties ----------------------------------------------------- #
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self.__markets)
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def load(self, markets: List[Dict], currencies: Optional[List[Dict]] = None) -> None:
+        """Replaces the metadata. Markets already known keep their object, updated in place.
+
+        Arguments:
+            markets {List[Dict]} -- v3 Markets
+
+        Keyword Arguments:
+            currencies {Optional[List[Dict]]} -- v3 Currencies, the known ones are kept if None (default: {None})
+        """
+
+        with self.__lock:
+            by_symbol, legacy_names, by_base, by_quote = {}, {}, {}, {}
+
+            for data in markets:
+                market = self.__markets.get(data.get('symbol'))
+
+                if market is None:
+                    market = Market(data)
+                else:
+                    market.update(data)
+
+                by_symbol[market.symbol] = market
+                legacy_names[market.legacy_name] = market
+                by_base.setdefault(market.base, []).append(market)
+                by_quote.setdefault(market.quote, []).append(market)
+
+            # Every map is swapped in whole, readers see either the old or the new one
+            self.__markets = by_symbol
+            self.__legacy_names = legacy_names
+            self.__by_base = by_base
+            self.__by_quote = by_quote
+
+            if currencies is not None:
+                self.__currencies = {sys.intern(currency['symbol']):currency for currency in currencies}
+
+    def refresh(self) -> bool:
+        """Reloads the metadata with the loaders
+
+        Returns:
+            bool -- False if there is no markets loader or it failed
+        """
+
+        if self.markets_loader is None:
+            return False
+
+        try:
+            markets = self.markets_loader()
+
+            if markets is None:
+                return False
+
+            currencies = self.currencies_loader() if self.currencies_loader is not None else None
+        except BittrexError:
+            return False
+
+        self.load(markets, currencies)
+
+        return True
+
+    def ensure_loaded(self) -> bool:
+        """Loads the metadata if nothing is loaded yet, trying at most once a minute while the loader fails
+
+        Returns:
+            bool -- whether the registry is loaded
+        """
+
+        if self.loaded or self.markets_loader is None:
+            return self.loaded
+
+        if self.__load_attempted_at is not None and time.monotonic() - self.__load_attempted_at < self.__LOAD_RETRY_INTERVAL:
+            return False
+
+        self.__load_attempted_at = time.monotonic()
+
+        return self.refresh()
+
+    def start(self, interval: float = 3600) -> None:
+        """Loads now and then every 'interval' seconds on a daemon thread
+
+        Keyword Arguments:
+            interval {float} -- seconds between refreshes (default: {3600})
+        """
+
+        if self.__thread is not None:
+            return
+
+        # A stop event of its own, so a thread stopped a moment ago (maybe still refreshing) ends instead of refreshing next to this one
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, args=(interval, self.__stop), daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the background refreshes, waiting for a refresh in progress
+
+        Keyword Arguments:
+            timeout {Optional[float]} -- seconds to wait for the thread at most, None for no limit (default: {None})
+        """
+
+        thread = self.__thread
+        self.__stop.set()
+        self.__thread = None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def market(self, name: str, legacy: Optional[bool] = None) -> Optional[Market]:
+        """The market of a v3 ('XRP-BTC') or v1/v2 ('BTC-XRP') name
+
+        Arguments:
+            name {str} -- market name
+
+        Keyword Arguments:
+            legacy {Optional[bool]} -- whether 'name' is a v1/v2 name, None for either (the v3 one wins if a name is both) (default: {None})
+
+        Returns:
+            Optional[Market] -- market, None if unknown (or not loaded yet)
+        """
+
+        if legacy is None:
+            return self.__markets.get(name) or self.__legacy_names.get(name)
+
+        return (self.__legacy_names if legacy else self.__markets).get(name)
+
+    def markets(self) -> List[Market]:
+        return list(self.__markets.values())
+
+    def by_base(self, currency: str) -> List[Market]:
+        return list(self.__by_base.get(currency, []))
+
+    def by_quote(self, currency: str) -> List[Market]:
+        return list(self.__by_quote.get(currency, []))
+
+    def currency(self, symbol: str) -> Optional[Dict]:
+        return self.__currencies.get(symbol)
+
+    def reversed_name(self, name: str) -> str:
+        """The name in the other convention ('BTC-XRP' <-> 'XRP-BTC'), looked up for known markets instead of split and joined again
+
+        Arguments:
+            name {str} -- market name
+
+        Returns:
+            str -- reversed name
+        """
+
+        market = self.__legacy_names.get(name)
+
+        if market is not None:
+            return market.symbol
+
+        market = self.__markets.get(name)
+
+        if market is not None:
+            return market.legacy_name
+
+        converted = self.__converted.get(name)
+
+        if converted is None:
+            if len(self.__converted) >= self.__MAX_CONVERTED:
+                self.__converted = {}
+
+            converted = '-'.join(name.split('-')[::-1])
+            self.__converted[name] = converted
+
+        return converted
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_refresh_state(self) -> None:
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def __run(self, interval: float, stop: threading.Event) -> None:
+        while not stop.is_set():
+            self.refresh()
+            stop.wait(interval)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,172 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import dbm, json, threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+# Statuses a resource never leaves
+TERMINAL_STATUSES = {
+    'order':             ['CLOSED'],
+    'conditional_order': ['COMPLETED', 'CANCELLED', 'FAILED'],
+    'deposit':           ['COMPLETED', 'ORPHANED', 'INVALIDATED'],
+    'withdrawal':        ['COMPLETED', 'CANCELLED']
+}
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: TerminalCache --------------------------------------------------------- #
+
+class TerminalCache:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        path: Optional[str] = None
+    ):
+        """Orders, conditional orders, deposits and withdrawals in a final status (they never change again), kept by id without expiry.
+        The latest 'max_size' are in memory, and with a 'path' every one is also written to a dbm file, so it outlives the process.
+        The file is opened on first use and written by this process only: a copy unpickled elsewhere (eg. a worker process) reads it
+        if the dbm flavour allows (falling back to memory only), and never writes it.
+
+        Keyword Arguments:
+            max_size {int} -- resources kept in memory (default: {10000})
+
+            path {Optional[str]} -- dbm file of the on-disk store, None for memory only (default: {None})
+        """
+
+        self.max_size = max_size
+        self.path = path
+
+        self.__init_state(read_only=False)
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {k:v for k, v in self.__dict__.items() if not k.startswith('_TerminalCache__')}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__init_state(read_only=True)
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    @staticmethod
+    def is_terminal(kind: str, resource: Optional[Dict]) -> bool:
+        return isinstance(resource, dict) and 'id' in resource and resource.get('status') in TERMINAL_STATUSES[kind]
+
+    def get(self, kind: str, resource_id: str) -> Optional[Dict]:
+        """A cached resource
+
+        Arguments:
+            kind {str} -- 'order', 'conditional_order', 'deposit' or 'withdrawal'
+
+            resource_id {str} -- id
+
+        Returns:
+            Optional[Dict] -- the resource, None if not cached
+        """
+
+        key = self.__key(kind, resource_id)
+
+        with self.__lock:
+            resource = self.__memory.get(key)
+
+            if resource is not None:
+                self.__memory.move_to_end(key)
+            else:
+                db = self.__store()
+
+                if db is not None and key.encode() in db:
+                    resource = json.loads(db[key.encode()].decode())
+                    self.__remember(key, resource)
+
+        return dict(resource) if resource is not None else None
+
+    def put(self, kind: str, resource: Optional[Dict]) -> bool:
+        """Caches a resource if its status is final
+
+        Arguments:
+            kind {str} -- 'order', 'conditional_order', 'deposit' or 'withdrawal'
+
+            resource {Optional[Dict]} -- the resource
+
+        Returns:
+            bool -- whether it was cached
+        """
+
+        if not self.is_terminal(kind, resource):
+            return False
+
+        key = self.__key(kind, resource['id'])
+
+        with self.__lock:
+            if key in self.__memory:
+                self.__memory.move_to_end(key)
+
+                return True
+
+            self.__remember(key, dict(resource))
+            db = self.__store()
+
+            if db is not None and not self.__read_only:
+                db[key.encode()] = json.dumps(resource).encode()
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self.__memory)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__db is not None:
+                self.__db.close()
+                self.__db = None
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __init_state(self, read_only: bool) -> None:
+        self.__lock = threading.Lock()
+        self.__memory = OrderedDict()
+        self.__read_only = read_only
+        self.__db = None
+        self.__db_opened = False
+
+    def __store(self) -> Optional[Any]:
+        # Opened on first use, in the process using it
+        if not self.__db_opened and self.path:
+            self.__db_opened = True
+
+            try:
+                self.__db = dbm.open(self.path, 'r' if self.__read_only else 'c')
+            except dbm.error:
+                # Missing, or locked by the writing process
+                self.__db = None
+
+        return self.__db
+
+    def __remember(self, key: str, resource: Dict) -> None:
+        self.__memory[key] = resource
+
+        while len(self.__memory) > self.max_size:
+            self.__memory.popitem(last=False)
+
+    @staticmethod
+    def __key(kind: str, resource_id: str) -> str:
+        return kind + ':' + resource_id
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
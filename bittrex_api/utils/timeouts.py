@@ -0,0 +1,86 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+from urllib.parse import urlsplit
+from typing import Optional, List, Tuple
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines --------------------------------------------------------------- #
+
+Timeout = Tuple[float, float]
+
+# (method or None for any, path fragment, (connect, read)), the first match wins
+DEFAULT_TIMEOUTS = [
+    # Order entry waits longer, abandoning a create the engine is still working on only leads to a lookup
+    ('POST',   '/orders',             (3.05, 15)),
+    ('DELETE', '/orders',             (3.05, 15)),
+    ('POST',   '/conditional-orders', (3.05, 15)),
+    ('DELETE', '/conditional-orders', (3.05, 15)),
+    (None,     '/ping',               (3.05, 2)),
+
+    # Public market data (v3, v1, v2)
+    (None,     '/markets',            (3.05, 5)),
+    (None,     '/public/',            (3.05, 5)),
+    (None,     '/pub/',               (3.05, 5))
+]
+
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: TimeoutPolicy -------------------------------------------------------- #
+
+class TimeoutPolicy:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        timeouts: Optional[List[Tuple[Optional[str], str, Timeout]]] = None,
+        default: Timeout = DEFAULT_TIMEOUT,
+        min_attempt_time: float = 0.1
+    ):
+        """Connect and read timeouts per endpoint
+
+        Keyword Arguments:
+            timeouts {Optional[List[Tuple[Optional[str], str, Timeout]]]} -- (method or None for any, url path fragment, (connect, read)) rules, the first match wins (default: {DEFAULT_TIMEOUTS})
+
+            default {Timeout} -- (connect, read) of the requests no rule matches (default: {DEFAULT_TIMEOUT})
+
+            min_attempt_time {float} -- seconds an attempt needs at least, a deadline with less left fails without trying (default: {0.1})
+        """
+
+        self.timeouts = DEFAULT_TIMEOUTS if timeouts is None else timeouts
+        self.default = default
+        self.min_attempt_time = min_attempt_time
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def timeout(self, method: str, url: str) -> Timeout:
+        """(connect, read) timeout of a request
+
+        Arguments:
+            method {str} -- http method
+
+            url {str} -- url of the request
+
+        Returns:
+            Timeout -- (connect, read) in seconds
+        """
+
+        path = urlsplit(url).path
+
+        for rule_method, fragment, timeout in self.timeouts:
+            if (rule_method is None or rule_method == method) and fragment in path:
+                return timeout
+
+        return self.default
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,411 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, threading, random
+from collections import deque
+from typing import Optional, Dict, List, Callable, Any
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------- class: Span ------------------------------------------------------------- #
+
+class Span:
+    __slots__ = ('name', 'path', 'offset', 'duration')
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        offset: float,
+        duration: float
+    ):
+        self.name = name
+        self.path = path
+        self.offset = offset
+        self.duration = duration
+
+    def __repr__(self) -> str:
+        return 'Span({}, {:.6f}s)'.format(self.path, self.duration)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: Trace ------------------------------------------------------------- #
+
+class Trace:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        tracer: 'Tracer',
+        name: str,
+        tags: Optional[Dict] = None
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.tags = tags or {}
+        self.spans = []
+        self.duration = None
+
+        self.__stack = [name]
+        self.__start = time.perf_counter()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def span(self, name: str) -> '_SpanContext':
+        """Times the wrapped block as a stage of this trace
+
+        Arguments:
+            name {str} -- name of the stage
+
+        Returns:
+            _SpanContext -- context manager recording the stage on exit
+        """
+
+        return _SpanContext(self, name)
+
+    def tag(self, **tags) -> None:
+        self.tags.update(tags)
+
+    def finish(self, **tags) -> None:
+        """Closes the trace and hands it to the collectors of the tracer. Finishing twice is a no-op.
+        """
+
+        if self.duration is not None:
+            return
+
+        self.duration = time.perf_counter() - self.__start
+        self.tags.update(tags)
+        self.tracer._finish(self)
+
+    def stages(self) -> Dict[str, float]:
+        """Total seconds spent in each stage, keyed by stage name
+
+        Returns:
+            Dict[str, float] -- stage durations
+        """
+
+        stages = {}
+
+        for span in self.spans:
+            stages[span.name] = stages.get(span.name, 0) + span.duration
+
+        return stages
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def _enter(self, name: str) -> float:
+        self.__stack.append(name)
+
+        return time.perf_counter()
+
+    def _exit(self, name: str, start: float) -> None:
+        end = time.perf_counter()
+        self.spans.append(Span(name, ';'.join(self.__stack), start - self.__start, end - start))
+        self.__stack.pop()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: _SpanContext --------------------------------------------------------- #
+
+class _SpanContext:
+    __slots__ = ('trace', 'name', 'start')
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = self.trace._enter(self.name)
+
+        return self
+
+    def __exit__(self, *args):
+        self.trace._exit(self.name, self.start)
+
+        return False
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: _NullTrace ---------------------------------------------------------- #
+
+class _NullSpanContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _NullTrace:
+    __slots__ = ()
+
+    name = None
+    tags = None
+    spans = ()
+    duration = None
+
+    def span(self, name: str) -> _NullSpanContext:
+        return _NULL_SPAN_CONTEXT
+
+    def tag(self, **tags) -> None:
+        pass
+
+    def finish(self, **tags) -> None:
+        pass
+
+    def stages(self) -> Dict[str, float]:
+        return {}
+
+
+_NULL_SPAN_CONTEXT = _NullSpanContext()
+NULL_TRACE = _NullTrace()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: Collector ----------------------------------------------------------- #
+
+class Collector:
+    """Base class for trace collectors. Subclasses override the hooks they care about."""
+
+    def collect(self, trace: Trace) -> None:
+        """Called with every finished trace"""
+
+    def event(self, name: str, data: Dict) -> None:
+        """Called with every event emitted through the tracer"""
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: Tracer ------------------------------------------------------------ #
+
+class Tracer:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(self, *collectors: Collector):
+        """Hook interface for timing the stages of a request. Without collectors every call is a no-op.
+
+        Arguments:
+            collectors {Collector} -- receivers of finished traces and events
+        """
+
+        self.collectors = list(collectors)
+
+
+    # ------------------------------------------------------- Public properties ----------------------------------------------------- #
+
+    @property
+    def enabled(self) -> bool:
+        return len(self.collectors) > 0
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def add_collector(self, collector: Collector) -> None:
+        self.collectors = self.collectors + [collector]
+
+    def trace(self, name: str, **tags) -> Trace:
+        """Starts a new trace
+
+        Arguments:
+            name {str} -- name of the traced request (kept low-cardinality, it is the root of every span path)
+
+        Returns:
+            Trace -- the started trace (a shared no-op trace if there are no collectors)
+        """
+
+        if not self.collectors:
+            return NULL_TRACE
+
+        return Trace(self, name, tags)
+
+    def event(self, name: str, **data) -> None:
+        """Forwards an event (eg. a state change) to the collectors
+
+        Arguments:
+            name {str} -- name of the event
+        """
+
+        for collector in self.collectors:
+            collector.event(name, data)
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def _finish(self, trace: Trace) -> None:
+        for collector in self.collectors:
+            collector.collect(trace)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SlowRequestLog -------------------------------------------------------- #
+
+class SlowRequestLog(Collector):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        max_entries: int = 100,
+        callback: Optional[Callable[[Dict], None]] = None
+    ):
+        """Keeps the stage breakdown of requests slower than the threshold
+
+        Keyword Arguments:
+            threshold {float} -- seconds above which a request counts as slow (default: {1.0})
+
+            max_entries {int} -- number of most recent slow requests to keep (default: {100})
+
+            callback {Optional[Callable[[Dict], None]]} -- called with every new entry (default: {None})
+        """
+
+        self.threshold = threshold
+        self.callback = callback
+        self.__entries = deque(maxlen=max_entries)
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def collect(self, trace: Trace) -> None:
+        if trace.duration < self.threshold:
+            return
+
+        entry = {
+            'name': trace.name,
+            'duration': trace.duration,
+            'stages': trace.stages(),
+            'tags': trace.tags
+        }
+        self.__entries.append(entry)
+
+        if self.callback is not None:
+            self.callback(entry)
+
+    def entries(self) -> List[Dict]:
+        return list(self.__entries)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SampledProfile -------------------------------------------------------- #
+
+class SampledProfile(Collector):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01
+    ):
+        """Aggregates the span paths of a sample of the requests into a flame graph style profile
+
+        Keyword Arguments:
+            sample_rate {float} -- fraction of the traces to aggregate (default: {0.01})
+        """
+
+        self.sample_rate = sample_rate
+        self.__lock = threading.Lock()
+        self.__totals = {}
+        self.__counts = {}
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_SampledProfile__lock']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def collect(self, trace: Trace) -> None:
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+
+        with self.__lock:
+            self.__add(trace.name, trace.duration)
+
+            for span in trace.spans:
+                self.__add(span.path, span.duration)
+
+    def totals(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregated time per span path
+
+        Returns:
+            Dict[str, Dict[str, Any]] -- {path: {'seconds': float, 'count': int}}
+        """
+
+        with self.__lock:
+            return {path: {'seconds': seconds, 'count': self.__counts[path]} for path, seconds in self.__totals.items()}
+
+    def folded(self) -> str:
+        """Self time per span path in the folded stack format (microseconds) read by flamegraph tools
+
+        Returns:
+            str -- one 'path value' line per span path
+        """
+
+        with self.__lock:
+            self_times = dict(self.__totals)
+
+            for path, seconds in self.__totals.items():
+                parent = path.rpartition(';')[0]
+
+                if parent in self_times:
+                    self_times[parent] -= seconds
+
+        return '\n'.join('{} {}'.format(path, max(int(seconds * 1000000), 0)) for path, seconds in sorted(self_times.items()))
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__totals = {}
+            self.__counts = {}
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __add(self, path: str, seconds: float) -> None:
+        self.__totals[path] = self.__totals.get(path, 0) + seconds
+        self.__counts[path] = self.__counts.get(path, 0) + 1
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
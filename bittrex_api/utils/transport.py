@@ -0,0 +1,119 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import os, threading, weakref
+from typing import Optional, Dict, Tuple, Any
+
+import requests
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: Transport ----------------------------------------------------------- #
+
+class Transport:
+    """Sends a single http request, within the (connect, read) 'timeout' if given. The returned response needs 'status_code', 'headers', 'text' and 'json()'."""
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        json_data: Optional[Any] = None,
+        proxies: Optional[Dict] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ) -> Any:
+        raise NotImplementedError
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: HTTPTransport --------------------------------------------------------- #
+
+class HTTPTransport(Transport):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(self):
+        """Sends requests through keep-alive connection pools. Every thread gets its own requests.Session (a Session is not thread-safe),
+        and the sessions are dropped in a forked child so it never shares sockets with its parent.
+        """
+
+        self.__reset()
+        _TRANSPORTS.add(self)
+
+
+    # ------------------------------------------------------------ Pickle ----------------------------------------------------------- #
+
+    def __getstate__(self) -> Dict:
+        return {}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__()
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        json_data: Optional[Any] = None,
+        proxies: Optional[Dict] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ) -> requests.Response:
+        return self.session().request(method, url, json=json_data, params=params, headers=headers, proxies=proxies, timeout=timeout)
+
+    def session(self) -> requests.Session:
+        """The session of the calling thread
+
+        Returns:
+            requests.Session -- session
+        """
+
+        # Checking the pid covers forks on interpreters without os.register_at_fork
+        if self.__pid != os.getpid():
+            self.__reset()
+
+        session = getattr(self.__local, 'session', None)
+
+        if session is None:
+            session = requests.Session()
+            self.__local.session = session
+
+        return session
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __reset(self) -> None:
+        self.__pid = os.getpid()
+        self.__local = threading.local()
+
+    def _after_fork(self) -> None:
+        self.__reset()
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------------- Fork ---------------------------------------------------------------- #
+
+_TRANSPORTS = weakref.WeakSet()
+
+def _after_fork_in_child() -> None:
+    for transport in list(_TRANSPORTS):
+        transport._after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 
 # Local
 from . import strings
+from .crypto import NonceSource
 
 # ----------------------------------------------------------------------------------------------------------------------------------------#
 
@@ -18,9 +19,11 @@ class Urls:
 
     def __init__(
         self,
-        base_url: str
+        base_url: str,
+        nonce_source: Optional[NonceSource] = None
     ):
         self.base_url = base_url.strip('/')
+        self.nonce_source = nonce_source
 
 
     # -------------------------------------------------------- Public methods --------------------------------------------------------#
@@ -51,7 +54,7 @@ class Urls:
 
             from . import crypto
 
-            params['nonce'] = crypto.nonce()
+            params['nonce'] = (self.nonce_source or crypto.nonce_source()).next()
 
         if params is None:
             return url
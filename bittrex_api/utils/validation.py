@@ -0,0 +1,168 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+from enum import Enum
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from typing import Optional, Tuple, Callable, Union
+
+# Local
+from .symbols import SymbolRegistry, Market
+from .errors import OrderValidationError
+from . import enums
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: OrderValidator -------------------------------------------------------- #
+
+class OrderValidator:
+    # Decimals of order quantities, Bittrex does not publish them per market
+    __QUANTITY_PRECISION = 8
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(
+        self,
+        symbols: SymbolRegistry,
+        available_balance: Optional[Callable[[str], Optional[float]]] = None
+    ):
+        """Pre-flight checks of orders against the cached market rules, so a broken order fails locally instead of after a signed round trip.
+        Quantities are rounded down to 8 decimals, limits to the precision of the market (buys down, sells up, never to a worse price).
+        Orders of offline markets, below the minimum trade size or (if 'available_balance' is given) above the available balance are rejected.
+        Markets are only checked once the registry is loaded (it is loaded on the first order, if it can be).
+
+        Arguments:
+            symbols {SymbolRegistry} -- market metadata
+
+        Keyword Arguments:
+            available_balance {Optional[Callable[[str], Optional[float]]]} -- available balance of a currency, None if not known (default: {None})
+        """
+
+        self.symbols = symbols
+        self.available_balance = available_balance
+
+
+    # -------------------------------------------------------- Public methods ------------------------------------------------------- #
+
+    def round(
+        self,
+        market: str,
+        direction: Union[str, Enum],
+        quantity: Optional[Union[float, str]] = None,
+        limit: Optional[Union[float, str]] = None,
+        legacy: bool = False
+    ) -> Tuple[Optional[Union[float, str]], Optional[Union[float, str]]]:
+        """Rounds an order to the precision of its market, without any other check
+
+        Arguments:
+            market {str} -- market name
+
+            direction {Union[str, Enum]} -- 'BUY' or 'SELL'
+
+        Keyword Arguments:
+            quantity {Optional[Union[float, str]]} -- quantity (default: {None})
+
+            limit {Optional[Union[float, str]]} -- limit (or rate) (default: {None})
+
+            legacy {bool} -- whether 'market' is a v1/v2 name (default: {False})
+
+        Returns:
+            Tuple[Optional[Union[float, str]], Optional[Union[float, str]]] -- quantity, limit
+        """
+
+        self.symbols.ensure_loaded()
+
+        return self.__round(self.__market(market, legacy), direction, quantity, limit)
+
+    def validate(
+        self,
+        market: str,
+        direction: Union[str, Enum],
+        quantity: Optional[Union[float, str]] = None,
+        limit: Optional[Union[float, str]] = None,
+        legacy: bool = False
+    ) -> Tuple[Optional[Union[float, str]], Optional[Union[float, str]]]:
+        """Rounds and checks an order
+
+        Arguments:
+            market {str} -- market name
+
+            direction {Union[str, Enum]} -- 'BUY' or 'SELL'
+
+        Keyword Arguments:
+            quantity {Optional[Union[float, str]]} -- quantity, None for ceiling orders (default: {None})
+
+            limit {Optional[Union[float, str]]} -- limit (or rate), None for market orders (default: {None})
+
+            legacy {bool} -- whether 'market' is a v1/v2 name (default: {False})
+
+        Raises:
+            OrderValidationError -- with the code the server would answer with
+
+        Returns:
+            Tuple[Optional[Union[float, str]], Optional[Union[float, str]]] -- rounded quantity, rounded limit
+        """
+
+        self.symbols.ensure_loaded()
+
+        m = self.__market(market, legacy)
+
+        if m is None:
+            if self.symbols.loaded:
+                raise OrderValidationError('Unknown market: ' + market, code='MARKET_DOES_NOT_EXIST')
+
+            return quantity, limit
+
+        if not m.online:
+            raise OrderValidationError('Market is not online: ' + m.symbol, code='MARKET_OFFLINE')
+
+        quantity, limit = self.__round(m, direction, quantity, limit)
+
+        if quantity is not None and (float(quantity) <= 0 or (m.min_trade_size is not None and float(quantity) < float(m.min_trade_size))):
+            raise OrderValidationError('Quantity {} is below the minimum trade size {} of {}'.format(quantity, m.min_trade_size, m.symbol), code='MIN_TRADE_REQUIREMENT_NOT_MET')
+
+        if self.available_balance is not None and quantity is not None:
+            buy = enums.optionally_get_enum_value(direction).upper() == 'BUY'
+
+            # A market buy has no price to check the balance with
+            if not buy or limit is not None:
+                currency, needed = (m.quote, float(quantity) * float(limit)) if buy else (m.base, float(quantity))
+                available = self.available_balance(currency)
+
+                if available is not None and needed > available:
+                    raise OrderValidationError('{} {} needed, {} available'.format(needed, currency, available), code='INSUFFICIENT_FUNDS')
+
+        return quantity, limit
+
+
+    # ------------------------------------------------------- Private methods ------------------------------------------------------- #
+
+    def __market(self, market: str, legacy: bool) -> Optional[Market]:
+        return self.symbols.market(market, legacy=legacy)
+
+    def __round(
+        self,
+        market: Optional[Market],
+        direction: Union[str, Enum],
+        quantity: Optional[Union[float, str]],
+        limit: Optional[Union[float, str]]
+    ) -> Tuple[Optional[Union[float, str]], Optional[Union[float, str]]]:
+        if quantity is not None:
+            quantity = self.__quantize(quantity, self.__QUANTITY_PRECISION, ROUND_DOWN)
+
+        if limit is not None and market is not None and market.precision is not None:
+            sell = enums.optionally_get_enum_value(direction).upper() == 'SELL'
+            limit = self.__quantize(limit, int(market.precision), ROUND_UP if sell else ROUND_DOWN)
+
+        return quantity, limit
+
+    @staticmethod
+    def __quantize(value: Union[float, str], decimals: int, rounding: str) -> Union[float, str]:
+        # Decimal strings stay exact strings, floats go through their shortest repr, so 0.1 stays 0.1 instead of the binary 0.1000000000000000055...
+        quantized = Decimal(value if isinstance(value, str) else repr(float(value))).quantize(Decimal(1).scaleb(-decimals), rounding=rounding)
+
+        return format(quantized, 'f') if isinstance(value, str) else float(quantized)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -6,10 +6,13 @@ from typing import Optional, Dict, List, Union
 # Local
 from .__bittrex_core import BittrexCore
 from .utils.bittrex_requests import BittrexRequests, RequestMethod, JSONData
+from .utils.errors import OrderValidationError
 from .models.v1.endpoints import EndPoints
 from .models.v1.keys import Keys
 from .models.v1 import order_book_type
 from .utils.urls import Urls
+from .utils.deadline import Deadline
+from .utils.scheduler import Priority
 from .utils import crypto
 
 # --------------------------------------------------------------------------------------------------------------------------------------- #
@@ -21,12 +24,24 @@ OrderBookType = order_book_type.OrderBookType
 # ----------------------------------------------------------- class: BittrexV1 ---------------------------------------------------------- #
 
 class BittrexV1(BittrexCore):
+    # Scheduler classes of the endpoints, the other signed ones are account state and the public ones market data
+    __ORDER_ENDPOINTS = [EndPoints.BUY_LIMIT, EndPoints.SELL_LIMIT, EndPoints.CANCEL, EndPoints.WITHDRAW]
+    __BULK_ENDPOINTS  = [EndPoints.GET_ORDER_HISTORY, EndPoints.GET_WITHDRAWAL_HISTORY, EndPoints.GET_DEPOSIT_HISTORY]
 
     # ------------------------------------------------------ Private properties ------------------------------------------------------ #
 
     _base_url = 'https://api.bittrex.com/api/v1.1/'
 
 
+    # ------------------------------------------------------------- Init ------------------------------------------------------------ #
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if self.symbols.markets_loader is None:
+            self.symbols.markets_loader = self._symbol_markets
+
+
     # -------------------------------------------------------- Public methods ------------------------------------------------------- #
     # ------------------------------------------------------------ Public ----------------------------------------------------------- #
 
@@ -46,8 +61,8 @@ class BittrexV1(BittrexCore):
     #         "LogoUrl": "https://storage.blob.core.windows.net/public/8637ccad-9e7f-45ac-8f03-a41b440e3911.png"
     #     }
     # ]
-    def get_markets(self) -> Optional[List]:
-        return self.__request(EndPoints.GET_MARKETS)
+    def get_markets(self, deadline: Optional[float] = None) -> Optional[List]:
+        return self.__request(EndPoints.GET_MARKETS, deadline=deadline)
 
 
     # [
@@ -62,8 +77,8 @@ class BittrexV1(BittrexCore):
     #         "BaseAddress": null
     #     }
     # ]
-    def get_currencies(self) -> Optional[List]:
-        return self.__request(EndPoints.GET_CURRENCIES)
+    def get_currencies(self, deadline: Optional[float] = None) -> Optional[List]:
+        return self.__request(EndPoints.GET_CURRENCIES, deadline=deadline)
 
 
     # [
@@ -84,8 +99,8 @@ class BittrexV1(BittrexCore):
     #         "DisplayMarketName": "string"
     #     }
     # ]
-    def get_market_summaries(self) -> Optional[List]:
-        return self.__request(EndPoints.GET_MARKET_SUMMARIES)
+    def get_market_summaries(self, deadline: Optional[float] = None) -> Optional[List]:
+        return self.__request(EndPoints.GET_MARKET_SUMMARIES, deadline=deadline)
 
 
     # {
@@ -104,13 +119,15 @@ class BittrexV1(BittrexCore):
     #     "Created": "2014-02-13T00:00:00",
     #     "DisplayMarketName": "string"
     # }
-    def get_market_summary(self, market: str) -> Optional[Dict]:
+    def get_market_summary(self, market: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_MARKET_SUMMARY,
             params={
                 Keys.MARKET:market
             },
-            path=['result', 0]
+            path=['result', 0],
+            hedge='v1/market_summary',
+            deadline=deadline
         )
 
         # if summary_arr is not None and len(summary_arr) > 0:
@@ -124,12 +141,14 @@ class BittrexV1(BittrexCore):
     #     "Ask": 3.35579531,
     #     "Last": 3.35579531
     # }
-    def get_ticker(self, market: str) -> Optional[Dict]:
+    def get_ticker(self, market: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_TICKER,
             params={
                 Keys.MARKET:market
-            }
+            },
+            hedge='v1/ticker',
+            deadline=deadline
         )
 
 
@@ -150,14 +169,17 @@ class BittrexV1(BittrexCore):
     def get_order_book(
         self,
         market: str,
-        type: OrderBookType = OrderBookType.BOTH
+        type: OrderBookType = OrderBookType.BOTH,
+        deadline: Optional[float] = None
     ) -> Optional[Union[List, Dict]]: # or Optional[List] if type != OrderBookType.BOTH
         return self.__request(
             EndPoints.GET_ORDER_BOOK,
             params={
                 Keys.MARKET:market,
                 Keys.TYPE:type
-            }
+            },
+            hedge='v1/order_book',
+            deadline=deadline
         )
 
 
@@ -172,10 +194,11 @@ class BittrexV1(BittrexCore):
     #         "OrderType": "BUY"
     #     }
     # ]
-    def get_market_history(self, market: str) -> Optional[List]:
+    def get_market_history(self, market: str, deadline: Optional[float] = None) -> Optional[List]:
         return self.__request(
             EndPoints.GET_MARKET_HISTORY,
-            params={ Keys.MARKET:market }
+            params={ Keys.MARKET:market },
+            deadline=deadline
         )
 
 
@@ -186,13 +209,15 @@ class BittrexV1(BittrexCore):
         self,
         market: str,
         quantity: float,
-        rate: float
+        rate: float,
+        deadline: Optional[float] = None
     ) -> Optional[str]:
         return self.__buy_sell(
             EndPoints.BUY_LIMIT,
             market,
             quantity,
-            rate
+            rate,
+            deadline=deadline
         )
 
     # Alias
@@ -204,13 +229,15 @@ class BittrexV1(BittrexCore):
         self,
         market: str,
         quantity: float,
-        rate: float
+        rate: float,
+        deadline: Optional[float] = None
     ) -> Optional[str]:
         return self.__buy_sell(
             EndPoints.SELL_LIMIT,
             market,
             quantity,
-            rate
+            rate,
+            deadline=deadline
         )
 
     # Alias
@@ -218,12 +245,13 @@ class BittrexV1(BittrexCore):
 
 
     # True or False or None
-    def cancel(self, uuid: str) -> Optional[bool]:
+    def cancel(self, uuid: str, deadline: Optional[float] = None) -> Optional[bool]:
         return self.__request(
             EndPoints.CANCEL,
             params={ Keys.UUID:uuid },
             path=['success'],
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Alias
@@ -251,7 +279,7 @@ class BittrexV1(BittrexCore):
     #         "ConditionTarget": null
     #     }
     # ]
-    def get_open_orders(self, market: Optional[str] = None) -> Optional[List]:
+    def get_open_orders(self, market: Optional[str] = None, deadline: Optional[float] = None) -> Optional[List]:
         params = None
 
         if market is not None:
@@ -260,7 +288,8 @@ class BittrexV1(BittrexCore):
         return self.__request(
             EndPoints.GET_OPEN_ORDERS,
             params=params,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -277,10 +306,11 @@ class BittrexV1(BittrexCore):
     #         "Uuid": null
     #     }
     # ]
-    def get_balances(self) -> Optional[List]:
+    def get_balances(self, deadline: Optional[float] = None) -> Optional[List]:
         return self.__request(
             EndPoints.GET_BALANCES,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -293,11 +323,12 @@ class BittrexV1(BittrexCore):
     #     "Requested": false,
     #     "Uuid": null
     # }
-    def get_balance(self, currency: str) -> Optional[Dict]:
+    def get_balance(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_BALANCE,
             params={ Keys.CURRENCY:currency },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -305,11 +336,12 @@ class BittrexV1(BittrexCore):
     #     "Currency": "VTC",
     #     "Address": "Vy5SKeKGXUHKS2WVpJ76HYuKAu3URastUo"
     # }
-    def get_deposit_address(self, currency: str) -> Optional[Dict]:
+    def get_deposit_address(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_DEPOSIT_ADDRESS,
             params={ Keys.CURRENCY:currency },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -317,7 +349,7 @@ class BittrexV1(BittrexCore):
     # param paymentid: used for CryptoNotes/BitShareX/Nxt/XRP and any other coin that has a memo/message/tag/paymentid option
     #
     # returns UUID: "614c34e4-8d71-11e3-94b5-425861b86ab6"
-    def withdraw(self, currency: str, quantity: float, address: str, payment_id: Optional[str] = None) -> Optional[str]:
+    def withdraw(self, currency: str, quantity: float, address: str, payment_id: Optional[str] = None, deadline: Optional[float] = None) -> Optional[str]:
         params={
             Keys.CURRENCY:currency,
             Keys.ADDRESS:address
@@ -330,7 +362,8 @@ class BittrexV1(BittrexCore):
             EndPoints.WITHDRAW,
             params=params,
             signed=True,
-            path=['result', 'uuid']
+            path=['result', 'uuid'],
+            deadline=deadline
         )
 
 
@@ -359,11 +392,12 @@ class BittrexV1(BittrexCore):
     #     "Condition": "NONE",
     #     "ConditionTarget": null
     # }
-    def get_order(self, uuid: str) -> Optional[Dict]:
+    def get_order(self, uuid: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_ORDER,
             params={ Keys.UUID:uuid },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -386,7 +420,7 @@ class BittrexV1(BittrexCore):
     #         "Closed": "2014-02-13T00:00:00"
     #     }
     # ]
-    def get_order_history(self, market: Optional[str] = None) -> Optional[List]:
+    def get_order_history(self, market: Optional[str] = None, deadline: Optional[float] = None) -> Optional[List]:
         params = None
 
         if market is not None:
@@ -395,7 +429,8 @@ class BittrexV1(BittrexCore):
         return self.__request(
             EndPoints.GET_ORDER_HISTORY,
             params=params,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -414,7 +449,7 @@ class BittrexV1(BittrexCore):
     #         "InvalidAddress": "boolean"
     #     }
     # ]
-    def get_withdrawal_history(self, currency: Optional[str] = None) -> Optional[List]:
+    def get_withdrawal_history(self, currency: Optional[str] = None, deadline: Optional[float] = None) -> Optional[List]:
         params = None
 
         if currency is not None:
@@ -423,7 +458,8 @@ class BittrexV1(BittrexCore):
         return self.__request(
             EndPoints.GET_WITHDRAWAL_HISTORY,
             params=params,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -438,7 +474,7 @@ class BittrexV1(BittrexCore):
     #         "CryptoAddress": "15VyEAT4uf7ycrNWZVb1eGMzrs21BH95Va"
     #     }
     # ]
-    def get_deposit_history(self, currency: Optional[str] = None) -> Optional[List]:
+    def get_deposit_history(self, currency: Optional[str] = None, deadline: Optional[float] = None) -> Optional[List]:
         params = None
 
         if currency is not None:
@@ -447,7 +483,8 @@ class BittrexV1(BittrexCore):
         return self.__request(
             EndPoints.GET_DEPOSIT_HISTORY,
             params=params,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -458,32 +495,82 @@ class BittrexV1(BittrexCore):
         endpoint: EndPoints,
         params: Optional[Dict] = None,
         signed: bool = False,
-        path: Optional[List[str]] = None
+        path: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+        hedge: Optional[str] = None
     ) -> Optional[JSONData]:
-        if signed:
-            if params is None:
-                params={}
-
-            params[Keys.API_KEY] = self.api_key
-
-        url = self.url_utils.url(endpoint.value, params)
-        headers = None
-
-        if signed:
-            headers = {Keys.SIGNATURE: crypto.signature(url, self.api_secret)}
+        group = 'v1/' + endpoint.value.split('/')[0]
+        trace = self.requests.tracer.trace(group)
+
+        try:
+            if signed:
+                if params is None:
+                    params={}
+
+                params[Keys.API_KEY] = self.api_key
+
+            with trace.span('url'):
+                url = self.url_utils.url(endpoint.value, params=params)
+
+            headers = None
+
+            if signed:
+                with trace.span('sign'):
+                    headers = {Keys.SIGNATURE.value: crypto.signature(url, self.api_secret)}
+
+            return self.requests.request(
+                url,
+                RequestMethod.GET,
+                headers=headers,
+                needed_values={
+                    'success': True,
+                    'result': None
+                },
+                path=path or ['result'],
+                trace=trace,
+                deadline=Deadline.of(deadline),
+                hedge=hedge if not signed else None,
+                group=group,
+                priority=self.__priority(endpoint, signed)
+            )
+        finally:
+            trace.finish()
+
+    def __priority(self, endpoint: EndPoints, signed: bool) -> Priority:
+        if endpoint in self.__ORDER_ENDPOINTS:
+            return Priority.ORDER
+
+        if endpoint in self.__BULK_ENDPOINTS:
+            return Priority.BULK
+
+        return Priority.ACCOUNT if signed else Priority.MARKET_DATA
+
+    def _symbol_markets(self) -> Optional[List[Dict]]:
+        # The markets in the v3 shape the symbol registry keeps
+        markets = self.get_markets()
+
+        if markets is None:
+            return None
+
+        return [
+            {
+                'symbol':m['MarketCurrency'] + '-' + m['BaseCurrency'],
+                'baseCurrencySymbol':m['MarketCurrency'],
+                'quoteCurrencySymbol':m['BaseCurrency'],
+                'minTradeSize':m.get('MinTradeSize'),
+                'precision':None,
+                'status':'ONLINE' if m.get('IsActive') else 'OFFLINE'
+            }
+            for m in markets
+        ]
 
-        return self.requests.request(
-            url,
-            RequestMethod.GET,
-            headers=headers,
-            needed_values={
-                'success': True,
-                'result': None
-            },
-            path=path or ['result']
-        )
+    def __buy_sell(self, endpoint: str, market: str, quantity: float, rate: float, deadline: Optional[float] = None) -> Optional[str]:
+        if self.validator is not None:
+            try:
+                quantity, rate = self.validator.validate(market, 'BUY' if endpoint == EndPoints.BUY_LIMIT else 'SELL', quantity=quantity, limit=rate, legacy=True)
+            except OrderValidationError as e:
+                return self.requests.fail(e)
 
-    def __buy_sell(self, endpoint: str, market: str, quantity: float, rate: float) -> Optional[str]:
         return self.__request(
             endpoint,
             params={
@@ -493,7 +580,8 @@ class BittrexV1(BittrexCore):
                 Keys.RATE:rate
             },
             signed=True,
-            path=['result', 'uuid']
+            path=['result', 'uuid'],
+            deadline=deadline
         )
 
 
@@ -6,10 +6,13 @@ from typing import Optional, Dict, List, Union
 # Local
 from .__bittrex_core import BittrexCore
 from .utils.bittrex_requests import BittrexRequests, RequestMethod, JSONData
+from .utils.errors import OrderValidationError
 from .models.v2.endpoints import EndPoints
 from .models.v2.keys import Keys
 from .models.v2 import tick_interval, order_type, condition_type, time_in_effect
 from .utils.urls import Urls
+from .utils.deadline import Deadline
+from .utils.scheduler import Priority
 from .utils import crypto
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -24,20 +27,34 @@ TimeInEffect    = time_in_effect.TimeInEffect
 # ----------------------------------------------------------- class: BittrexV2 ----------------------------------------------------------- #
 
 class BittrexV2(BittrexCore):
+    # Scheduler classes of the endpoints, the other signed ones are account state and the public ones market data
+    __ORDER_ENDPOINTS = [EndPoints.BUY, EndPoints.SELL, EndPoints.CANCEL_TRADE]
+    __BULK_ENDPOINTS  = [EndPoints.GET_TICKS, EndPoints.GET_ORDER_HISTORY]
 
     # ------------------------------------------------------ Private properties ------------------------------------------------------ #
 
     _base_url = 'https://bittrex.com/api/v2.0/'
 
 
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # v2 has no markets endpoint to load the registry with, validating against an empty one would let every order through
+        if self.validator is not None and self.symbols.markets_loader is None and not self.symbols.loaded:
+            raise ValueError('validate_orders needs a loaded SymbolRegistry or one with a markets_loader (eg. the symbols of a BittrexV1 or BittrexV3)')
+
+
     # -------------------------------------------------------- Public methods -------------------------------------------------------- #
     # ------------------------------------------------------------ Public ------------------------------------------------------------ #
 
     # returns btc price in USD
-    def get_btc_price(self) -> Optional[float]:
+    def get_btc_price(self, deadline: Optional[float] = None) -> Optional[float]:
         self.__request(
             EndPoints.GET_BTC_PRICE,
-            path=['result', 'bpi', 'USD', 'rate_float']
+            path=['result', 'bpi', 'USD', 'rate_float'],
+            deadline=deadline
         )
 
 
@@ -55,8 +72,8 @@ class BittrexV2(BittrexCore):
     #         "PermanentMessage": null
     #     }
     # ]
-    def get_currencies(self) -> Optional[List]:
-        return self.__request(EndPoints.GET_CURRENCIES)
+    def get_currencies(self, deadline: Optional[float] = None) -> Optional[List]:
+        return self.__request(EndPoints.GET_CURRENCIES, deadline=deadline)
 
     # {
     #     "Health": {
@@ -83,12 +100,13 @@ class BittrexV2(BittrexCore):
     #     "IsQuoteCurrency": true,
     #     "LogoUrl": "https://bittrexblobstorage.blob.core.windows.net/public/ddbdafb2-e267-4114-abc3-06316cf3bef9.png"
     # }
-    def get_currency(self, currency: str) -> Optional[Dict]:
+    def get_currency(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_CURRENCY_INFO,
             params={
                 Keys.CURRENCY_NAME:currency
-            }
+            },
+            deadline=deadline
         )
 
 
@@ -122,8 +140,8 @@ class BittrexV2(BittrexCore):
     #     },
     #     ...
     # ]
-    def get_wallet_health(self) -> Optional[List]:
-        return self.__request(EndPoints.WALLET_HEALTH)
+    def get_wallet_health(self, deadline: Optional[float] = None) -> Optional[List]:
+        return self.__request(EndPoints.WALLET_HEALTH, deadline=deadline)
 
 
     # NOT WORKING
@@ -168,8 +186,8 @@ class BittrexV2(BittrexCore):
     #     },
     #     ...
     # ]
-    def get_market_summaries(self) -> Optional[List]:
-        return self.__request(EndPoints.GET_MARKET_SUMMARIES)
+    def get_market_summaries(self, deadline: Optional[float] = None) -> Optional[List]:
+        return self.__request(EndPoints.GET_MARKET_SUMMARIES, deadline=deadline)
 
 
     # {
@@ -187,12 +205,14 @@ class BittrexV2(BittrexCore):
     #     "PrevDay": 0.01882325,
     #     "Created": "2015-08-14T09:02:24.817"
     # }
-    def get_market_summary(self, market: str) -> Optional[Dict]:
+    def get_market_summary(self, market: str, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_MARKET_SUMMARY,
             params={
                 Keys.MARKET:market
-            }
+            },
+            hedge='v2/market_summary',
+            deadline=deadline
         )
 
 
@@ -207,13 +227,14 @@ class BittrexV2(BittrexCore):
     #         "BV": 0.15404624
     #     }
     # ]
-    def get_ticks(self, market: str, interval: TickInterval) -> Optional[List]:
+    def get_ticks(self, market: str, interval: TickInterval, deadline: Optional[float] = None) -> Optional[List]:
         return self.__request(
             EndPoints.GET_TICKS,
             params={
                 Keys.MARKET:market,
                 Keys.TICK_INTERVAL:interval
-            }
+            },
+            deadline=deadline
         )
 
 
@@ -226,14 +247,15 @@ class BittrexV2(BittrexCore):
     #     "T": "2020-01-30T19:00:00",
     #     "BV": 1.17545776
     # }
-    def get_latest_tick(self, market: str, interval: TickInterval) -> Optional[Dict]:
+    def get_latest_tick(self, market: str, interval: TickInterval, deadline: Optional[float] = None) -> Optional[Dict]:
         return self.__request(
             EndPoints.GET_LATEST_TICK,
             params={
                 Keys.MARKET:market,
                 Keys.TICK_INTERVAL:interval
             },
-            path=['result', 0]
+            path=['result', 0],
+            deadline=deadline
         )
 
 
@@ -256,7 +278,8 @@ class BittrexV2(BittrexCore):
         type: OrderType,
         time_in_effect: TimeInEffect,
         condition_type: ConditionType,
-        target: int = 0
+        target: int = 0,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         return self.__buy_sell(
             EndPoints.BUY,
@@ -266,7 +289,8 @@ class BittrexV2(BittrexCore):
             type,
             time_in_effect,
             condition_type,
-            target
+            target,
+            deadline=deadline
         )
 
 
@@ -287,7 +311,8 @@ class BittrexV2(BittrexCore):
         type: OrderType,
         time_in_effect: TimeInEffect,
         condition_type: ConditionType,
-        target: int = 0
+        target: int = 0,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         return self.__buy_sell(
             EndPoints.SELL,
@@ -297,19 +322,21 @@ class BittrexV2(BittrexCore):
             type,
             time_in_effect,
             condition_type,
-            target
+            target,
+            deadline=deadline
         )
 
 
     # True or False or None
-    def cancel(self, uuid: str) -> Optional[bool]:
+    def cancel(self, uuid: str, deadline: Optional[float] = None) -> Optional[bool]:
         return self.__request(
             EndPoints.CANCEL_TRADE,
             params={
                 Keys.UUID:uuid
             },
             path=['success'],
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Alias
@@ -327,8 +354,22 @@ class BittrexV2(BittrexCore):
         type: OrderType,
         time_in_effect: TimeInEffect,
         condition_type: ConditionType,
-        target: int
+        target: int,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
+        if self.validator is not None:
+            try:
+                quantity, limit = self.validator.validate(
+                    market,
+                    'BUY' if endpoint == EndPoints.BUY else 'SELL',
+                    quantity=quantity,
+                    limit=rate if type != OrderType.MARKET else None,
+                    legacy=True
+                )
+                rate = limit if limit is not None else rate
+            except OrderValidationError as e:
+                return self.requests.fail(e)
+
         return self.__request(
             endpoint,
             params={
@@ -340,7 +381,8 @@ class BittrexV2(BittrexCore):
                 Keys.CONDITION_TYPE:condition_type,
                 Keys.TARGET:target,
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     def __request(
@@ -348,30 +390,55 @@ class BittrexV2(BittrexCore):
         endpoint: EndPoints,
         params: Optional[Dict] = None,
         signed: bool = False,
-        path: Optional[List[str]] = None
+        path: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+        hedge: Optional[str] = None
     ) -> Optional[JSONData]:
-        if signed:
-            if params is None:
-                params={}
-
-            params[Keys.API_KEY] = self.api_key
-
-        url = self.url_utils.url(endpoint.value, params=params)
-        headers = None
-
-        if signed:
-            headers = {Keys.SIGNATURE: crypto.signature(url, self.api_secret)}
-
-        return self.requests.request(
-            url,
-            RequestMethod.GET,
-            headers=headers,
-            needed_values={
-                'success': True,
-                'result': None
-            },
-            path=path or ['result']
-        )
+        group = 'v2/' + endpoint.value.split('/')[0]
+        trace = self.requests.tracer.trace(group)
+
+        try:
+            if signed:
+                if params is None:
+                    params={}
+
+                params[Keys.API_KEY] = self.api_key
+
+            with trace.span('url'):
+                url = self.url_utils.url(endpoint.value, params=params)
+
+            headers = None
+
+            if signed:
+                with trace.span('sign'):
+                    headers = {Keys.SIGNATURE.value: crypto.signature(url, self.api_secret)}
+
+            return self.requests.request(
+                url,
+                RequestMethod.GET,
+                headers=headers,
+                needed_values={
+                    'success': True,
+                    'result': None
+                },
+                path=path or ['result'],
+                trace=trace,
+                deadline=Deadline.of(deadline),
+                hedge=hedge if not signed else None,
+                group=group,
+                priority=self.__priority(endpoint, signed)
+            )
+        finally:
+            trace.finish()
+
+    def __priority(self, endpoint: EndPoints, signed: bool) -> Priority:
+        if endpoint in self.__ORDER_ENDPOINTS:
+            return Priority.ORDER
+
+        if endpoint in self.__BULK_ENDPOINTS:
+            return Priority.BULK
+
+        return Priority.ACCOUNT if signed else Priority.MARKET_DATA
 
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
\ No newline at end of file
@@ -1,16 +1,40 @@
 # --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
 
 # System
-from typing import Optional, Dict, List, Union, Tuple
+import uuid, time, threading
+from contextlib import contextmanager
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, List, Union, Tuple, Callable, Iterator
 
 # Local
 from .__bittrex_core import BittrexCore
 from .utils.bittrex_requests import BittrexRequests, RequestMethod, JSONData
 from .models.v3.endpoints import EndPoints
 from .models.v3.keys import Keys
-from .models.v3 import conditional_order_operand, time_in_force, order_direction, order_type, cancel_order_type, candle_interval, deposit_status, withdrawal_status
+from .models.v3 import conditional_order_operand, time_in_force, order_direction, order_type, cancel_order_type, candle_interval, deposit_status, withdrawal_status, account_snapshot
 # from .models.common.request_method import RequestMethod
 from .utils.urls import Urls
+from .utils.tracing import Tracer
+from .utils.transport import Transport
+from .utils.clock_sync import ClockSync
+from .utils.errors import BittrexError, OrderValidationError, DUPLICATE_ERROR_CODES, api_error
+from .utils.deadline import Deadline
+from .utils.timeouts import TimeoutPolicy
+from .utils.rate_limiter import RateLimiter
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.scheduler import PriorityScheduler, Priority
+from .utils.proxy_pool import ProxyPool
+from .utils.key_pool import KeyPool, ApiKey
+from .utils.batcher import Batcher
+from .utils.symbols import SymbolRegistry
+from .utils.fixed_point import FixedPoint
+from .utils.balance_cache import BalanceCache
+from .utils.order_tracker import OrderTracker
+from .utils.order_poller import OrderPoller
+from .utils.terminal_cache import TerminalCache
+from .utils.change_feed import ChangeFeed, TICKER_FIELDS, MARKET_SUMMARY_FIELDS
 from .utils import enums
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -23,6 +47,7 @@ CancelOrderType         = cancel_order_type.CancelOrderType
 CandleInterval          = candle_interval.CandleInterval
 DepositStatus           = deposit_status.DepositStatus
 WithdrawalStatus        = withdrawal_status.WithdrawalStatus
+AccountSnapshot         = account_snapshot.AccountSnapshot
 
 # ----------------------------------------------------------- class: BittrexV3 ----------------------------------------------------------- #
 
@@ -38,24 +63,106 @@ class BittrexV3(BittrexCore):
         sleep_time: float = 7.5,
         debug_level: int = 1,
         reverse_market_names: bool = True,
-        proxy: Optional[Union[List, str]] = None
+        proxy: Optional[Union[List, str, ProxyPool]] = None,
+        tracer: Optional[Tracer] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        clock_sync_interval: Optional[float] = None,
+        raise_errors: bool = False,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+        key_pool: Optional[KeyPool] = None,
+        batcher: Optional[Batcher] = None,
+        symbols: Optional[SymbolRegistry] = None,
+        symbol_refresh_interval: Optional[float] = None,
+        validate_orders: bool = False,
+        fixed_point: bool = False,
+        balance_cache: Optional[BalanceCache] = None,
+        order_tracker: Optional[OrderTracker] = None,
+        order_poller: Optional[OrderPoller] = None,
+        terminal_cache: Optional[TerminalCache] = None
     ):
+        # The first key of the pool owns the orders if the client got no key of its own
+        if key_pool is not None and not api_key:
+            api_key, api_secret = key_pool.keys[0].api_key, key_pool.keys[0].api_secret
+
         super().__init__(
             api_key=api_key,
             api_secret=api_secret,
             max_request_try_count=max_request_try_count,
             sleep_time=sleep_time,
             debug_level=debug_level,
-            proxy=proxy
+            proxy=proxy,
+            tracer=tracer,
+            base_url=base_url,
+            transport=transport,
+            raise_errors=raise_errors,
+            timeout_policy=timeout_policy,
+            rate_limiter=rate_limiter,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            scheduler=scheduler,
+            symbols=symbols,
+            validate_orders=validate_orders
         )
 
         self.REVERSE_MARKET_NAMES = reverse_market_names
+        self.key_pool = key_pool
+        self.__local = threading.local()
+        self.batcher = batcher
+        self.fixed_point = FixedPoint(self.symbols) if fixed_point else None
+        self.balance_cache = balance_cache
+        self.order_tracker = order_tracker or (order_poller.tracker if order_poller is not None else None)
+        self.terminal_cache = terminal_cache
+        self.order_poller = order_poller or (OrderPoller(self.order_tracker, debug_level=debug_level) if self.order_tracker is not None else None)
+        self.clock = ClockSync(self.ping, self.nonces)
+        self.requests.add_error_listener(self.clock.on_error)
+
+        for key in (key_pool.keys if key_pool is not None else []):
+            if key.nonces is not self.nonces:
+                self.clock.add_nonce_source(key.nonces)
+
+        if clock_sync_interval:
+            self.clock.start(clock_sync_interval)
+
+        self.symbols.markets_loader = self.symbols.markets_loader or self.get_markets
+        self.symbols.currencies_loader = self.symbols.currencies_loader or self.get_curencies
+
+        if symbol_refresh_interval:
+            self.symbols.start(symbol_refresh_interval)
+
+        if balance_cache is not None:
+            balance_cache.loader = balance_cache.loader or self._fetch_balances
+
+            if self.validator is not None and self.validator.available_balance is None:
+                self.validator.available_balance = balance_cache.cached_available
+
+        if self.order_tracker is not None:
+            self.order_tracker.open_orders_loader = self.order_tracker.open_orders_loader or self.get_open_orders
+            self.order_tracker.closed_orders_loader = self.order_tracker.closed_orders_loader or self._closed_orders_page
+            self.order_tracker.order_loader = self.order_tracker.order_loader or self.get_order_by_id
 
     # ------------------------------------------------------ Private properties ------------------------------------------------------ #
 
     _base_url = 'https://api.bittrex.com/v3/'
 
 
+    # ------------------------------------------------------------ Pickle ------------------------------------------------------------ #
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_BittrexV3__local']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.__local = threading.local()
+
+
     # -------------------------------------------------------- Public methods -------------------------------------------------------- #
     # ------------------------------------------------------------- Ping ------------------------------------------------------------- #
 
@@ -63,18 +170,59 @@ class BittrexV3(BittrexCore):
     # {
     #     "serverTime": "integer (int64)"
     # }
-    def ping(self) -> Optional[Dict]:
+    def ping(self, deadline: Optional[float] = None) -> Optional[Dict]:
         """Pings the service
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- ServicePing
         """
 
         return self.__request(
             EndPoints.PING,
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
+    def sync_clock(self) -> Optional[float]:
+        """Measures the offset of the server clock with a few pings and applies it to the Api-Timestamp of every signed request.
+        Timestamp rejections trigger a background re-sync automatically.
+
+        Returns:
+            Optional[float] -- offset in milliseconds (server - local), None if the server could not be pinged
+        """
+
+        return self.clock.sync()
+
+    def start_clock_sync(self, interval: float = 300) -> None:
+        """Keeps the clock offset in sync on a background thread
+
+        Keyword Arguments:
+            interval {float} -- seconds between syncs (default: {300})
+        """
+
+        self.clock.start(interval)
+
+    def stop_clock_sync(self) -> None:
+        self.clock.stop()
+
+    @contextmanager
+    def sharded(self) -> Iterator[None]:
+        """Spreads the signed reads the calling thread sends inside the block over the keys of 'key_pool' (the one with the most budget left).
+        Only for reads that do not depend on which account a key belongs to (eg. a pool of keys of one account). Orders and balances
+        are always read with the key owning them, and everything that changes state is sent with it.
+        """
+
+        previous = getattr(self.__local, 'sharded', False)
+        self.__local.sharded = True
+
+        try:
+            yield
+        finally:
+            self.__local.sharded = previous
+
 
     # ---------------------------------------------------------- Currencies ---------------------------------------------------------- #
 
@@ -94,16 +242,20 @@ class BittrexV3(BittrexCore):
     #         ]
     #     }
     # ]
-    def get_curencies(self) -> Optional[List[Dict]]:
+    def get_curencies(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List currencies.
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of currencies
         """
 
         return self.__request(
             EndPoints.CURRENCIES,
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
     # Response:
@@ -120,19 +272,23 @@ class BittrexV3(BittrexCore):
     #         "string"
     #     ]
     # }
-    def get_curency(self, currency: str) -> Optional[Dict]:
+    def get_curency(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve info on a specified currency.
 
         Arguments:
             currency {str} -- symbol of the currency to retrieve
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Currency
         """
 
         return self.__request(
             EndPoints.CURRENCIES, currency,
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
 
@@ -154,16 +310,20 @@ class BittrexV3(BittrexCore):
     #         ]
     #     }
     # ]
-    def get_markets(self) -> Optional[List[Dict]]:
+    def get_markets(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List markets.
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of Market infos
         """
 
         return self.__request(
             EndPoints.MARKETS,
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
     # Response:
@@ -181,19 +341,23 @@ class BittrexV3(BittrexCore):
     #    "associatedTermsOfService": [],
     #    "tags": []
     # }
-    def get_market(self, market: str) -> Optional[Dict]:
+    def get_market(self, market: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve information for a specific market.
 
         Arguments:
             market {str} -- symbol of market to retrieve info for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Market info
         """
 
         return self.__request(
             EndPoints.MARKETS, self.__optionally_reversed_market_name(market),
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
     # Response:
@@ -209,16 +373,20 @@ class BittrexV3(BittrexCore):
     #         "updatedAt": "string (date-time)"
     #     }
     # ]
-    def get_market_summaries(self) -> Optional[List[Dict]]:
+    def get_market_summaries(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List summaries of the last 24 hours of activity for all markets. ** Note: baseVolume is being deprecated and will be removed in favor of quoteVolume
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of Market summaries
         """
 
         return self.__request(
             EndPoints.MARKETS, EndPoints.SUMMARIES,
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
     # Response:
@@ -231,20 +399,28 @@ class BittrexV3(BittrexCore):
     #     "percentChange": "number (double)",
     #     "updatedAt": "string (date-time)"
     # }
-    def get_market_summary(self, market: str) -> Optional[Dict]:
+    def get_market_summary(self, market: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve summary of the last 24 hours of activity for a specific market. ** Note: baseVolume is being deprecated and will be removed in favor of quoteVolume
 
         Arguments:
             market {str} -- symbol of market to retrieve summary for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Market summary
         """
 
-        return self.__request(
-            EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.SUMMARY,
-            method=RequestMethod.GET
-        )
+        def single() -> Optional[Dict]:
+            return self.__request(
+                EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.SUMMARY,
+                method=RequestMethod.GET,
+                hedge='v3/market_summary',
+                deadline=deadline
+            )
+
+        return self.__batched('v3/market_summaries', single, self.get_market_summaries, 'symbol', self.__optionally_reversed_market_name(market), deadline)
 
     # Response:
     # [
@@ -255,16 +431,20 @@ class BittrexV3(BittrexCore):
     #         "askRate": "number (double)"
     #     }
     # ]
-    def get_tickers(self) -> Optional[List[Dict]]:
+    def get_tickers(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List tickers for all markets.
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of Tickers
         """
 
         return self.__request(
             EndPoints.MARKETS, EndPoints.TICKERS,
-            method=RequestMethod.GET
+            method=RequestMethod.GET,
+            deadline=deadline
         )
 
     # Response:
@@ -274,20 +454,28 @@ class BittrexV3(BittrexCore):
     #     "bidRate": "number (double)",
     #     "askRate": "number (double)"
     # }
-    def get_ticker(self, market: str) -> Optional[Dict]:
+    def get_ticker(self, market: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve the ticker for a specific market.
 
         Arguments:
             market {str} -- symbol of market to retrieve ticker for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Ticker
         """
 
-        return self.__request(
-            EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.TICKER,
-            method=RequestMethod.GET
-        )
+        def single() -> Optional[Dict]:
+            return self.__request(
+                EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.TICKER,
+                method=RequestMethod.GET,
+                hedge='v3/ticker',
+                deadline=deadline
+            )
+
+        return self.__batched('v3/tickers', single, self.get_tickers, 'symbol', self.__optionally_reversed_market_name(market), deadline)
 
     # Response:
     # {
@@ -307,7 +495,8 @@ class BittrexV3(BittrexCore):
     def get_orderbook(
         self,
         market: str,
-        depth: Optional[int] = None
+        depth: Optional[int] = None,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         """Retrieve the ticker for a specific market.
 
@@ -317,17 +506,21 @@ class BittrexV3(BittrexCore):
         Keyword Arguments:
             depth {Optional[int]} -- maximum depth of order book to return (optional, allowed values are [1, 25, 500], default is 25) (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- OrderBook
         """
 
-        return self.__request(
+        return self.__in_ticks('orderbook', self.__request(
             EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.ORDER_BOOK,
             method=RequestMethod.GET,
             params={
                 Keys.DEPTH:depth
-            }
-        )
+            },
+            hedge='v3/orderbook',
+            deadline=deadline
+        ), market=market)
 
     # Response:
     # [
@@ -341,21 +534,26 @@ class BittrexV3(BittrexCore):
     # ]
     def get_trades(
         self,
-        market: str
+        market: str,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """Retrieve the recent trades for a specific market
 
         Arguments:
             market {str} -- symbol of market to retrieve trades for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- List of trades
         """
 
-        return self.__request(
+        return self.__in_ticks('trades', self.__request(
             EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.TRADES,
-            method=RequestMethod.GET
-        )
+            method=RequestMethod.GET,
+            deadline=deadline
+        ), market=market)
 
     # Response:
     # [
@@ -373,7 +571,8 @@ class BittrexV3(BittrexCore):
         self,
         market: str,
         candle_interval: Optional[CandleInterval] = CandleInterval.MINUTE_1,
-        date: Optional[Tuple[int, Optional[int], Optional[int]]] = None
+        date: Optional[Tuple[int, Optional[int], Optional[int]]] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """Retrieve recent candles for a specific market. The maximum age of the returned candles depends on the interval as follows: (MINUTE_1: 1 day, MINUTE_5: 1 day, HOUR_1: 31 days, DAY_1: 366 days).
         Candles for intervals without any trading activity are omitted.
@@ -385,14 +584,17 @@ class BittrexV3(BittrexCore):
             candle_interval {Optional[CandleInterval]} -- desired time interval between candles (default: {CandleInterval.MINUTE_1})
             date {Optional[Tuple[int, Optional[int], Optional[int]]]} -- Date for the candles to check [year, month, day] (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of candles
         """
 
-        return self.__request(
+        return self.__in_ticks('candles', self.__request(
             EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.CANDLES, candle_interval or CandleInterval.MINUTE_1, '{}/{}/{}/{}'.format(EndPoints.HISTORICAL.value, date[0], date[1] or '', date[2] or '').strip('/') if date else EndPoints.RECENT,
-            method=RequestMethod.GET
-        )
+            method=RequestMethod.GET,
+            deadline=deadline
+        ), market=market)
 
     # Response:
     # [
@@ -409,7 +611,8 @@ class BittrexV3(BittrexCore):
     def get_recent_candles(
         self,
         market: str,
-        candle_interval: CandleInterval
+        candle_interval: CandleInterval,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """Retrieve recent candles for a specific market and candle interval. The maximum age of the returned candles depends on the interval as follows: (MINUTE_1: 1 day, MINUTE_5: 1 day, HOUR_1: 31 days, DAY_1: 366 days). Candles for intervals without any trading activity are omitted.
 
@@ -418,14 +621,18 @@ class BittrexV3(BittrexCore):
 
             candle_interval {CandleInterval} -- desired time interval between candles
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of candles
         """
 
-        return self.__request(
+        return self.__in_ticks('candles', self.__request(
             EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.CANDLES, candle_interval.value ,EndPoints.RECENT,
-            method=RequestMethod.GET
-        )
+            method=RequestMethod.GET,
+            deadline=deadline
+        ), market=market)
 
     # Response:
     # [
@@ -446,6 +653,7 @@ class BittrexV3(BittrexCore):
         year: int,
         month: Optional[int] = None,
         day: Optional[int] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """Retrieve recent candles for a specific market and candle interval. The date range of returned candles depends on the interval as follows: (MINUTE_1: 1 day, MINUTE_5: 1 day, HOUR_1: 31 days, DAY_1: 366 days). Candles for intervals without any trading activity are omitted.
 
@@ -460,14 +668,18 @@ class BittrexV3(BittrexCore):
 
             day {Optional[int]} -- desired day to start from (if applicable)
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of candles
         """
 
-        return self.__request(
+        return self.__in_ticks('candles', self.__request(
             EndPoints.MARKETS, self.__optionally_reversed_market_name(market), EndPoints.CANDLES, candle_interval.value ,EndPoints.HISTORICAL, year, month, day,
-            method=RequestMethod.GET
-        )
+            method=RequestMethod.GET,
+            deadline=deadline
+        ), market=market)
 
 
     # --------------------------------------------------------- Auth methods --------------------------------------------------------- #
@@ -478,9 +690,12 @@ class BittrexV3(BittrexCore):
     #     "subaccountId": "string (uuid)",
     #     "accountId": "string (uuid)"
     # }
-    def get_account(self) -> Optional[Dict]:
+    def get_account(self, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve information for the account associated with the request. For now, it only echoes the subaccount if one was specified in the header, which can be used to verify that one is operating on the intended account. More fields will be added later.
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Account
         """
@@ -488,7 +703,8 @@ class BittrexV3(BittrexCore):
         return self.__request(
             EndPoints.ACCOUNT,
             method=RequestMethod.GET,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -496,16 +712,20 @@ class BittrexV3(BittrexCore):
     #     "updated": "string (date-time)",
     #     "volume30days": "number (double)"
     # }
-    def get_account_volume(self) -> Optional[Dict]:
+    def get_account_volume(self, deadline: Optional[float] = None) -> Optional[Dict]:
         """Get 30 day volume for account
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- AccountVolume
         """
         return self.__request(
             EndPoints.ACCOUNT_VOLUME,
             method=RequestMethod.GET,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -520,16 +740,20 @@ class BittrexV3(BittrexCore):
     #         "cryptoAddressTag": "string"
     #     }
     # ]
-    def get_addresses(self) -> Optional[List[Dict]]:
+    def get_addresses(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List deposit addresses that have been requested or provisioned.
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of Addresses
         """
         return self.__request(
             EndPoints.ADDRESSES,
             method=RequestMethod.GET,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -539,12 +763,15 @@ class BittrexV3(BittrexCore):
     #     "cryptoAddress": "string",
     #     "cryptoAddressTag": "string"
     # }
-    def get_address(self, currency: str) -> Optional[Dict]:
+    def get_address(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve the status of the deposit address for a particular currency for which one has been requested or provisioned.
 
         Arguments:
             currency {str} -- the currency ID to provision a new address for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Address
         """
@@ -552,7 +779,8 @@ class BittrexV3(BittrexCore):
         return self.__request(
             EndPoints.ADDRESSES, currency,
             method=RequestMethod.GET,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -562,12 +790,15 @@ class BittrexV3(BittrexCore):
     #     "cryptoAddress": "string",
     #     "cryptoAddressTag": "string"
     # }
-    def create_address(self, currency: str) -> Optional[Dict]:
+    def create_address(self, currency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve the status of the deposit address for a particular currency for which one has been requested or provisioned.
 
         Arguments:
             currency {str} -- symbol of the currency to retrieve the deposit address for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Address
         """
@@ -578,7 +809,8 @@ class BittrexV3(BittrexCore):
             body={
                 Keys.CURRENCY_SYMBOL:currency
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
 
@@ -593,18 +825,21 @@ class BittrexV3(BittrexCore):
     #         "updatedAt": "string (date-time)"
     #     }
     # ]
-    def get_balances(self) -> Optional[List[Dict]]:
+    def get_balances(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List account balances across available currencies. Returns a Balance entry for each currency for which there is either a balance or an address.
+        Served from 'balance_cache' if the client has one.
+
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
 
         Returns:
             Optional[List[Dict]] -- List of Balances
         """
 
-        return self.__request(
-            EndPoints.BALANCES,
-            method=RequestMethod.GET,
-            signed=True
-        )
+        if self.balance_cache is not None:
+            return self.balance_cache.balances(deadline=deadline)
+
+        return self._fetch_balances(deadline=deadline)
 
     # Response:
     # {
@@ -613,21 +848,35 @@ class BittrexV3(BittrexCore):
     #     "available": "number (double)",
     #     "updatedAt": "string (date-time)"
     # }
-    def get_balance(self, curency: str) -> Optional[Dict]:
+    def get_balance(self, curency: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve account balance for a specific currency. Request will always succeed when the currency exists, regardless of whether there is a balance or address.
+        Served from 'balance_cache' if the client has one and it knows the currency.
 
         Arguments:
             curency {str} -- unique symbol of the currency to retrieve the account balance for
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Balance
         """
 
-        return self.__request(
-            EndPoints.BALANCES, curency,
-            method=RequestMethod.GET,
-            signed=True
-        )
+        if self.balance_cache is not None:
+            balance = self.balance_cache.balance(curency, deadline=deadline)
+
+            if balance is not None:
+                return balance
+
+        def single() -> Optional[Dict]:
+            return self.__request(
+                EndPoints.BALANCES, curency,
+                method=RequestMethod.GET,
+                signed=True,
+                deadline=deadline
+            )
+
+        return self.__batched('v3/balances', single, self.get_balances, 'currencySymbol', curency, deadline)
 
 
     # ----------------------------------------------------------- Deposits ----------------------------------------------------------- #
@@ -651,7 +900,8 @@ class BittrexV3(BittrexCore):
     def get_open_deposits(
         self,
         status: Optional[DepositStatus] = None,
-        currency: Optional[str] = None
+        currency: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List open deposits. Results are sorted in inverse order of UpdatedAt, and are limited to the first 1000.
 
@@ -663,6 +913,8 @@ class BittrexV3(BittrexCore):
 
             currency {Optional[str]} -- filter by currency (optional) (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of deposits
         """
@@ -674,7 +926,8 @@ class BittrexV3(BittrexCore):
                 Keys.STATUS:status,
                 Keys.CURRENCY_SYMBOL:currency,
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -701,7 +954,8 @@ class BittrexV3(BittrexCore):
         previous_page_token: Optional[str] = None,
         page_size: Optional[int] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List closed deposits. StartDate and EndDate filters apply to the CompletedAt field. Pagination and the sort order of the results are in inverse order of the CompletedAt field.
 
@@ -720,6 +974,8 @@ class BittrexV3(BittrexCore):
 
             end_date {Optional[str]} -- (optional) Filters out result after this timestamp. Uses the same format as StartDate. Either, both, or neither of StartDate and EndDate can be set. The only constraint on the pair is that, if both are set, then EndDate cannot be before StartDate. (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of deposits
         """
@@ -736,7 +992,8 @@ class BittrexV3(BittrexCore):
                 Keys.START_DATE:start_date,
                 Keys.END_DATE:end_date
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -757,7 +1014,8 @@ class BittrexV3(BittrexCore):
     # ]
     def get_deposits_by_tx_id(
         self,
-        tx_id: str
+        tx_id: str,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List open deposits. Results are sorted in inverse order of UpdatedAt, and are limited to the first 1000.
 
@@ -766,6 +1024,9 @@ class BittrexV3(BittrexCore):
 
             currency {Optional[str]} -- filter by currency (optional) (default: {None})
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of deposits
         """
@@ -773,7 +1034,8 @@ class BittrexV3(BittrexCore):
         return self.__request(
             EndPoints.DEPOSITS, EndPoints.BY_TX_ID, tx_id,
             method=RequestMethod.GET,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -792,22 +1054,27 @@ class BittrexV3(BittrexCore):
     # }
     def get_deposits_by_deposit_id(
         self,
-        deposit_id: str
+        deposit_id: str,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         """List open deposits. Results are sorted in inverse order of UpdatedAt, and are limited to the first 1000.
 
         Arguments:
             deposit_id {str} -- (uuid-formatted string) - ID of the deposit to retrieve
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Deposit
         """
 
-        return self.__request(
+        return self.__terminal('deposit', deposit_id, lambda: self.__request(
             EndPoints.DEPOSITS, deposit_id,
             method=RequestMethod.GET,
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        ))
 
 
     # ---------------------------------------------------------- Withdrawals --------------------------------------------------------- #
@@ -830,7 +1097,8 @@ class BittrexV3(BittrexCore):
     def get_open_withdrawals(
         self,
         status: Optional[WithdrawalStatus] = None,
-        currency: Optional[str] = None
+        currency: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List open withdrawals. Results are sorted in inverse order of the CreatedAt field, and are limited to the first 1000.
 
@@ -839,6 +1107,8 @@ class BittrexV3(BittrexCore):
 
             currency {Optional[str]} -- filter by currency (optional)
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of Withdrawals
         """
@@ -850,7 +1120,8 @@ class BittrexV3(BittrexCore):
                 Keys.STATUS:status,
                 Keys.CURRENCY_SYMBOL:currency
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -876,7 +1147,8 @@ class BittrexV3(BittrexCore):
         previous_page_token: Optional[str] = None,
         page_size: Optional[int] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List open withdrawals. Results are sorted in inverse order of the CreatedAt field, and are limited to the first 1000.
 
@@ -895,6 +1167,8 @@ class BittrexV3(BittrexCore):
 
             end_date {Optional[str]} -- (optional) Filters out result after this timestamp. Uses the same format as StartDate. Either, both, or neither of StartDate and EndDate can be set. The only constraint on the pair is that, if both are set, then EndDate cannot be before StartDate. (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of withdrawals
         """
@@ -911,7 +1185,8 @@ class BittrexV3(BittrexCore):
                 Keys.START_DATE:start_date,
                 Keys.END_DATE:end_date
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -931,13 +1206,17 @@ class BittrexV3(BittrexCore):
     # ]
     def get_withdrawals_by_tx_id(
         self,
-        tx_id: str
+        tx_id: str,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """Retrieves all withdrawals for this account with the given TxId
 
         Arguments:
             tx_id {str} -- the transaction id to lookup
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of withdrawals
         """
@@ -945,7 +1224,8 @@ class BittrexV3(BittrexCore):
         return self.__request(
             EndPoints.WITHDRAWALS, EndPoints.BY_TX_ID, tx_id,
             method=RequestMethod.GET,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -963,22 +1243,27 @@ class BittrexV3(BittrexCore):
     # }
     def get_deposits_by_withdrawal_id(
         self,
-        withdrawal_id: str
+        withdrawal_id: str,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         """Retrieve information on a specified withdrawal.
 
         Arguments:
             withdrawal_id {str} -- (uuid-formatted string) - ID of the withdrawal to retrieve
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Withdrawal
         """
 
-        return self.__request(
+        return self.__terminal('withdrawal', withdrawal_id, lambda: self.__request(
             EndPoints.WITHDRAWALS, withdrawal_id,
             method=RequestMethod.GET,
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        ))
 
 
     # ------------------------------------------------------------ Orders ------------------------------------------------------------ #
@@ -1010,25 +1295,29 @@ class BittrexV3(BittrexCore):
     # ]
     def get_open_orders(
         self,
-        market: Optional[str] = None
+        market: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List open orders.
 
         Keyword Arguments:
             market {Optional[str]} -- filter by market (optional)
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of orders
         """
 
-        return self.__request(
+        return self.__in_ticks('orders', self.__request(
             EndPoints.ORDERS, EndPoints.OPEN,
             method=RequestMethod.GET,
             params={
                 Keys.MARKET_SYMBOL:self.__optionally_reversed_market_name(market)
             },
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        ))
 
     # Response:
     # [
@@ -1062,7 +1351,8 @@ class BittrexV3(BittrexCore):
         previous_page_token: Optional[str] = None,
         page_size: Optional[int] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List closed orders. StartDate and EndDate filters apply to the ClosedAt field. Pagination and the sort order of the results are in inverse order of the ClosedAt field.
 
@@ -1079,11 +1369,13 @@ class BittrexV3(BittrexCore):
 
             end_date {Optional[str]} -- (optional) Filters out result after this timestamp. Uses the same format as StartDate. Either, both, or neither of StartDate and EndDate can be set. The only constraint on the pair is that, if both are set, then EndDate cannot be before StartDate. (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of orders
         """
 
-        return self.__request(
+        return self.__in_ticks('orders', self.__terminals('order', self.__request(
             EndPoints.ORDERS, EndPoints.CLOSED,
             method=RequestMethod.GET,
             params={
@@ -1094,8 +1386,9 @@ class BittrexV3(BittrexCore):
                 Keys.START_DATE:start_date,
                 Keys.END_DATE:end_date
             },
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        )))
 
     # Response:
     # {
@@ -1122,22 +1415,27 @@ class BittrexV3(BittrexCore):
     # }
     def get_order_by_id(
         self,
-        order_id: str
+        order_id: str,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         """Retrieve information on a specific order.
 
         Arguments:
             order_id {str} -- (uuid-formatted string) - ID of order to retrieve
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Order
         """
 
-        return self.__request(
+        return self.__in_ticks('order', self.__terminal('order', order_id, lambda: self.__request(
             EndPoints.ORDERS, order_id,
             method=RequestMethod.GET,
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        )))
 
     # Response:
     # {
@@ -1164,42 +1462,229 @@ class BittrexV3(BittrexCore):
     # }
     def cancel_order(
         self,
-        order_id: str
+        order_id: str,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         """Cancel an order.
 
         Arguments:
             order_id {str} -- (uuid-formatted string) - ID of order to cancel
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Order
         """
 
-        return self.__request(
+        order = self.__balances_changed(self.__in_ticks('order', self.__request(
             EndPoints.ORDERS, order_id,
             method=RequestMethod.DELETE,
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        )))
+
+        if order is not None and self.order_tracker is not None:
+            self.order_tracker.update(order)
+
+        return order
+
+    # Response:
+    # [
+    #     {
+    #         "id": "string (uuid)",
+    #         "statusCode": "string",
+    #         "result": "Order"
+    #     }
+    # ]
+    def cancel_open_orders(
+        self,
+        market: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Optional[List[Dict]]:
+        """Bulk cancel all open orders (can be limited to a specified market)
+
+        Keyword Arguments:
+            market {Optional[str]} -- filter by market (optional)
+
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
+        Returns:
+            Optional[List[Dict]] -- List of BatchResponses, one per order
+        """
+
+        return self.__balances_changed(self.__in_ticks('order_batch', self.__request(
+            EndPoints.ORDERS, EndPoints.OPEN,
+            method=RequestMethod.DELETE,
+            params={
+                Keys.MARKET_SYMBOL:self.__optionally_reversed_market_name(market)
+            },
+            signed=True,
+            deadline=deadline
+        )))
 
     def post_order(
         self,
-        order_dict: Dict
+        order_dict: Dict,
+        deadline: Optional[float] = None
     ):
-        """Cancel an order.
+        """Create a new order. Retries are idempotent: the order gets a clientOrderId (if it has none),
+        and after an ambiguous failure (timeout, 5xx...) the order is looked up by it before being sent again.
 
         Arguments:
             order_dict {str} -- (CHECK: 'create_new_order_dict') | order to create
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- Order
         """
 
-        return self.__request(
+        if self.fixed_point is not None:
+            order_dict = self.__without_ticks(order_dict)
+
+        if self.validator is not None:
+            try:
+                order_dict = self.__validated(order_dict)
+            except OrderValidationError as e:
+                return self.requests.fail(e)
+
+        order_dict = self.__with_client_id(order_dict, Keys.CLIENT_ORDER_ID)
+        client_order_id = self.__dict_value(order_dict, Keys.CLIENT_ORDER_ID)
+        market = self.__optionally_reversed_market_name(self.__dict_value(order_dict, Keys.MARKET_SYMBOL))
+        deadline = Deadline.of(deadline)
+
+        def find() -> Optional[Dict]:
+            return self.find_order(client_order_id, market=market, deadline=deadline and deadline.remaining())
+
+        order = self.__in_ticks('order', self.__request(
             EndPoints.ORDERS,
             method=RequestMethod.POST,
             body=order_dict,
-            signed=True
-        )
+            signed=True,
+            reconcile=lambda error: self.__reconcile(error, find),
+            deadline=deadline
+        ))
+
+        if order is not None and self.balance_cache is not None:
+            self.__reserve_balance(order_dict)
+
+        if order is not None and self.order_tracker is not None:
+            self.order_tracker.track(order)
+
+        return order
+
+    def find_order(
+        self,
+        client_order_id: str,
+        market: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Optional[Dict]:
+        """Looks up an order by its clientOrderId among the open orders and the latest page (200) of closed orders.
+        An order closed before those 200 is not found.
+
+        Arguments:
+            client_order_id {str} -- client-provided identifier of the order
+
+        Keyword Arguments:
+            market {Optional[str]} -- market of the order, narrows the search (default: {None})
+
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
+        Returns:
+            Optional[Dict] -- Order, None if not found
+        """
+
+        deadline = Deadline.of(deadline)
+
+        for get_orders in [self.get_open_orders, lambda market, deadline: self.get_closed_orders(market=market, page_size=200, deadline=deadline)]:
+            for order in get_orders(market=market, deadline=deadline and deadline.remaining()) or []:
+                if order.get(Keys.CLIENT_ORDER_ID.value) == client_order_id:
+                    return order
+
+        return None
+
+    def submit_order(
+        self,
+        order_dict: Dict,
+        deadline: Optional[float] = None
+    ) -> Future:
+        """Posts an order (waiting for the acknowledgement only) and returns a future of its final state (CHECK: 'watch_order')
+
+        Arguments:
+            order_dict {str} -- (CHECK: 'create_new_order_dict') | order to create
+
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds posting may take, retries and waits included (default: {None})
+
+        Returns:
+            Future -- resolves with the closed Order, or fails with the error of posting it
+        """
+
+        try:
+            order = self.post_order(order_dict, deadline=deadline)
+        except BittrexError as e:
+            order, error = None, e
+        else:
+            error = self.requests.last_error
+
+        if order is None:
+            future = Future()
+            future.set_exception(error or BittrexError('The order could not be posted'))
+
+            return future
+
+        return self.watch_order(order)
+
+    def watch_order(self, order: Union[Dict, str]) -> Future:
+        """A future resolving once the order is closed (filled, cancelled or expired). All pending futures share one poller thread
+        reconciling 'order_tracker' with 2 requests per round, backing off while nothing changes. Needs an 'order_tracker' or 'order_poller'.
+
+        Arguments:
+            order {Union[Dict, str]} -- Order, or its id
+
+        Returns:
+            Future -- resolves with the closed Order
+        """
+
+        if self.order_poller is None:
+            raise ValueError('Watching orders needs an order_tracker or an order_poller')
+
+        if isinstance(order, str):
+            order = self.order_tracker.order(order) or self.get_order_by_id(order)
+
+            if order is None:
+                future = Future()
+                future.set_exception(self.requests.last_error or BittrexError('The order could not be loaded'))
+
+                return future
+
+        return self.order_poller.watch(order)
+
+    def wait_for_fill(self, order: Union[Dict, str], timeout: Optional[float] = None) -> Optional[Dict]:
+        """Blocks until the order is closed (CHECK: 'watch_order')
+
+        Arguments:
+            order {Union[Dict, str]} -- Order, or its id
+
+        Keyword Arguments:
+            timeout {Optional[float]} -- seconds to wait at most (default: {None})
+
+        Returns:
+            Optional[Dict] -- the closed Order ('status' CLOSED, 'fillQuantity' tells how much filled), None if still open after 'timeout'
+        """
+
+        future = self.watch_order(order)
+
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # Nobody is left waiting, the poller must not keep polling for it
+            if self.order_poller.unwatch(future):
+                return None
+
+            return future.result()
 
 
     # ------------------------------------------------------ Conditional Orders ------------------------------------------------------ #
@@ -1234,21 +1719,25 @@ class BittrexV3(BittrexCore):
     #     "updatedAt": "string (date-time)",
     #     "closedAt": "string (date-time)"
     # }
-    def get_conditional_order(self, uuid: str) -> Optional[Dict]:
+    def get_conditional_order(self, uuid: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Retrieve information on a specific conditional order.
 
         Arguments:
             uuid {str} -- (uuid-formatted string) - ID of conditional order to retrieve
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- ConditionalOrder
         """
 
-        return self.__request(
+        return self.__terminal('conditional_order', uuid, lambda: self.__request(
             EndPoints.CONDITIONAL_ORDERS, uuid,
             method=RequestMethod.GET,
-            signed=True
-        )
+            signed=True,
+            deadline=deadline
+        ))
 
     # Response:
     # {
@@ -1280,12 +1769,15 @@ class BittrexV3(BittrexCore):
     #     "updatedAt": "string (date-time)",
     #     "closedAt": "string (date-time)"
     # }
-    def cancel_conditional_order(self, uuid: str) -> Optional[Dict]:
+    def cancel_conditional_order(self, uuid: str, deadline: Optional[float] = None) -> Optional[Dict]:
         """Cancel a conditional order.
 
         Arguments:
             uuid {str} -- (uuid-formatted string) - ID of order to cancel
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[Dict] -- ConditionalOrder
         """
@@ -1293,7 +1785,8 @@ class BittrexV3(BittrexCore):
         return self.__request(
             EndPoints.CONDITIONAL_ORDERS, uuid,
             method=RequestMethod.DELETE,
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -1335,7 +1828,8 @@ class BittrexV3(BittrexCore):
         previous_page_token: Optional[str] = None,
         page_size: Optional[int] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[List[Dict]]:
         """List closed conditional orders. StartDate and EndDate filters apply to the ClosedAt field. Pagination and the sort order of the results are in inverse order of the ClosedAt field.
 
@@ -1352,6 +1846,8 @@ class BittrexV3(BittrexCore):
 
             end_date {Optional[str]} -- (optional) Filters out result after this timestamp. Uses the same format as StartDate. Either, both, or neither of StartDate and EndDate can be set. The only constraint on the pair is that, if both are set, then EndDate cannot be before StartDate. (default: {None})
 
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of ConditionalOrders
         """
@@ -1367,7 +1863,8 @@ class BittrexV3(BittrexCore):
                 Keys.START_DATE:start_date,
                 Keys.END_DATE:end_date
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -1402,12 +1899,15 @@ class BittrexV3(BittrexCore):
     #         "closedAt": "string (date-time)"
     #     }
     # ]
-    def get_open_conditional_orders(self, market: Optional[str]) -> Optional[List[Dict]]:
+    def get_open_conditional_orders(self, market: Optional[str], deadline: Optional[float] = None) -> Optional[List[Dict]]:
         """List open conditional orders.
 
         Arguments:
             market {Optional[str]} -- filter by market (optional)
 
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
         Returns:
             Optional[List[Dict]] -- List of ConditionalOrders
         """
@@ -1418,7 +1918,8 @@ class BittrexV3(BittrexCore):
             params={
                 Keys.MARKET_SYMBOL:self.__optionally_reversed_market_name(market)
             },
-            signed=True
+            signed=True,
+            deadline=deadline
         )
 
     # Response:
@@ -1459,7 +1960,8 @@ class BittrexV3(BittrexCore):
         operand: Optional[ConditionalOrderOperand] = None,
         trigger_price: Optional[float] = None,
         trailing_stop_percent: Optional[float] = None,
-        client_conditional_order_id: Optional[str] = None
+        client_conditional_order_id: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Optional[Dict]:
         """Create a new conditional order
 
@@ -1477,13 +1979,24 @@ class BittrexV3(BittrexCore):
 
             trailing_stop_percent {Optional[float]} -- the stop price will automatically adjust relative to the most extreme trade value seen. (either this or trigger price must be specified) (default: {None})
 
-            client_conditional_order_id {Optional[str]} -- [description] (default: {None})
+            client_conditional_order_id {Optional[str]} -- client-provided identifier, generated if None. Retries after ambiguous failures look the conditional order up by it before sending it again. (default: {None})
+
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
 
         Returns:
             Optional[Dict] -- NewConditionalOrder
         """
 
-        return self.__request(
+        client_conditional_order_id = client_conditional_order_id or self.__new_client_id()
+        deadline = Deadline.of(deadline)
+
+        if self.fixed_point is not None:
+            order_to_create = self.__without_ticks(order_to_create)
+
+        def find() -> Optional[Dict]:
+            return self.find_conditional_order(client_conditional_order_id, market=market, deadline=deadline and deadline.remaining())
+
+        return self.__balances_changed(self.__request(
             EndPoints.CONDITIONAL_ORDERS,
             method=RequestMethod.POST,
             body={
@@ -1495,10 +2008,177 @@ class BittrexV3(BittrexCore):
                 Keys.ORDER_TO_CANCEL: order_to_cancel,
                 Keys.CLIENT_CONDITIONAL_ORDER_ID: client_conditional_order_id
             },
-            signed=True
+            signed=True,
+            reconcile=lambda error: self.__reconcile(error, find),
+            deadline=deadline
+        ))
+
+    def find_conditional_order(
+        self,
+        client_conditional_order_id: str,
+        market: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Optional[Dict]:
+        """Looks up a conditional order by its clientConditionalOrderId among the open conditional orders and the latest page (200) of closed ones.
+        A conditional order closed before those 200 is not found.
+
+        Arguments:
+            client_conditional_order_id {str} -- client-provided identifier of the conditional order
+
+        Keyword Arguments:
+            market {Optional[str]} -- market of the conditional order, narrows the search (default: {None})
+
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
+        Returns:
+            Optional[Dict] -- ConditionalOrder, None if not found
+        """
+
+        deadline = Deadline.of(deadline)
+
+        for get_orders in [
+            self.get_open_conditional_orders,
+            lambda market, deadline: self.get_closed_conditional_orders(market=market, page_size=200, deadline=deadline)
+        ]:
+            for order in get_orders(market=market, deadline=deadline and deadline.remaining()) or []:
+                if order.get(Keys.CLIENT_CONDITIONAL_ORDER_ID.value) == client_conditional_order_id:
+                    return order
+
+        return None
+
+
+    # ------------------------------------------------------- Account snapshot ------------------------------------------------------- #
+
+    def get_account_snapshot(self, deadline: Optional[float] = None, max_workers: int = 8) -> AccountSnapshot:
+        """Fetches the account, its 30 day volume, balances, open orders, open conditional orders, open deposits and open withdrawals
+        concurrently (each request still waits for its share of the rate budget), stamped with the server time fetched alongside them.
+        Balances come from 'balance_cache' while it is fresh.
+
+        Keyword Arguments:
+            deadline {Optional[float]} -- seconds the whole call may take, retries and waits included (default: {None})
+
+            max_workers {int} -- requests in flight at once (default: {8})
+
+        Returns:
+            AccountSnapshot -- snapshot, the parts that failed are None with their error in 'errors'
+        """
+
+        start = time.perf_counter()
+        deadline = Deadline.of(deadline)
+        calls = {
+            'server_time':             self.ping,
+            'account':                 self.get_account,
+            'volume':                  self.get_account_volume,
+            'balances':                self.get_balances,
+            'open_orders':             self.get_open_orders,
+            'open_conditional_orders': lambda deadline: self.get_open_conditional_orders(None, deadline=deadline),
+            'open_deposits':           self.get_open_deposits,
+            'open_withdrawals':        self.get_open_withdrawals
+        }
+
+        with ThreadPoolExecutor(max_workers=max(min(max_workers, len(calls)), 1)) as executor:
+            futures = {
+                name:executor.submit(self.__call, lambda call=call: call(deadline=deadline and deadline.remaining()))
+                for name, call in calls.items()
+            }
+            results = {name:future.result() for name, future in futures.items()}
+
+        fields = {name:result for name, (result, _) in results.items()}
+        fields['server_time'] = (fields['server_time'] or {}).get('serverTime')
+
+        return AccountSnapshot(
+            errors={name:error or BittrexError('No response') for name, (result, error) in results.items() if result is None},
+            seconds=time.perf_counter() - start,
+            **fields
         )
 
 
+    # --------------------------------------------------------- Change feeds --------------------------------------------------------- #
+
+    def ticker_feed(
+        self,
+        threshold_bps: float = 0,
+        thresholds: Optional[Dict[str, float]] = None,
+        fields: Optional[List[str]] = None
+    ) -> ChangeFeed:
+        """A feed of the tickers that moved, polled with 'get_tickers' (one request for every market). Call 'start' on it to poll in the background.
+
+        Keyword Arguments:
+            threshold_bps {float} -- move needed on one of the fields, 0 for any change (default: {0})
+
+            thresholds {Optional[Dict[str, float]]} -- move needed per market (default: {None})
+
+            fields {Optional[List[str]]} -- fields compared (default: {['bidRate', 'askRate', 'lastTradeRate']})
+
+        Returns:
+            ChangeFeed -- feed, 'add_listener' for callbacks or 'changes' for an async iterator
+        """
+
+        return self.__change_feed(self.get_tickers, fields or TICKER_FIELDS, threshold_bps, thresholds)
+
+    def market_summary_feed(
+        self,
+        threshold_bps: float = 0,
+        thresholds: Optional[Dict[str, float]] = None,
+        fields: Optional[List[str]] = None
+    ) -> ChangeFeed:
+        """A feed of the market summaries that moved, polled with 'get_market_summaries' (one request for every market). Call 'start' on it to poll in the background.
+
+        Keyword Arguments:
+            threshold_bps {float} -- move needed on one of the fields, 0 for any change (default: {0})
+
+            thresholds {Optional[Dict[str, float]]} -- move needed per market (default: {None})
+
+            fields {Optional[List[str]]} -- fields compared (default: {['high', 'low', 'volume', 'quoteVolume']})
+
+        Returns:
+            ChangeFeed -- feed, 'add_listener' for callbacks or 'changes' for an async iterator
+        """
+
+        return self.__change_feed(self.get_market_summaries, fields or MARKET_SUMMARY_FIELDS, threshold_bps, thresholds)
+
+
+    # ---------------------------------------------------------- Kill switch --------------------------------------------------------- #
+
+    def cancel_all(
+        self,
+        market: Optional[str] = None,
+        deadline: Optional[float] = None,
+        max_workers: int = 16
+    ) -> Dict:
+        """Cancels every open order and conditional order (of 'market', if given), everything at the top scheduler priority.
+        Open orders go with one bulk request (with one cancel per order, sent concurrently, if that fails), conditional orders are cancelled concurrently.
+
+        Keyword Arguments:
+            market {Optional[str]} -- only cancel the orders of this market (default: {None})
+
+            deadline {Optional[float]} -- seconds the whole call may take, pass one (eg. 1) to skip the retry waits (default: {None})
+
+            max_workers {int} -- cancels sent at once (default: {16})
+
+        Returns:
+            Dict -- {'orders': [...], 'conditional_orders': [...], 'seconds': float}, every cancel as {'id', 'success', 'result', 'error', 'seconds'}
+                    ('id' is None if the orders could not even be listed)
+        """
+
+        start = time.perf_counter()
+        deadline = Deadline.of(deadline)
+
+        # The conditional orders are listed on a worker, which needs another one for its cancels
+        with ThreadPoolExecutor(max_workers=max(max_workers, 2)) as executor:
+            conditional_orders = executor.submit(
+                self.__cancel_each,
+                EndPoints.CONDITIONAL_ORDERS, self.cancel_conditional_order, market, deadline, executor
+            )
+            orders = self.__cancel_open_orders(market, deadline, executor)
+
+            return {
+                'orders': orders,
+                'conditional_orders': conditional_orders.result(),
+                'seconds': time.perf_counter() - start
+            }
+
+
     # ------------------------------------------------------- Helper methods --------------------------------------------------------- #
 
     def create_new_order_dict(
@@ -1525,28 +2205,34 @@ class BittrexV3(BittrexCore):
             time_in_force {TimeInForce} -- time in force
 
         Keyword Arguments:
-            quantity {Optional[float]} -- quantity (optional, must be included for non-ceiling orders and excluded for ceiling orders) (default: {None})
+            quantity {Optional[float]} -- quantity, in ticks with 'fixed_point' (optional, must be included for non-ceiling orders and excluded for ceiling orders) (default: {None})
 
-            ceiling {Optional[float]} -- must be included for ceiling orders and excluded for non-ceiling orders (default: {None})
+            ceiling {Optional[float]} -- quote amount, in amount ticks (10^-8) with 'fixed_point', must be included for ceiling orders and excluded for non-ceiling orders (default: {None})
 
-            limit {Optional[float]} -- must be included for LIMIT orders and excluded for MARKET orders (default: {None})
+            limit {Optional[float]} -- in ticks with 'fixed_point', must be included for LIMIT orders and excluded for MARKET orders (default: {None})
 
-            client_order_id {Optional[str]} -- client-provided identifier for advanced order tracking (default: {None})
+            client_order_id {Optional[str]} -- client-provided identifier for advanced order tracking, generated if None (it makes retries idempotent) (default: {None})
 
             use_awards {Optional[bool]} -- option to use Bittrex credits for the order (default: {None})
 
         Returns:
             Dict -- NewOrder
         """
+        market = self.__optionally_reversed_market_name(market)
+
+        # Ticks are exact already
+        if self.validator is not None and self.fixed_point is None:
+            quantity, limit = self.validator.round(market, direction, quantity=quantity, limit=limit)
+
         return {
-            Keys.MARKET_SYMBOL:self.__optionally_reversed_market_name(market),
+            Keys.MARKET_SYMBOL:market,
             Keys.DIRECTION:direction,
             Keys.ORDER_TYPE:type,
             Keys.TIME_IN_FORCE:time_in_force,
             Keys.QUANTITY:quantity,
             Keys.CEILING:ceiling,
             Keys.LIMIT:limit,
-            Keys.CLIENT_ORDER_ID:client_order_id,
+            Keys.CLIENT_ORDER_ID:client_order_id or self.__new_client_id(),
             Keys.USE_AWARDS:use_awards,
         }
 
@@ -1570,6 +2256,20 @@ class BittrexV3(BittrexCore):
         }
 
 
+    def _closed_orders_page(self, cursor: Optional[str], page_size: int) -> Optional[List[Dict]]:
+        # The closed orders after 'cursor' (or the latest ones), the loader of 'order_tracker'
+        return self.get_closed_orders(previous_page_token=cursor, page_size=page_size)
+
+    def _fetch_balances(self, deadline: Optional[float] = None) -> Optional[List[Dict]]:
+        # The balances from the server, also the loader of 'balance_cache'
+        return self.__request(
+            EndPoints.BALANCES,
+            method=RequestMethod.GET,
+            signed=True,
+            deadline=deadline
+        )
+
+
     # ------------------------------------------------------- Private methods -------------------------------------------------------- #
 
     def __request(
@@ -1581,51 +2281,318 @@ class BittrexV3(BittrexCore):
         signed: bool = False,
         needed_values: Optional[Dict] = None,
         unwanted_values: Optional[Dict] = None,
-        path: Optional[List] = None
+        path: Optional[List] = None,
+        reconcile: Optional[Callable[[BittrexError], Optional[JSONData]]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        hedge: Optional[str] = None,
+        priority: Optional[Priority] = None
     ) -> Optional[JSONData]:
         from .utils import crypto
 
-        nonce = str(crypto.nonce())
-        url = self.url_utils.url(*endpoint_args, params=params, use_nonce=False)
-        headers = {'Content-Type': 'application/json'}
+        group = 'v3/' + enums.optionally_get_enum_value(endpoint_args[0])
+        trace = self.requests.tracer.trace(group)
+
+        try:
+            with trace.span('url'):
+                url = self.url_utils.url(*endpoint_args, params=params, use_nonce=False)
+                headers = {'Content-Type': 'application/json'}
+
+            if signed:
+                content = ''
+
+                if body:
+                    with trace.span('enum_free_dict'):
+                        body = enums.enum_free_dict(body, remove_none_values=True)
+
+                    import json
+
+                    with trace.span('json_encode'):
+                        content = json.dumps(body)
+
+                with trace.span('hash'):
+                    content_hash = crypto.sha512(content)
+
+                key = self.__signing_key(method, endpoint_args)
+
+                def headers() -> Dict:
+                    # Signed again for every attempt, so retries carry a fresh (and clock synced) timestamp
+                    with trace.span('sign'):
+                        nonce = str(key.nonces.next())
+                        signature = key.sign(''.join([nonce, url, method.value, content_hash]))
+
+                    return {
+                        'Api-Timestamp': nonce,
+                        'Api-Key': key.api_key,
+                        'Content-Type': 'application/json',
+                        'Api-Content-Hash': content_hash,
+                        'Api-Signature': signature
+                    }
+
+            return self.requests.request(
+                url,
+                method,
+                params=None,
+                headers=headers,
+                data=body,
+                needed_values=needed_values,
+                unwanted_values=unwanted_values or ['code'],
+                path=path,
+                trace=trace,
+                reconcile=reconcile,
+                deadline=Deadline.of(deadline),
+                hedge=hedge if not signed else None,
+                group=group,
+                rate_limiter=key.rate_limiter if signed else None,
+                priority=priority if priority is not None else self.__priority(method, signed, endpoint_args)
+            )
+        finally:
+            trace.finish()
 
-        if signed:
-            content = ''
+    @staticmethod
+    def __priority(method: RequestMethod, signed: bool, endpoint_args: Tuple) -> Priority:
+        if method != RequestMethod.GET:
+            return Priority.ORDER
 
-            if body:
-                body = enums.enum_free_dict(body, remove_none_values=True)
+        # Historical candles carry their date in the same path segment (eg. 'historical/2020/1')
+        if any(arg == EndPoints.HISTORICAL or str(arg).startswith(EndPoints.HISTORICAL.value + '/') for arg in endpoint_args):
+            return Priority.BULK
 
-                import json
+        return Priority.ACCOUNT if signed else Priority.MARKET_DATA
 
-                content = json.dumps(body)
+    def __batched(
+        self,
+        kind: str,
+        single: Callable[[], Optional[Dict]],
+        bulk: Callable[..., Optional[List[Dict]]],
+        key: str,
+        value: str,
+        deadline: Optional[float]
+    ) -> Optional[Dict]:
+        if self.batcher is None:
+            return single()
 
-            content_hash = crypto.sha512(content)
-            signature = crypto.signature(
-                ''.join([str(nonce), url, method.value, content_hash]),
-                self.api_secret
-            )
+        def select(rows: List[Dict]) -> Optional[Dict]:
+            return next((row for row in rows if str(row.get(key, '')).upper() == value.upper()), None)
+
+        def bulk_or_raise() -> List[Dict]:
+            # Raised, the error of a failed bulk call reaches every call of the batch, not only the thread that sent it
+            rows, error = self.__call(lambda: bulk(deadline=deadline))
+
+            if rows is None:
+                raise error or BittrexError('No response')
+
+            return rows
+
+        try:
+            return self.batcher.call(kind, single, bulk_or_raise, select, timeout=deadline)
+        except BittrexError as e:
+            return self.requests.fail(e)
+
+    def __signing_key(self, method: RequestMethod, endpoint_args: Tuple) -> ApiKey:
+        if self.key_pool is not None:
+            # The keys of a pool may belong to other (sub)accounts, so only reads sent inside 'sharded' take the key with the most budget left,
+            # and lookups of the orders and balances the client acts on (find_order, the tracker and balance loaders, ...) never do
+            owned = any(endpoint in endpoint_args for endpoint in [EndPoints.ORDERS, EndPoints.CONDITIONAL_ORDERS, EndPoints.BALANCES])
+            shard = method == RequestMethod.GET and not owned and getattr(self.__local, 'sharded', False)
+            key = self.key_pool.acquire() if shard else self.key_pool.get(self.api_key)
+
+            if key is not None:
+                return key
+
+        return ApiKey(self.api_key, self.api_secret)
+
+    def __cancel_open_orders(self, market: Optional[str], deadline: Optional[Deadline], executor: ThreadPoolExecutor) -> List[Dict]:
+        start = time.perf_counter()
+        responses = self.__call(lambda: self.cancel_open_orders(market=market, deadline=deadline))[0]
 
-            headers = {
-                'Api-Timestamp': nonce,
-                'Api-Key': self.api_key,
-                'Content-Type': 'application/json',
-                'Api-Content-Hash': content_hash,
-                'Api-Signature': signature
+        if responses is None:
+            return self.__cancel_each(EndPoints.ORDERS, self.cancel_order, market, deadline, executor)
+
+        seconds = time.perf_counter() - start
+
+        return [
+            {
+                'id': response.get('id'),
+                'success': response.get('statusCode') == 'SUCCESS',
+                'result': response.get('result'),
+                'error': api_error(response.get('statusCode'), body=response) if response.get('statusCode') != 'SUCCESS' else None,
+                'seconds': seconds
             }
+            for response in responses
+        ]
+
+    def __cancel_each(
+        self,
+        endpoint: EndPoints,
+        cancel: Callable[..., Optional[Dict]],
+        market: Optional[str],
+        deadline: Optional[Deadline],
+        executor: ThreadPoolExecutor
+    ) -> List[Dict]:
+        start = time.perf_counter()
+        open_orders, error = self.__call(lambda: self.__request(
+            endpoint, EndPoints.OPEN,
+            method=RequestMethod.GET,
+            params={
+                Keys.MARKET_SYMBOL:self.__optionally_reversed_market_name(market)
+            },
+            signed=True,
+            deadline=deadline,
+            priority=Priority.ORDER
+        ))
+
+        if open_orders is None:
+            return [{'id': None, 'success': False, 'result': None, 'error': error, 'seconds': time.perf_counter() - start}]
+
+        def cancel_one(order_id: str) -> Dict:
+            cancel_start = time.perf_counter()
+            result, cancel_error = self.__call(lambda: cancel(order_id, deadline=deadline))
+
+            return {'id': order_id, 'success': result is not None, 'result': result, 'error': cancel_error, 'seconds': time.perf_counter() - cancel_start}
 
-        return self.requests.request(
-            url,
-            method,
-            params=None,
-            headers=headers,
-            data=body,
-            needed_values=needed_values,
-            unwanted_values=unwanted_values or ['code'],
-            path=path
+        return [future.result() for future in [executor.submit(cancel_one, order[Keys.ID.value]) for order in open_orders]]
+
+    def __call(self, call: Callable[[], Optional[JSONData]]) -> Tuple[Optional[JSONData], Optional[BittrexError]]:
+        # The result and the error of a call, whether errors are raised or not
+        try:
+            result = call()
+        except BittrexError as e:
+            return None, e
+
+        return result, self.requests.last_error if result is None else None
+
+    def __change_feed(
+        self,
+        loader: Callable[[], Optional[List[Dict]]],
+        fields: List[str],
+        threshold_bps: float,
+        thresholds: Optional[Dict[str, float]]
+    ) -> ChangeFeed:
+        # Rows name their markets the v3 way
+        thresholds = {self.__optionally_reversed_market_name(market):threshold for market, threshold in (thresholds or {}).items()}
+
+        return ChangeFeed(loader, fields, threshold_bps=threshold_bps, thresholds=thresholds, debug_level=self.requests.debug_level)
+
+    def __reconcile(self, error: BittrexError, find: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        # Only a create request that may have been executed is worth a lookup
+        if not error.ambiguous and error.code not in DUPLICATE_ERROR_CODES:
+            return None
+
+        try:
+            # Best effort inside a failed attempt, so no retries (nor their sleeps) on top of the attempt's own
+            with self.requests.tries(1):
+                return find()
+        except BittrexError:
+            # Not knowing is fine, sending again with the same client id can not create a second order
+            return None
+
+    @staticmethod
+    def __new_client_id() -> str:
+        return str(uuid.uuid4())
+
+    def __in_ticks(self, kind: str, data: Optional[JSONData], market: Optional[str] = None) -> Optional[JSONData]:
+        if self.fixed_point is None or data is None:
+            return data
+
+        # Orders carry their market, books, trades and candles need the one they were asked for
+        convert = getattr(self.fixed_point, kind)
+
+        return convert(market, data) if kind in ['orderbook', 'trades', 'candles'] else convert(data)
+
+    def __without_ticks(self, order_dict: Dict) -> Dict:
+        # Int ticks as exact decimal strings, the way they are serialized into the body
+        market = self.__dict_value(order_dict, Keys.MARKET_SYMBOL)
+        d = dict(order_dict)
+
+        for key, to_string in [
+            (Keys.QUANTITY, self.fixed_point.amount_string),
+            (Keys.LIMIT, lambda ticks: self.fixed_point.price_string(market, ticks)),
+            (Keys.CEILING, self.fixed_point.amount_string)
+        ]:
+            value = self.__dict_value(d, key)
+
+            if isinstance(value, int) and not isinstance(value, bool):
+                d.pop(key.value, None)
+                d[key] = to_string(value)
+
+        return d
+
+    def __terminal(self, kind: str, resource_id: str, fetch: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        # Resources in a final status are served from 'terminal_cache' for good
+        if self.terminal_cache is None:
+            return fetch()
+
+        resource = self.terminal_cache.get(kind, resource_id)
+
+        if resource is None:
+            resource = fetch()
+            self.terminal_cache.put(kind, resource)
+
+        return resource
+
+    def __terminals(self, kind: str, resources: Optional[List[Dict]]) -> Optional[List[Dict]]:
+        if self.terminal_cache is not None:
+            for resource in resources or []:
+                self.terminal_cache.put(kind, resource)
+
+        return resources
+
+    def __balances_changed(self, result: Optional[JSONData]) -> Optional[JSONData]:
+        if result is not None and self.balance_cache is not None:
+            self.balance_cache.invalidate()
+
+        return result
+
+    def __reserve_balance(self, order_dict: Dict) -> None:
+        # Takes what a posted order holds off the available balance, the next reload corrects it (commissions, fills)
+        market = self.symbols.market(self.__dict_value(order_dict, Keys.MARKET_SYMBOL), legacy=False)
+        quantity = self.__dict_value(order_dict, Keys.QUANTITY)
+        limit = self.__dict_value(order_dict, Keys.LIMIT)
+        buy = enums.optionally_get_enum_value(self.__dict_value(order_dict, Keys.DIRECTION)) == OrderDirection.BUY.value
+
+        # Unknown market, or a market or ceiling order of unknown cost
+        if market is None or quantity is None or (buy and limit is None):
+            self.balance_cache.invalidate()
+
+            return
+
+        if buy:
+            self.balance_cache.adjust(market.quote, -Decimal(str(quantity)) * Decimal(str(limit)))
+        else:
+            self.balance_cache.adjust(market.base, -Decimal(str(quantity)))
+
+    def __validated(self, order_dict: Dict) -> Dict:
+        quantity, limit = self.validator.validate(
+            self.__dict_value(order_dict, Keys.MARKET_SYMBOL),
+            self.__dict_value(order_dict, Keys.DIRECTION),
+            quantity=self.__dict_value(order_dict, Keys.QUANTITY),
+            limit=self.__dict_value(order_dict, Keys.LIMIT)
         )
 
+        d = {k:v for k, v in order_dict.items() if k not in [Keys.QUANTITY, Keys.QUANTITY.value, Keys.LIMIT, Keys.LIMIT.value]}
+        d[Keys.QUANTITY] = quantity
+        d[Keys.LIMIT] = limit
+
+        return d
+
+    @classmethod
+    def __with_client_id(cls, d: Dict, key: Keys) -> Dict:
+        if cls.__dict_value(d, key) is not None:
+            return d
+
+        d = dict(d)
+        d[key] = cls.__new_client_id()
+
+        return d
+
+    @staticmethod
+    def __dict_value(d: Dict, key: Keys) -> Optional[str]:
+        value = d.get(key)
+
+        return value if value is not None else d.get(key.value)
+
     def __optionally_reversed_market_name(self, market_name: Optional[str]) -> Optional[str]:
-        return market_name if market_name is None or not self.REVERSE_MARKET_NAMES else '-'.join(market_name.split('-')[::-1])
+        return market_name if market_name is None or not self.REVERSE_MARKET_NAMES else self.symbols.reversed_name(market_name)
 
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
\ No newline at end of file
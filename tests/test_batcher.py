@@ -0,0 +1,66 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import threading, unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+from bittrex_api.utils.batcher import Batcher
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: BatcherTests --------------------------------------------------------- #
+
+class BatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}).start()
+        self.client = BittrexV3('k', 's', base_url=self.server.base_url(3), debug_level=0, batcher=Batcher(window=0.2, min_batch=3), reverse_market_names=False)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def concurrently(self, call, items):
+        barrier = threading.Barrier(len(items))
+
+        def run(item):
+            barrier.wait()
+
+            return call(item)
+
+        with ThreadPoolExecutor(len(items)) as executor:
+            return list(executor.map(run, items))
+
+    def test_concurrent_tickers_share_one_request(self):
+        symbols = [market['symbol'] for market in self.server.state.markets[:5]]
+        tickers = self.concurrently(self.client.get_ticker, symbols)
+
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual([ticker['symbol'] for ticker in tickers], symbols)
+
+    def test_concurrent_balances_share_one_request(self):
+        currencies = [balance['currencySymbol'] for balance in self.client.get_balances()[:5]]
+        self.server.request_count = 0
+
+        balances = self.concurrently(self.client.get_balance, currencies)
+
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual([balance['currencySymbol'] for balance in balances], currencies)
+
+    def test_small_batch_sends_single_requests(self):
+        symbols = [market['symbol'] for market in self.server.state.markets[:2]]
+        tickers = self.concurrently(self.client.get_ticker, symbols)
+
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual([ticker['symbol'] for ticker in tickers], symbols)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, unittest
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+from bittrex_api.utils.circuit_breaker import CircuitBreaker, CircuitState
+from bittrex_api.utils.errors import CircuitOpenError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------ class: CircuitBreakerTests ----------------------------------------------------- #
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+        self.changes = []
+        self.breaker.add_listener(lambda group, previous, state: self.changes.append((previous, state)))
+
+    def fail(self, count):
+        for _ in range(count):
+            self.assertTrue(self.breaker.allow('g'))
+            self.breaker.record('g', False)
+
+    def test_opens_after_consecutive_failures(self):
+        self.fail(1)
+        self.assertEqual(self.breaker.state('g'), CircuitState.CLOSED)
+
+        # A success in between starts the count again
+        self.assertTrue(self.breaker.allow('g'))
+        self.breaker.record('g', True)
+        self.fail(1)
+        self.assertEqual(self.breaker.state('g'), CircuitState.CLOSED)
+
+        self.fail(1)
+        self.assertEqual(self.breaker.state('g'), CircuitState.OPEN)
+        self.assertEqual(self.changes, [(CircuitState.CLOSED, CircuitState.OPEN)])
+
+    def test_rejects_while_open(self):
+        self.fail(2)
+
+        self.assertFalse(self.breaker.allow('g'))
+        self.assertGreater(self.breaker.retry_after('g'), 0)
+        # Other groups are not affected
+        self.assertTrue(self.breaker.allow('other'))
+
+    def test_half_open_probe_closes(self):
+        self.fail(2)
+        time.sleep(0.15)
+
+        self.assertTrue(self.breaker.allow('g'))
+        self.assertEqual(self.breaker.state('g'), CircuitState.HALF_OPEN)
+        # Only 'probe_count' probes at a time
+        self.assertFalse(self.breaker.allow('g'))
+
+        self.breaker.record('g', True)
+        self.assertEqual(self.breaker.state('g'), CircuitState.CLOSED)
+        self.assertEqual(self.changes, [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED)
+        ])
+
+    def test_half_open_probe_failure_opens_again(self):
+        self.fail(2)
+        time.sleep(0.15)
+
+        self.assertTrue(self.breaker.allow('g'))
+        self.breaker.record('g', False)
+        self.assertEqual(self.breaker.state('g'), CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow('g'))
+
+    def test_released_probe_frees_its_slot(self):
+        self.fail(2)
+        time.sleep(0.15)
+
+        self.assertTrue(self.breaker.allow('g'))
+        self.breaker.release('g')
+        self.assertTrue(self.breaker.allow('g'))
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------- class: CircuitBreakerClientTests -------------------------------------------------- #
+
+class CircuitBreakerClientTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}, error_rate=1).start()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+        self.client = BittrexV3(
+            'k', 's', base_url=self.server.base_url(3), debug_level=0, max_request_try_count=1, circuit_breaker=self.breaker, reverse_market_names=False
+        )
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_open_circuit_fails_without_sending(self):
+        self.client.get_balances()
+        self.client.get_balances()
+        self.assertEqual(self.breaker.state('v3/balances'), CircuitState.OPEN)
+
+        self.assertIsNone(self.client.get_balances())
+        self.assertIsInstance(self.client.requests.last_error, CircuitOpenError)
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_recovered_server_closes_the_circuit(self):
+        self.client.get_balances()
+        self.client.get_balances()
+
+        self.server.error_rate = 0
+        time.sleep(0.25)
+
+        self.assertIsNotNone(self.client.get_balances())
+        self.assertEqual(self.breaker.state('v3/balances'), CircuitState.CLOSED)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
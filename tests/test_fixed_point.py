@@ -0,0 +1,54 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import unittest
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: FixedPointTests ------------------------------------------------------- #
+
+class FixedPointTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}).start()
+        self.market = self.server.state.markets[0]
+        self.market['precision'] = 3
+        self.client = BittrexV3('k', 's', base_url=self.server.base_url(3), debug_level=0, fixed_point=True, reverse_market_names=False)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_ceiling_order_round_trip(self):
+        # An order read back in ticks and posted again sends the same limit and ceiling
+        with self.server.state.lock:
+            self.server.state.orders['read'] = {
+                'id': 'read', 'marketSymbol': self.market['symbol'], 'direction': 'BUY', 'type': 'CEILING_LIMIT', 'quantity': None,
+                'limit': '1.234', 'ceiling': '12.345', 'timeInForce': 'IMMEDIATE_OR_CANCEL', 'fillQuantity': '0', 'commission': '0',
+                'proceeds': '0', 'status': 'CLOSED'
+            }
+
+        read = self.client.get_order_by_id('read')
+        self.assertEqual(read['limit'], 1234)
+        self.assertEqual(read['ceiling'], 1234500000)
+
+        posted = self.client.post_order(self.client.create_new_order_dict(
+            read['marketSymbol'], read['direction'], read['type'], read['timeInForce'], ceiling=read['ceiling'], limit=read['limit']
+        ))
+
+        sent = self.server.state.orders[posted['id']]
+        self.assertEqual(sent['limit'], '1.234')
+        self.assertEqual(sent['ceiling'], '12.345')
+        self.assertEqual(posted['ceiling'], read['ceiling'])
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
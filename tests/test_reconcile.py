@@ -0,0 +1,79 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import unittest
+
+# Pip
+import requests
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+from bittrex_api.utils.transport import HTTPTransport
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: LostResponseTransport -------------------------------------------------- #
+
+class LostResponseTransport(HTTPTransport):
+    """Sends every request, but loses the response of the first POST, as a read timeout after the server executed it"""
+
+    def __init__(self):
+        super().__init__()
+
+        self.posts = 0
+
+    def send(self, method, url, **kwargs):
+        response = super().send(method, url, **kwargs)
+
+        if method == 'POST':
+            self.posts += 1
+
+            if self.posts == 1:
+                raise requests.exceptions.ReadTimeout('Response lost')
+
+        return response
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: ReconcileTests -------------------------------------------------------- #
+
+class ReconcileTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}).start()
+        self.transport = LostResponseTransport()
+        self.client = BittrexV3('k', 's', base_url=self.server.base_url(3), debug_level=0, sleep_time=0, transport=self.transport, reverse_market_names=False)
+        self.market = self.server.state.markets[0]['symbol']
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_lost_order_response_resolves_to_the_placed_order(self):
+        order = self.client.post_order(self.client.create_new_order_dict(self.market, 'BUY', 'LIMIT', 'GOOD_TIL_CANCELLED', quantity=100, limit=0.0001))
+
+        self.assertIsNotNone(order)
+        self.assertEqual(self.transport.posts, 1)
+        self.assertEqual(list(self.server.state.orders), [order['id']])
+        self.assertIsNotNone(order['clientOrderId'])
+        self.assertEqual(self.server.state.orders[order['id']]['clientOrderId'], order['clientOrderId'])
+
+    def test_lost_conditional_order_response_resolves_to_the_placed_order(self):
+        order_dict = self.client.create_new_order_dict(self.market, 'BUY', 'LIMIT', 'GOOD_TIL_CANCELLED', quantity=100, limit=0.0001)
+        conditional_order = self.client.create_conditional_order(self.market, order_dict, None, trigger_price=2, operand='GTE')
+
+        self.assertIsNotNone(conditional_order)
+        self.assertEqual(self.transport.posts, 1)
+        self.assertEqual(list(self.server.state.conditional_orders), [conditional_order['id']])
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
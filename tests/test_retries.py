@@ -0,0 +1,58 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import time, unittest
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+from bittrex_api.utils.errors import NotFoundError
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: RetryTests ---------------------------------------------------------- #
+
+class RetryTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}).start()
+        self.client = BittrexV3('k', 's', base_url=self.server.base_url(3), debug_level=0, sleep_time=0, reverse_market_names=False)
+
+        # The first failure heals the server, so the retry is answered
+        self.client.requests.add_error_listener(self.heal)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def heal(self, status_code, code):
+        self.server.error_rate = 0
+        self.server.rate_limit_rate = 0
+
+    def test_503_is_retried(self):
+        self.server.error_rate = 1
+
+        self.assertIsNotNone(self.client.get_balances())
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_429_waits_for_retry_after(self):
+        self.server.rate_limit_rate = 1
+        start = time.monotonic()
+
+        self.assertIsNotNone(self.client.get_balances())
+        self.assertEqual(self.server.request_count, 2)
+        # The mock answers 'Retry-After: 1', longer than the sleep_time of the client
+        self.assertGreaterEqual(time.monotonic() - start, 1)
+
+    def test_4xx_is_not_retried(self):
+        self.assertIsNone(self.client.get_order_by_id('missing'))
+        self.assertIsInstance(self.client.requests.last_error, NotFoundError)
+        self.assertEqual(self.server.request_count, 1)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
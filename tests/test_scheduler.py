@@ -0,0 +1,93 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import threading, time, unittest
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+from bittrex_api.utils.scheduler import PriorityScheduler, Priority
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SchedulerTests -------------------------------------------------------- #
+
+class SchedulerTests(unittest.TestCase):
+    def test_order_waiting_after_bulk_is_served_first(self):
+        # One token every 0.2 seconds, none left
+        scheduler = PriorityScheduler(calls=5, period=1, burst=1)
+        self.assertTrue(scheduler.acquire(Priority.ORDER))
+
+        served = []
+
+        def acquire(priority):
+            scheduler.acquire(priority)
+            served.append(priority)
+
+        bulk = threading.Thread(target=acquire, args=(Priority.BULK,))
+        bulk.start()
+        time.sleep(0.05)
+        order = threading.Thread(target=acquire, args=(Priority.ORDER,))
+        order.start()
+
+        bulk.join()
+        order.join()
+
+        self.assertEqual(served, [Priority.ORDER, Priority.BULK])
+
+    def test_bulk_leaves_its_reserve(self):
+        scheduler = PriorityScheduler(calls=10, period=60)
+
+        # Bulk work has to leave half of the burst to the classes above it
+        self.assertEqual(sum(scheduler.try_acquire(Priority.BULK) for _ in range(10)), 5)
+        self.assertTrue(scheduler.try_acquire(Priority.MARKET_DATA))
+        self.assertTrue(scheduler.try_acquire(Priority.ORDER))
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------- class: SchedulerClientTests ----------------------------------------------------- #
+
+class SchedulerClientTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}).start()
+        self.scheduler = PriorityScheduler(calls=10, period=1, burst=1)
+        self.client = BittrexV3('k', 's', base_url=self.server.base_url(3), debug_level=0, scheduler=self.scheduler, reverse_market_names=False)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_order_overtakes_queued_bulk_reads(self):
+        market = self.server.state.markets[0]['symbol']
+        self.scheduler.acquire(Priority.ORDER)
+
+        reads = [threading.Thread(target=self.client.get_candles, args=(market, 'DAY_1', (2020, None, None))) for _ in range(5)]
+
+        for read in reads:
+            read.start()
+
+        time.sleep(0.05)
+        order = self.client.post_order(self.client.create_new_order_dict(market, 'BUY', 'LIMIT', 'GOOD_TIL_CANCELLED', quantity=100, limit=0.0001))
+
+        for read in reads:
+            read.join()
+
+        stats = self.scheduler.stats()
+
+        self.assertIsNotNone(order)
+        self.assertEqual(stats['BULK']['served'], 5)
+        # The order took the next token (0.1 seconds), in turn it would have waited for the 5 reads queued before it
+        self.assertLess(stats['ORDER']['wait_max'], 0.2)
+        self.assertGreater(stats['BULK']['wait_max'], 0.4)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# --------------------------------------------------------------- Imports --------------------------------------------------------------- #
+
+# System
+import os, pickle, shutil, tempfile, unittest
+
+# Local
+from bittrex_api import BittrexV3
+from bittrex_api.utils.mock_server import MockBittrexServer
+from bittrex_api.utils.terminal_cache import TerminalCache
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------ class: TerminalCacheTests ------------------------------------------------------ #
+
+class TerminalCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'terminal')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def order(order_id, status='CLOSED'):
+        return {'id': order_id, 'status': status}
+
+    def test_keeps_the_latest_used_in_memory(self):
+        cache = TerminalCache(max_size=2)
+        cache.put('order', self.order('a'))
+        cache.put('order', self.order('b'))
+        cache.get('order', 'a')
+        cache.put('order', self.order('c'))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('order', 'b'))
+        self.assertEqual(cache.get('order', 'a'), self.order('a'))
+        self.assertEqual(cache.get('order', 'c'), self.order('c'))
+
+    def test_does_not_cache_non_terminal_statuses(self):
+        cache = TerminalCache()
+
+        self.assertFalse(cache.put('order', self.order('a', status='OPEN')))
+        self.assertFalse(cache.put('withdrawal', self.order('b', status='PENDING')))
+        # The address can still be corrected, the withdrawal is not final
+        self.assertFalse(cache.put('withdrawal', self.order('c', status='ERROR_INVALID_ADDRESS')))
+        self.assertFalse(cache.put('order', None))
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('order', 'a'))
+
+    def test_returns_copies(self):
+        cache = TerminalCache()
+        cache.put('order', self.order('a'))
+        cache.get('order', 'a')['status'] = 'OPEN'
+
+        self.assertEqual(cache.get('order', 'a'), self.order('a'))
+
+    def test_evicted_resources_are_read_from_disk(self):
+        cache = TerminalCache(max_size=1, path=self.path)
+        cache.put('order', self.order('a'))
+        cache.put('order', self.order('b'))
+
+        self.assertEqual(cache.get('order', 'a'), self.order('a'))
+        cache.close()
+
+        # A new process starts with an empty memory
+        reopened = TerminalCache(path=self.path)
+        self.assertEqual(reopened.get('order', 'b'), self.order('b'))
+        self.assertIsNone(reopened.get('deposit', 'b'))
+        reopened.close()
+
+    def test_works_after_pickling(self):
+        cache = TerminalCache(max_size=10)
+        cache.put('order', self.order('a'))
+        copy = pickle.loads(pickle.dumps(cache))
+
+        # The memory stays with the original, the copy caches on its own
+        self.assertIsNone(copy.get('order', 'a'))
+        self.assertTrue(copy.put('order', self.order('b')))
+        self.assertEqual(copy.get('order', 'b'), self.order('b'))
+        self.assertEqual(copy.max_size, 10)
+
+    def test_pickled_copy_reads_the_file_without_writing_it(self):
+        cache = TerminalCache(path=self.path)
+        cache.put('order', self.order('a'))
+        copy = pickle.loads(pickle.dumps(cache))
+        cache.close()
+
+        self.assertEqual(copy.get('order', 'a'), self.order('a'))
+        self.assertTrue(copy.put('order', self.order('b')))
+        self.assertEqual(copy.get('order', 'b'), self.order('b'))
+        copy.close()
+
+        self.assertIsNone(TerminalCache(path=self.path).get('order', 'b'))
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------- class: TerminalCacheClientTests --------------------------------------------------- #
+
+class TerminalCacheClientTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MockBittrexServer(api_keys={'k': 's'}).start()
+        self.client = BittrexV3('k', 's', base_url=self.server.base_url(3), debug_level=0, terminal_cache=TerminalCache(), reverse_market_names=False)
+        self.order_id = self.client.post_order(self.client.create_new_order_dict(
+            self.server.state.markets[0]['symbol'], 'BUY', 'LIMIT', 'GOOD_TIL_CANCELLED', quantity=100, limit=0.0001
+        ))['id']
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_closed_order_is_requested_once(self):
+        self.client.get_order_by_id(self.order_id)
+        count = self.server.request_count
+
+        # Open orders are always requested
+        self.client.get_order_by_id(self.order_id)
+        self.assertEqual(self.server.request_count, count + 1)
+
+        with self.server.state.lock:
+            self.server.state.orders[self.order_id]['status'] = 'CLOSED'
+
+        closed = self.client.get_order_by_id(self.order_id)
+        self.assertEqual(closed['status'], 'CLOSED')
+        self.assertEqual(self.client.get_order_by_id(self.order_id), closed)
+        self.assertEqual(self.server.request_count, count + 2)
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()